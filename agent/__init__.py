@@ -0,0 +1,10 @@
+"""Practice agent package: the main agent, its tools and subagents."""
+
+import sys
+from pathlib import Path
+
+# Project root, so modules in this package can import top-level `config`
+# and `services` no matter where the app was started from
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -0,0 +1,16 @@
+"""
+Logger for agent hooks.
+
+Records go through the shared queue in agent.logging_setup, so tool hooks
+never block on console I/O while the agent loop is waiting.
+"""
+
+import logging
+
+from agent.logging_setup import queue_handler
+
+# Level is applied by main.configure_logging (LOG_LEVEL)
+logger = logging.getLogger("agent_hooks")
+logger.addHandler(queue_handler())
+logger.setLevel(logging.INFO)
+logger.propagate = False
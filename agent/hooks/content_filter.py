@@ -6,8 +6,15 @@ This module demonstrates Agno's hook system with:
 - Post-hooks: Run after tool execution (filtering, validation)
 """
 
+import logging
+import re
+
 from agno.tools import FunctionCall
-from datetime import datetime
+
+from agent.hooks._logging import logger
+
+# Whole-word match (plurals included) so e.g. "party" or "heart" don't count as "art"
+_ART_RE = re.compile(r"\b(?:reference|drawing|art|artistic|pose)s?\b", re.IGNORECASE)
 
 
 def log_pre_hook(fc: FunctionCall) -> None:
@@ -18,9 +25,7 @@ def log_pre_hook(fc: FunctionCall) -> None:
     - Arguments passed
     - Timestamp
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] Tool called: {fc.function.name}")
-    print(f"  Arguments: {fc.arguments}")
+    logger.info("Tool called: %s\n  Arguments: %s", fc.function.name, fc.arguments)
 
 
 def log_post_hook(fc: FunctionCall) -> None:
@@ -30,15 +35,15 @@ def log_post_hook(fc: FunctionCall) -> None:
     - Tool name
     - Result summary
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
     result = fc.result
+    result_type = type(result)
 
-    if isinstance(result, list):
-        print(f"[{timestamp}] {fc.function.name} returned {len(result)} items")
-    elif isinstance(result, dict):
-        print(f"[{timestamp}] {fc.function.name} returned dict with keys: {list(result.keys())}")
+    if result_type is list:
+        logger.info("%s returned %d items", fc.function.name, len(result))
+    elif result_type is dict:
+        logger.info("%s returned dict with keys: %s", fc.function.name, result.keys())
     else:
-        print(f"[{timestamp}] {fc.function.name} completed")
+        logger.info("%s completed", fc.function.name)
 
 
 def enhance_query_hook(fc: FunctionCall) -> None:
@@ -53,12 +58,10 @@ def enhance_query_hook(fc: FunctionCall) -> None:
     if fc.function.name == "search_reference_photos" and fc.arguments:
         query = fc.arguments.get("query", "")
 
-        art_terms = ["reference", "drawing", "art", "artistic", "pose"]
-        has_art_term = any(term in query.lower() for term in art_terms)
-
-        if not has_art_term and query:
+        if query and not _ART_RE.search(query):
             fc.arguments["query"] = f"{query} reference"
-            print(f"  Query enhanced: '{query}' -> '{fc.arguments['query']}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Query enhanced: '%s' -> '%s'", query, fc.arguments["query"])
 
 
 # Future implementation placeholder
@@ -0,0 +1,54 @@
+"""
+Shared asynchronous logging for the agent.
+
+Loggers attach a QueueHandler from `queue_handler()`; records are pushed
+onto one in-memory queue and a single background QueueListener formats
+and writes them to stdout, keeping console I/O off the agent's thread.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
+LOG_DATEFMT = "%H:%M:%S"
+
+log_queue: queue.Queue = queue.Queue(-1)
+
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+
+listener = QueueListener(log_queue, _stream_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+
+# Argument types that can't change between the log call and the listener
+_IMMUTABLE_ARG_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves %-formatting to the listener thread.
+
+    Records whose args include anything mutable (dicts, lists, live views
+    such as dict.keys()) are formatted eagerly instead, so the log shows
+    the values at call time and the listener never reads an object while
+    the caller is changing it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and (
+            not isinstance(args, tuple)
+            or any(type(arg) not in _IMMUTABLE_ARG_TYPES for arg in args)
+        ):
+            return super().prepare(record)
+        return record
+
+
+def queue_handler() -> QueueHandler:
+    """Create a handler that feeds the shared background listener."""
+    return _DeferredQueueHandler(log_queue)
@@ -0,0 +1,227 @@
+"""
+Streaming Curation Pipeline.
+
+Runs Pexels search and image evaluation as asyncio stages connected by
+queues, so Pexels requests overlap with LLM evaluation instead of
+waiting for each other:
+
+    query_producer -> search_worker (xN) -> eval_worker
+
+The evaluator pulls images in micro-batches: it waits for the first image,
+then keeps collecting until the batch is full or no new image arrives
+within `batch_timeout` seconds, and evaluates the batch in one LLM call
+(image_evaluator.evaluate_images_concurrent) while it collects the next.
+
+The curator runs it on the shared background loop (services.mcp_client.run_sync).
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+from agent.subagents.image_evaluator import EVAL_BATCH_SIZE, evaluate_images_concurrent
+from agent.subagents._logging import logger
+from services.pexels_client import Photo, pexels_client
+
+
+# Queue sentinel marking the end of a stage's output
+_DONE = object()
+# Returned by _BatchReader.get when no item arrived in time
+_TIMEOUT = object()
+
+# Max photos buffered between search and evaluation
+IMAGE_QUEUE_SIZE = 32
+
+# Max micro-batches being evaluated at once
+MAX_EVAL_BATCHES = 4
+
+
+class _BatchReader:
+    """
+    Reads a queue with an optional timeout without losing items.
+
+    asyncio.wait_for(queue.get(), ...) can drop an item that arrives just
+    as the timeout cancels the get (Python < 3.12), so a timed-out get is
+    kept pending and reused by the next call instead.
+    """
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+        self._getter: asyncio.Future | None = None
+
+    async def get(self, timeout: float | None = None):
+        """Next item, or _TIMEOUT if none arrived within timeout seconds."""
+        if self._getter is None:
+            self._getter = asyncio.ensure_future(self.queue.get())
+        done, _ = await asyncio.wait({self._getter}, timeout=timeout)
+        if not done:
+            return _TIMEOUT
+        getter, self._getter = self._getter, None
+        return getter.result()
+
+    def close(self):
+        if self._getter is not None:
+            self._getter.cancel()
+            self._getter = None
+
+
+async def _query_producer(queries: Sequence[str], query_queue: asyncio.Queue, search_workers: int):
+    """Feed the search queries to the search workers."""
+    for query in queries:
+        await query_queue.put(query)
+    for _ in range(search_workers):
+        await query_queue.put(_DONE)
+
+
+async def _search_worker(query_queue: asyncio.Queue, image_queue: asyncio.Queue, per_query: int):
+    """Search Pexels for each query and stream the photos to the evaluator."""
+    while True:
+        query = await query_queue.get()
+        if query is _DONE:
+            return
+        logger.debug("[PIPELINE] Searching: '%s'", query)
+        try:
+            photos = await asyncio.to_thread(pexels_client.search_photos, query, per_query)
+        except Exception as e:
+            logger.warning("[PIPELINE] Search failed for '%s': %s", query, e)
+            continue
+        for photo in photos:
+            await image_queue.put(photo)
+
+
+async def _eval_worker(
+    theme: str,
+    image_queue: asyncio.Queue,
+    seen_ids: set[int],
+    accepted: list[Photo],
+    target: int,
+    batch_timeout: float,
+    target_met: asyncio.Event,
+):
+    """
+    Evaluate streamed photos in micro-batches until input ends.
+
+    Up to MAX_EVAL_BATCHES batches are evaluated concurrently while the
+    next one is collected; target_met is set once enough photos are accepted.
+    """
+    reader = _BatchReader(image_queue)
+    in_flight: set[asyncio.Task] = set()
+    finished = False
+
+    async def _evaluate(batch: list[Photo]):
+        results = await evaluate_images_concurrent(
+            [(photo.alt, theme) for photo in batch], batch_size=EVAL_BATCH_SIZE
+        )
+        accepted.extend(photo for photo, result in zip(batch, results) if result.get("is_good", True))
+        if len(accepted) >= target:
+            target_met.set()
+
+    try:
+        while not finished:
+            # Don't read further ahead than the evaluations can keep up with
+            if len(in_flight) >= MAX_EVAL_BATCHES:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+
+            photo = await reader.get()
+            if photo is _DONE:
+                break
+            batch = [photo]
+
+            # Fill the batch with whatever arrives before the timeout
+            while len(batch) < EVAL_BATCH_SIZE:
+                photo = await reader.get(batch_timeout)
+                if photo is _TIMEOUT:
+                    break
+                if photo is _DONE:
+                    finished = True
+                    break
+                batch.append(photo)
+
+            # Skip duplicates and recently used before spending an evaluation
+            fresh = []
+            for photo in batch:
+                if photo.id not in seen_ids:
+                    seen_ids.add(photo.id)
+                    fresh.append(photo)
+            if fresh:
+                in_flight.add(asyncio.create_task(_evaluate(fresh)))
+
+        # Input ended: let the outstanding evaluations finish
+        if in_flight:
+            await asyncio.gather(*in_flight)
+    finally:
+        reader.close()
+        for task in in_flight:
+            task.cancel()
+
+
+async def curate_pipeline(
+    theme: str,
+    queries: Sequence[str],
+    seen_ids: set[int],
+    target: int,
+    per_query: int = 5,
+    search_workers: int = 4,
+    batch_timeout: float = 0.2,
+) -> list[Photo]:
+    """
+    Search for and evaluate reference photos with overlapping stages.
+
+    Args:
+        theme: The user's practice theme (for evaluation)
+        queries: Pexels search queries
+        seen_ids: IDs to skip; updated with every photo examined
+        target: Number of accepted photos to stop at
+        per_query: Pexels results requested per query
+        search_workers: Concurrent Pexels searches
+        batch_timeout: Max seconds to wait for more images before evaluating a partial batch
+
+    Returns:
+        Accepted photos (at most `target`), in the order their evaluations finished
+    """
+    query_queue: asyncio.Queue = asyncio.Queue()
+    image_queue: asyncio.Queue = asyncio.Queue(maxsize=IMAGE_QUEUE_SIZE)
+    accepted: list[Photo] = []
+    search_workers = max(1, min(search_workers, len(queries)))
+
+    producers = [asyncio.create_task(_query_producer(queries, query_queue, search_workers))]
+    producers += [
+        asyncio.create_task(_search_worker(query_queue, image_queue, per_query))
+        for _ in range(search_workers)
+    ]
+
+    async def _close_image_queue():
+        try:
+            done, pending = await asyncio.wait(producers, return_when=asyncio.FIRST_EXCEPTION)
+            # A failed stage can leave the others waiting on it forever
+            for task in pending:
+                task.cancel()
+            for task in done:
+                if task.exception() is not None:
+                    logger.warning("[PIPELINE] Stage failed: %s", task.exception())
+        finally:
+            # Always end the evaluator's input, even if a stage failed
+            await image_queue.put(_DONE)
+
+    closer = asyncio.create_task(_close_image_queue())
+    target_met = asyncio.Event()
+    evaluator = asyncio.create_task(
+        _eval_worker(theme, image_queue, seen_ids, accepted, target, batch_timeout, target_met)
+    )
+    target_waiter = asyncio.create_task(target_met.wait())
+
+    try:
+        await asyncio.wait({evaluator, target_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        if evaluator.done():
+            # Surface evaluator errors
+            evaluator.result()
+    finally:
+        # Target reached (or failure): stop searching and evaluating
+        tasks = (*producers, closer, evaluator, target_waiter)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    logger.debug("[PIPELINE] Accepted %d photos for '%s'", len(accepted), theme)
+    return accepted[:target]
@@ -9,14 +9,12 @@ This agent helps artists with timed reference photo practice by:
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agno.agent import Agent
-from agno.models.groq import Groq
-from agno.models.openai import OpenAIChat
-from agno.models.openai.like import OpenAILike
 from agent.tools.pinterest_curator_tool import curate_pinterest_images, curate_pinterest_diverse
 from agent.tools.session_control_tool import (
     set_session_duration,
@@ -27,17 +25,17 @@ from agent.tools.session_control_tool import (
 )
 import config
 
-# Logging setup for Pinterest tracking
+# Logging setup for Pinterest tracking (written by a background listener)
 import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s - %(message)s',
-    datefmt='%H:%M:%S'
-)
+from agent.logging_setup import queue_handler
 pinterest_logger = logging.getLogger('Pinterest')
+pinterest_logger.addHandler(queue_handler())
+pinterest_logger.setLevel(logging.INFO)
+pinterest_logger.propagate = False
 
 
-AGENT_INSTRUCTIONS = """You are an art practice assistant for timed reference drawing sessions.
+# Interned so every agent built in this process shares one prompt object
+AGENT_INSTRUCTIONS = sys.intern("""You are an art practice assistant for timed reference drawing sessions.
 
 ## IMAGE SOURCE
 
@@ -119,27 +117,31 @@ If user wants to adjust BEFORE starting:
 **You**: [set_session_duration(300)]
 "Updated to 5 minutes per image. Say **start** when ready!"
 
-Be concise. Be helpful. Get them practicing quickly."""
+Be concise. Be helpful. Get them practicing quickly.""")
 
 
+@lru_cache(maxsize=1)
 def get_model():
-    """Get the configured LLM model based on config settings."""
+    """Get the configured LLM model based on config settings (built once per process)."""
     provider = config.LLM_PROVIDER.lower()
 
     if provider == "moonshot":
         print('Using Moonshot LLM Provider')
         print('Model:', config.MOONSHOT_MODEL)
+        from agno.models.openai.like import OpenAILike
         return OpenAILike(
             id=config.MOONSHOT_MODEL,
             api_key=config.MOONSHOT_API_KEY,
             base_url="https://api.moonshot.ai/v1",
         )
     elif provider == "groq":
+        from agno.models.groq import Groq
         return Groq(
             id=config.GROQ_MODEL,
             api_key=config.GROQ_API_KEY,
         )
     elif provider == "openai":
+        from agno.models.openai import OpenAIChat
         return OpenAIChat(
             id=config.OPENAI_MODEL,
             api_key=config.OPENAI_API_KEY,
@@ -155,7 +157,10 @@ def create_practice_agent() -> Agent:
         Configured Agno Agent instance
     """
     pinterest_logger.info("Creating Practice Agent with Pinterest MCP support")
-    pinterest_logger.info(f"Pinterest credentials: {'Configured' if config.PINTEREST_EMAIL else 'Not configured (will use Pexels fallback)'}")
+    pinterest_logger.info(
+        "Pinterest credentials: %s",
+        "Configured" if config.PINTEREST_EMAIL else "Not configured (will use Pexels fallback)",
+    )
 
     return Agent(
         name="ArtPracticeAssistant",
@@ -176,4 +181,10 @@ def create_practice_agent() -> Agent:
     )
 
 
-practice_agent = create_practice_agent()
+def __getattr__(name: str):
+    """Build `practice_agent` on first access instead of at import (PEP 562)."""
+    if name == "practice_agent":
+        global practice_agent
+        practice_agent = create_practice_agent()
+        return practice_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
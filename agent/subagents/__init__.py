@@ -4,13 +4,17 @@ from agent.subagents.image_curator import create_image_curator_agent, ImageCurat
 from agent.subagents.tips_generator import generate_practice_tips, TipsGenerator
 from agent.subagents.image_evaluator import (
     evaluate_image,
+    evaluate_images_batch,
+    evaluate_images_concurrent,
     is_good_reference,
+    is_good_reference_batch,
     ImageEvaluator,
 )
 from agent.subagents.query_generator import (
     generate_smart_queries,
     QueryGenerator,
 )
+from agent.subagents.session_planner import plan_session
 
 __all__ = [
     "create_image_curator_agent",
@@ -18,8 +22,12 @@ __all__ = [
     "generate_practice_tips",
     "TipsGenerator",
     "evaluate_image",
+    "evaluate_images_batch",
+    "evaluate_images_concurrent",
     "is_good_reference",
+    "is_good_reference_batch",
     "ImageEvaluator",
     "generate_smart_queries",
     "QueryGenerator",
+    "plan_session",
 ]
@@ -0,0 +1,254 @@
+"""
+Shared response cache for subagents.
+
+A bounded in-memory LRU sits in front of a SQLite table in CACHE_DIR, so
+LLM results survive restarts without process memory growing unbounded.
+Each subagent gets its own tagged view (SubagentCache) whose keys are
+hashed together with the subagent's instructions, so editing a prompt
+invalidates its old entries automatically.
+
+semantic_theme_key() lets near-duplicate themes ("vintage cars",
+"vintage automobiles") share cache entries.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import config
+from agent.subagents._logging import logger
+
+
+# Default lifetime of a cached response (seconds)
+DEFAULT_EXPIRE = 24 * 3600
+
+# Max entries kept in memory across all subagents
+MEMORY_MAX_ITEMS = 2048
+
+
+# Words that don't change which references a theme needs
+_THEME_FILLER_WORDS = frozenset({
+    "a", "an", "the", "of", "for", "some", "with",
+    "draw", "drawing", "drawings", "sketch", "sketching",
+    "reference", "references", "ref", "refs", "photo", "photos",
+    "practice", "practicing", "study", "studies",
+    "new", "fresh", "different", "more", "other",
+})
+# Irregular plurals and common synonyms folded onto one canonical token
+_THEME_SYNONYMS = {
+    "automobile": "car", "auto": "car",
+    "feline": "cat", "kitten": "cat",
+    "canine": "dog", "puppy": "dog",
+    "people": "person", "men": "man", "women": "woman",
+    "children": "child", "feet": "foot", "teeth": "tooth",
+}
+_THEME_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def semantic_theme_key(theme_lower: str) -> str:
+    """Reduce a theme to a canonical key shared by near-duplicate phrasings."""
+    tokens = set()
+    for token in _THEME_TOKEN_RE.findall(theme_lower):
+        if token in _THEME_FILLER_WORDS:
+            continue
+        # Naive singularization: "hands" -> "hand", but keep "glass"
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(_THEME_SYNONYMS.get(token, token))
+    return " ".join(sorted(tokens))
+
+
+class ResponseStore:
+    """LRU-fronted SQLite key/value store for LLM responses."""
+
+    def __init__(self, max_items: int = MEMORY_MAX_ITEMS):
+        self.max_items = max_items
+        self._memory: OrderedDict[str, tuple[str, Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            cache_dir = Path(config.CACHE_DIR)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                cache_dir / "subagent_cache.db",
+                check_same_thread=False,
+                timeout=30.0,
+            )
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    tag TEXT,
+                    value TEXT,
+                    expires REAL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_tag ON responses(tag)")
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: str, tag: str, value: Any, expires: float):
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = (tag, value, expires)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None if missing/expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[2] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+            try:
+                row = self.conn.execute(
+                    "SELECT tag, value, expires FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if not row:
+                    return None
+                if row[2] <= now:
+                    self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.conn.commit()
+                    return None
+                value = json.loads(row[1])
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning("[CACHE] Read failed: %s", e)
+                return None
+
+            self._remember(key, row[0], value, row[2])
+            return value
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Return {key: value} for the keys that are cached and not expired."""
+        now = time.time()
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+
+        with self._lock:
+            memory = self._memory
+            for key in keys:
+                entry = memory.get(key)
+                if entry is not None and entry[2] > now:
+                    memory.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    missing.append(key)
+
+            try:
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    rows = self.conn.execute(
+                        f"SELECT key, tag, value, expires FROM responses "
+                        f"WHERE key IN ({','.join('?' * len(chunk))}) AND expires > ?",
+                        (*chunk, now),
+                    ).fetchall()
+                    for key, tag, value, expires in rows:
+                        found[key] = json.loads(value)
+                        self._remember(key, tag, found[key], expires)
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning("[CACHE] Read failed: %s", e)
+
+        return found
+
+    def set(self, key: str, tag: str, value: Any, expire: float = DEFAULT_EXPIRE):
+        """Store a JSON-serializable value under key for `expire` seconds."""
+        expires = time.time() + expire
+        with self._lock:
+            self._remember(key, tag, value, expires)
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, tag, value, expires) VALUES (?, ?, ?, ?)",
+                    (key, tag, json.dumps(value), expires),
+                )
+                self.conn.commit()
+            except (sqlite3.Error, TypeError) as e:
+                logger.warning("[CACHE] Write failed: %s", e)
+
+    def set_many(self, entries: list[tuple[str, Any]], tag: str, expire: float = DEFAULT_EXPIRE):
+        """Store several (key, value) pairs with a single commit."""
+        if not entries:
+            return
+        expires = time.time() + expire
+        with self._lock:
+            for key, value in entries:
+                self._remember(key, tag, value, expires)
+            try:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO responses (key, tag, value, expires) VALUES (?, ?, ?, ?)",
+                    [(key, tag, json.dumps(value), expires) for key, value in entries],
+                )
+                self.conn.commit()
+            except (sqlite3.Error, TypeError) as e:
+                logger.warning("[CACHE] Write failed: %s", e)
+
+    def evict(self, tag: str):
+        """Drop every entry stored under tag (memory and disk)."""
+        with self._lock:
+            for key in [k for k, entry in self._memory.items() if entry[0] == tag]:
+                del self._memory[key]
+            try:
+                self.conn.execute("DELETE FROM responses WHERE tag = ?", (tag,))
+                self.conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("[CACHE] Evict failed: %s", e)
+
+
+# Global instance shared by all subagents
+response_store = ResponseStore()
+
+
+class SubagentCache:
+    """Tagged, versioned view of the shared response store for one subagent."""
+
+    def __init__(self, tag: str, version: str, expire: float = DEFAULT_EXPIRE):
+        """
+        Args:
+            tag: Namespace for this subagent's entries (used by clear())
+            version: Identifies the prompt, usually a hash of the instructions
+            expire: Lifetime of each entry in seconds
+        """
+        self.tag = tag
+        self.version = version
+        self.expire = expire
+        # Hash the version prefix once; each lookup copies this state
+        self._prefix = hashlib.blake2b(version.encode() + b"\x1f", digest_size=20)
+
+    def _hash(self, key: str) -> str:
+        digest = self._prefix.copy()
+        digest.update(key.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any:
+        return response_store.get(self._hash(key))
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Look up several keys at once; returns {key: value} for the hits."""
+        hashed = {self._hash(key): key for key in keys}
+        found = response_store.get_many(list(hashed))
+        return {hashed[digest]: value for digest, value in found.items()}
+
+    def set(self, key: str, value: Any):
+        response_store.set(self._hash(key), self.tag, value, self.expire)
+
+    def set_many(self, entries: dict[str, Any]):
+        """Store several key/value pairs with a single disk commit."""
+        response_store.set_many(
+            [(self._hash(key), value) for key, value in entries.items()], self.tag, self.expire
+        )
+
+    def clear(self):
+        response_store.evict(self.tag)
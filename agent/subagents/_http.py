@@ -0,0 +1,26 @@
+"""
+Shared HTTP connection pool for subagent LLM clients.
+
+Every subagent talks to the same provider host, so they share one
+keep-alive pool instead of each model opening its own (separate TCP/TLS
+handshakes and DNS lookups per client).
+
+The pool serves the sync path (Agent.run) only. On the async path agno
+ignores a sync http_client and caches its own SDK client on the model,
+bound to the first event loop it runs on, so async calls (e.g.
+image_evaluator.evaluate_images_concurrent) must always run on the
+long-lived background loop from services.mcp_client, never on
+short-lived loops (asyncio.run).
+"""
+
+import atexit
+
+import httpx
+
+SHARED_HTTPX_SYNC = httpx.Client(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    # LLM responses can take a while; match the provider SDKs, not httpx's 5s default
+    timeout=httpx.Timeout(60.0, connect=10.0),
+)
+
+atexit.register(SHARED_HTTPX_SYNC.close)
@@ -0,0 +1,21 @@
+"""
+Logger for the LLM subagents (evaluator, query and tips generators).
+
+Subagents with their own prefix log through child loggers (e.g.
+"tr.subagents.curator"), which share this handler and level.
+
+Routine tracing is logged at DEBUG so it is dropped before formatting at
+the default INFO level; set LOG_LEVEL=DEBUG to see it. Records go through
+the shared queue in agent.logging_setup.
+"""
+
+import logging
+
+from agent.logging_setup import queue_handler
+
+logger = logging.getLogger("tr.subagents")
+logger.addHandler(queue_handler())
+logger.propagate = False
+# Keep a level already chosen by the entry point (main.py)
+if logger.level == logging.NOTSET:
+    logger.setLevel(logging.INFO)
@@ -9,17 +9,20 @@ This improved version generates better queries for art reference images by:
 """
 
 import sys
-import json
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from agno.agent import Agent
-from agno.models.groq import Groq
-from agno.models.openai import OpenAIChat
-from agno.models.openai.like import OpenAILike
+from agent.subagents._logging import logger as _subagents_logger
+from agent.subagents._cache import SubagentCache, semantic_theme_key
 import config
+from agent.subagents._http import SHARED_HTTPX_SYNC
+from utils.json_extract import extract_json
 
+logger = _subagents_logger.getChild("enhanced_query")
 
 ENHANCED_QUERY_INSTRUCTIONS = """You generate EXPERT-LEVEL search queries for finding ART REFERENCE photos.
 
@@ -125,25 +128,32 @@ Before returning, verify:
 """
 
 
+@lru_cache(maxsize=1)
 def get_enhanced_query_model():
-    """Get LLM model for enhanced query generation."""
+    """Get LLM model for enhanced query generation (built once per process)."""
     provider = config.LLM_PROVIDER.lower()
 
     if provider == "groq":
+        from agno.models.groq import Groq
         return Groq(
             id="llama-3.1-8b-instant",
             api_key=config.GROQ_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "moonshot":
+        from agno.models.openai.like import OpenAILike
         return OpenAILike(
             id=config.MOONSHOT_MODEL,
             api_key=config.MOONSHOT_API_KEY,
             base_url="https://api.moonshot.ai/v1",
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "openai":
+        from agno.models.openai import OpenAIChat
         return OpenAIChat(
             id="gpt-4o-mini",
             api_key=config.OPENAI_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
@@ -155,24 +165,26 @@ def create_enhanced_query_agent() -> Agent:
         name="EnhancedQueryGenerator",
         model=get_enhanced_query_model(),
         instructions=ENHANCED_QUERY_INSTRUCTIONS,
-        markdown=True,
+        markdown=False,
     )
 
 
 # Singleton
-_enhanced_query_agent: Agent | None = None
+get_enhanced_query_agent = lru_cache(maxsize=1)(create_enhanced_query_agent)
 
 
-def get_enhanced_query_agent() -> Agent:
-    """Get or create the enhanced query agent singleton."""
-    global _enhanced_query_agent
-    if _enhanced_query_agent is None:
-        _enhanced_query_agent = create_enhanced_query_agent()
-    return _enhanced_query_agent
+# Fingerprint of the instructions; editing them invalidates persisted queries
+INSTRUCTIONS_HASH = hashlib.blake2b(ENHANCED_QUERY_INSTRUCTIONS.encode(), digest_size=16).hexdigest()
 
+# Art-reference queries are stable, so entries live for a long time
+ENHANCED_QUERY_CACHE_TTL = 30 * 24 * 3600  # seconds
 
-# Cache
-_enhanced_query_cache: dict[str, list[str]] = {}
+# Cache for generated queries (bounded in memory, persisted across restarts)
+_enhanced_query_cache = SubagentCache("enhanced_queries", INSTRUCTIONS_HASH, expire=ENHANCED_QUERY_CACHE_TTL)
+
+# Prefix for entries keyed by semantic_theme_key, so near-duplicate themes
+# ("hand", "hands", "draw hands") share one generation
+_SEMANTIC_PREFIX = "~"
 
 
 def generate_enhanced_queries(
@@ -193,64 +205,60 @@ def generate_enhanced_queries(
     """
     theme_lower = theme.lower().strip()
 
-    # Check cache
-    if use_cache and theme_lower in _enhanced_query_cache:
-        print(f"[Enhanced Query] Cache hit for '{theme}'")
-        return _enhanced_query_cache[theme_lower]
+    semantic_key = semantic_theme_key(theme_lower)
+
+    # Check cache (exact theme, then near-duplicate theme) in one round trip
+    if use_cache:
+        hits = _enhanced_query_cache.get_many((theme_lower, _SEMANTIC_PREFIX + semantic_key))
+        cached = hits.get(theme_lower)
+        if cached is not None:
+            logger.info("[Enhanced Query] Cache hit for '%s'", theme)
+            return cached
+
+        cached = hits.get(_SEMANTIC_PREFIX + semantic_key) if semantic_key else None
+        if cached is not None:
+            logger.info("[Enhanced Query] Similar-theme cache hit for '%s' (%s)", theme, semantic_key)
+            _enhanced_query_cache.set(theme_lower, cached)
+            return cached
 
     prompt = f'Generate art reference queries for: "{theme}"'
 
     if pinterest_optimized:
         prompt += ' (Pinterest-optimized with artistic terminology)'
 
-    print(f"[Enhanced Query] Generating for '{theme}'")
+    logger.info("[Enhanced Query] Generating for '%s'", theme)
 
     try:
         agent = get_enhanced_query_agent()
         response = agent.run(prompt)
 
-        content = response.content if response.content else ""
-
-        # Parse JSON
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        content = content.strip()
-
-        # Extract JSON array
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        if start >= 0 and end > start:
-            content = content[start:end]
-
-        queries = json.loads(content)
+        # Extract the JSON array, fenced or bare
+        queries = extract_json(response.content or "")
 
         if isinstance(queries, list) and len(queries) >= 2:
             # Validate and clean queries
-            queries = [str(q).strip()[:60] for q in queries if q][:6]
+            queries = [q[:60] for q in map(str.strip, map(str, filter(None, queries))) if q][:6]
 
-            print(f"[Enhanced Query] Generated: {queries}")
+            logger.info("[Enhanced Query] Generated: %s", queries)
 
-            # Cache
-            _enhanced_query_cache[theme_lower] = queries
+            # Cache under the exact and the semantic theme key
+            entries = {theme_lower: queries}
+            if semantic_key:
+                entries[_SEMANTIC_PREFIX + semantic_key] = queries
+            _enhanced_query_cache.set_many(entries)
             return queries
 
     except Exception as e:
-        print(f"[Enhanced Query] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[Enhanced Query] Error: %s", e)
 
     # Fallback
-    print(f"[Enhanced Query] Fallback to theme")
+    logger.info("[Enhanced Query] Fallback to theme")
     return [f"{theme} reference"]
 
 
 def clear_enhanced_query_cache():
-    """Clear the query cache."""
-    global _enhanced_query_cache
-    _enhanced_query_cache = {}
+    """Clear the query cache (in-memory and persistent)."""
+    _enhanced_query_cache.clear()
 
 
 # Comparison helper for education
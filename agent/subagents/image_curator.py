@@ -7,20 +7,77 @@ Specializes in intelligent image curation for art reference practice.
 - Caches results in PostgreSQL for reuse
 """
 
+import atexit
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
 
 from agno.agent import Agent
 from agno.tools import tool
-from agno.models.groq import Groq
-from agno.models.openai import OpenAIChat
-from agno.models.openai.like import OpenAILike
 
+from agent.subagents._logging import logger as _subagents_logger
 from services.pexels_client import pexels_client
 from services.memory_store import memory_store
 import config
+from agent.subagents._http import SHARED_HTTPX_SYNC
+
+logger = _subagents_logger.getChild("curator")
+
+# Circuit breaker: after a DB failure, skip DB calls until this monotonic time
+DB_RETRY_SECONDS = 30.0
+_db_down_until: float = 0.0
+
+
+def _trip_db_breaker():
+    """Mark the DB as down so calls in the next DB_RETRY_SECONDS are skipped."""
+    global _db_down_until
+    _db_down_until = time.monotonic() + DB_RETRY_SECONDS
+
+
+# Background writer so curate_and_save doesn't wait on the DB
+# (one thread: saves share memory_store's sqlite connection and must not interleave)
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="curator-save")
+atexit.register(_SAVE_POOL.shutdown, wait=True)
+
+
+def _safe_save(theme: str, queries: list[str], images: list[dict]):
+    """Save curated results to memory, ignoring errors (DB might be offline)."""
+    try:
+        memory_store.save_theme_results(theme, queries, images)
+        logger.info("[CURATOR] Saved to memory")
+    except Exception as e:
+        logger.info("[CURATOR] Could not save to memory (DB offline?): %s", e)
+        _trip_db_breaker()
+
+
+class CuratedPhoto(NamedTuple):
+    """Compact record for a photo while curate_and_save is collecting."""
+    pexels_id: int
+    url: str
+    thumbnail: str
+    alt: str
+    photographer: str
+
+
+# Alt-text keywords that mark an image as a poor drawing reference
+_BAD_KEYWORDS = tuple(
+    sys.intern(w) for w in ("logo", "icon", "text", "screenshot", "graph", "chart", "diagram")
+)
+
+# Optional: pyahocorasick scans alt text for all bad keywords in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_BAD_AC = None
+if ahocorasick is not None:
+    _BAD_AC = ahocorasick.Automaton()
+    for _kw in _BAD_KEYWORDS:
+        _BAD_AC.add_word(_kw, _kw)
+    _BAD_AC.make_automaton()
 
 
 CURATOR_INSTRUCTIONS = """You curate images for QUICK SKETCH practice (30 sec to 2 min drawings).
@@ -57,22 +114,27 @@ def check_theme_cache(theme: str) -> dict:
     Returns:
         Dict with 'found' boolean. If found=True, also includes 'queries' and 'images'.
     """
-    print(f"[CURATOR] Checking cache for theme: {theme}")
+    logger.info("[CURATOR] Checking cache for theme: %s", theme)
+
+    if time.monotonic() < _db_down_until:
+        logger.info("[CURATOR] Skipping cache check (DB recently offline)")
+        return {"found": False, "circuit": "open"}
 
     try:
         cached = memory_store.get_cached_theme(theme)
         if cached:
-            print(f"[CURATOR] Cache HIT! Found {len(cached['images'])} images")
+            logger.info("[CURATOR] Cache HIT! Found %d images", len(cached["images"]))
             return {
                 "found": True,
                 "queries": cached["queries"],
                 "images": cached["images"]
             }
         else:
-            print(f"[CURATOR] Cache MISS for theme: {theme}")
+            logger.info("[CURATOR] Cache MISS for theme: %s", theme)
             return {"found": False}
     except Exception as e:
-        print(f"[CURATOR] Cache check failed (DB may be offline): {e}")
+        logger.info("[CURATOR] Cache check failed (DB may be offline): %s", e)
+        _trip_db_breaker()
         return {"found": False, "error": str(e)}
 
 
@@ -89,105 +151,114 @@ def curate_and_save(theme: str, queries: list[str]) -> list[dict]:
     Returns:
         List of curated images (10-15 images)
     """
-    print(f"[CURATOR] Curating '{theme}' with queries: {queries}")
+    logger.info("[CURATOR] Curating '%s' with queries: %s", theme, queries)
 
-    all_images = []
+    all_images: list[CuratedPhoto] = []
+    seen_ids: set[int] = set()
+    search_queries = queries[:4]
 
-    for query in queries[:4]:
-        print(f"[CURATOR] Searching: '{query}'")
-        try:
-            photos = pexels_client.search_photos(query=query, per_page=5)
+    # Run the searches concurrently - each one is a network round-trip
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda q: _safe_search(q, 5), search_queries))
 
-            for photo in photos:
-                if _is_good_reference(photo.alt, theme):
-                    all_images.append({
-                        "pexels_id": photo.id,
-                        "url": photo.src_large,
-                        "thumbnail": photo.src_medium,
-                        "alt": photo.alt,
-                        "photographer": photo.photographer,
-                    })
-                if len(all_images) >= 15:
-                    break
+    # Keep the raw results so the refill pass below doesn't repeat the searches
+    raw_by_query: dict[str, list] = dict(zip(search_queries, results))
 
-            print(f"[CURATOR] Total: {len(all_images)} images")
+    for query, photos in raw_by_query.items():
+        for photo in photos:
+            if photo.id not in seen_ids and _is_good_reference(photo.alt, theme):
+                seen_ids.add(photo.id)
+                all_images.append(_image_record(photo))
+            if len(all_images) >= 15:
+                break
 
-        except Exception as e:
-            print(f"[CURATOR] Search failed for '{query}': {e}")
-            continue
+        logger.info("[CURATOR] Total after '%s': %d images", query, len(all_images))
 
         if len(all_images) >= 15:
             break
 
-    # Ensure minimum images
+    # Ensure minimum images - accept filtered-out photos from the same results
     if len(all_images) < 10:
-        print(f"[CURATOR] Only {len(all_images)}, fetching more...")
-        for query in queries[:4]:
-            try:
-                photos = pexels_client.search_photos(query=query, per_page=5)
-                for photo in photos:
-                    if not any(img["pexels_id"] == photo.id for img in all_images):
-                        all_images.append({
-                            "pexels_id": photo.id,
-                            "url": photo.src_large,
-                            "thumbnail": photo.src_medium,
-                            "alt": photo.alt,
-                            "photographer": photo.photographer,
-                        })
-                    if len(all_images) >= 12:
-                        break
-            except:
-                continue
+        logger.info("[CURATOR] Only %d, relaxing filter...", len(all_images))
+        for photos in raw_by_query.values():
+            for photo in photos:
+                if photo.id not in seen_ids:
+                    seen_ids.add(photo.id)
+                    all_images.append(_image_record(photo))
+                if len(all_images) >= 12:
+                    break
             if len(all_images) >= 12:
                 break
 
-    final_images = all_images[:15]
-    print(f"[CURATOR] Final: {len(final_images)} images")
+    # Tools and the memory store work with plain dicts
+    final_images = [img._asdict() for img in all_images[:15]]
+    logger.info("[CURATOR] Final: %d images", len(final_images))
 
-    # Auto-save to memory (ignore errors - DB might be offline)
-    try:
-        memory_store.save_theme_results(theme, queries[:4], final_images)
-        print(f"[CURATOR] Saved to memory")
-    except Exception as e:
-        print(f"[CURATOR] Could not save to memory (DB offline?): {e}")
+    # Auto-save to memory in the background (ignore errors - DB might be offline)
+    if time.monotonic() < _db_down_until:
+        logger.info("[CURATOR] Skipping save (DB recently offline)")
+    else:
+        _SAVE_POOL.submit(_safe_save, theme, queries[:4], final_images)
 
     return final_images
 
 
+def _image_record(photo) -> CuratedPhoto:
+    """Build the curated record for a Pexels photo."""
+    return CuratedPhoto(photo.id, photo.src_large, photo.src_medium, photo.alt, photo.photographer)
+
+
+def _safe_search(query: str, per_page: int) -> list:
+    """Search Pexels, returning an empty list if the request fails."""
+    logger.info("[CURATOR] Searching: '%s'", query)
+    try:
+        return pexels_client.search_photos(query=query, per_page=per_page)
+    except Exception as e:
+        logger.info("[CURATOR] Search failed for '%s': %s", query, e)
+        return []
+
+
 def _is_good_reference(alt_text: str, theme: str) -> bool:
     """Simple keyword-based filter. No LLM needed."""
     if not alt_text:
         return True
 
-    alt_lower = alt_text.lower()
+    # One lowercase copy shared by every keyword check (none if already lower)
+    alt_lower = alt_text if alt_text.islower() else alt_text.lower()
 
-    # Reject obvious bad matches
-    bad_keywords = ["logo", "icon", "text", "screenshot", "graph", "chart", "diagram"]
-    if any(bad in alt_lower for bad in bad_keywords):
-        return False
+    # Reject obvious bad matches - single pass, stop at the first hit
+    if _BAD_AC is not None:
+        return next(_BAD_AC.iter(alt_lower), None) is None
 
-    return True
+    return not any(bad in alt_lower for bad in _BAD_KEYWORDS)
 
 
+@lru_cache(maxsize=1)
 def get_curator_model():
-    """Get the configured LLM model for the curator agent."""
+    """Get the configured LLM model for the curator agent (built once per process)."""
     provider = config.LLM_PROVIDER.lower()
 
     if provider == "moonshot":
+        from agno.models.openai.like import OpenAILike
         return OpenAILike(
             id=config.MOONSHOT_MODEL,
             api_key=config.MOONSHOT_API_KEY,
             base_url="https://api.moonshot.ai/v1",
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "groq":
+        from agno.models.groq import Groq
         return Groq(
             id=config.GROQ_MODEL,
             api_key=config.GROQ_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "openai":
+        from agno.models.openai import OpenAIChat
         return OpenAIChat(
             id=config.OPENAI_MODEL,
             api_key=config.OPENAI_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
@@ -195,7 +266,7 @@ def get_curator_model():
 
 def create_image_curator_agent() -> Agent:
     """Create and return the image curator subagent."""
-    print("[CURATOR] Creating ImageCuratorAgent")
+    logger.info("[CURATOR] Creating ImageCuratorAgent")
 
     agent = Agent(
         name="ImageCurator",
@@ -5,16 +5,22 @@ Evaluates whether an image is good for art reference practice
 by analyzing its description and considering user history.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import re
+import asyncio
+import hashlib
+from collections import Counter
+from functools import lru_cache
 
 from agno.agent import Agent
 from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
 from agno.models.openai.like import OpenAILike
 import config
+from agent.subagents._http import SHARED_HTTPX_SYNC
+from agent.subagents._logging import logger
+from utils.json_extract import extract_json
+from agent.subagents._cache import SubagentCache, semantic_theme_key
+from services.mcp_client import get_event_loop
 
 
 EVALUATOR_INSTRUCTIONS = """You evaluate if images are suitable for ART REFERENCE PRACTICE.
@@ -60,134 +66,558 @@ Return ONLY the JSON, no other text.
 """
 
 
-def get_evaluator_model():
-    """Get a fast model for image evaluation."""
+# Two-tier routing: every image goes to the cheap model first and only
+# low-confidence verdicts are re-run on the strong one, which is the
+# baseline model. Providers without a model cheaper than the baseline
+# (groq's smallest is llama-3.1-8b-instant; moonshot) use the same model
+# for both, which disables escalation.
+CHEAP_EVALUATOR_MODELS = {
+    "groq": "llama-3.1-8b-instant",
+    "openai": "gpt-4.1-nano",
+}
+STRONG_EVALUATOR_MODELS = {
+    "groq": "llama-3.1-8b-instant",
+    "openai": "gpt-4o-mini",
+}
+
+# Cheap-model verdicts below this confidence are escalated
+ESCALATION_CONFIDENCE = 0.6
+
+
+def _build_evaluator_model(model_ids: dict[str, str]):
+    """Build the evaluator model for the configured provider."""
     provider = config.LLM_PROVIDER.lower()
 
     if provider == "groq":
         return Groq(
-            id="llama-3.1-8b-instant",  # Fast model
+            id=model_ids["groq"],
             api_key=config.GROQ_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "moonshot":
         return OpenAILike(
             id=config.MOONSHOT_MODEL,
             api_key=config.MOONSHOT_API_KEY,
             base_url="https://api.moonshot.ai/v1",
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "openai":
         return OpenAIChat(
-            id="gpt-4o-mini",  # Cheaper/faster model
+            id=model_ids["openai"],
             api_key=config.OPENAI_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
+            # Route every evaluation to the same cached instructions prefix
+            extra_body={"prompt_cache_key": "image-evaluator"},
         )
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
 
 
-def create_evaluator_agent() -> Agent:
-    """Create the image evaluator subagent."""
+def get_cheap_evaluator_model():
+    """Get the cheap/fast model that handles most evaluations."""
+    return _build_evaluator_model(CHEAP_EVALUATOR_MODELS)
+
+
+def get_strong_evaluator_model():
+    """Get the stronger model used for low-confidence verdicts."""
+    return _build_evaluator_model(STRONG_EVALUATOR_MODELS)
+
+
+# Default evaluator model
+get_evaluator_model = get_cheap_evaluator_model
+
+
+def create_evaluator_agent(model=None) -> Agent:
+    """Create the image evaluator subagent (cheap model unless one is given)."""
     return Agent(
         name="ImageEvaluator",
-        model=get_evaluator_model(),
+        model=model or get_cheap_evaluator_model(),
         instructions=EVALUATOR_INSTRUCTIONS,
-        markdown=True,
+        markdown=False,
     )
 
 
-# Singleton instance
-_evaluator_agent: Agent | None = None
-
-
+# Singleton instances (get_*_agent.cache_clear() rebuilds them)
+@lru_cache(maxsize=1)
 def get_evaluator_agent() -> Agent:
     """Get or create the evaluator agent singleton."""
-    global _evaluator_agent
-    if _evaluator_agent is None:
-        _evaluator_agent = create_evaluator_agent()
-    return _evaluator_agent
+    return create_evaluator_agent()
+
+
+@lru_cache(maxsize=1)
+def get_strong_evaluator_agent() -> Agent | None:
+    """Get the escalation agent, or None if the provider has no stronger tier."""
+    provider = config.LLM_PROVIDER.lower()
+    if CHEAP_EVALUATOR_MODELS.get(provider) == STRONG_EVALUATOR_MODELS.get(provider):
+        return None
+    return create_evaluator_agent(get_strong_evaluator_model())
+
+
+# Per-theme routing stats, used to tune ESCALATION_CONFIDENCE
+_evaluated_by_theme: Counter[str] = Counter()
+_escalated_by_theme: Counter[str] = Counter()
 
 
+def get_escalation_rates() -> dict[str, float]:
+    """Fraction of LLM-evaluated images per theme that needed the strong model."""
+    return {
+        theme: _escalated_by_theme[theme] / count
+        for theme, count in _evaluated_by_theme.items()
+        if count
+    }
+
+
+# Fingerprint of the instructions, computed once; editing them invalidates cached verdicts
+INSTRUCTIONS_HASH = hashlib.blake2b(EVALUATOR_INSTRUCTIONS.encode(), digest_size=16).hexdigest()
+
 # Cache for evaluation results (to avoid re-evaluating same images)
-_evaluation_cache: dict[str, dict] = {}
+_evaluation_cache = SubagentCache("evaluation", INSTRUCTIONS_HASH)
+
+# Max images packed into one LLM evaluation request
+EVAL_BATCH_SIZE = 10
+
+# Max in-flight LLM requests on the async (concurrent) evaluation path
+EVAL_CONCURRENCY = 8
+
+# Alt text beyond this is mostly SEO filler; cut it before it reaches the prompt
+MAX_ALT_TEXT_CHARS = 240
+
+# Alt text shorter than this carries no usable description; such images are rejected
+MIN_ALT_TEXT_CHARS = 4
+
+BAD_KEYWORDS = ["logo", "icon", "screenshot", "graph", "chart", "diagram", "banner", "advertisement", "watermark"]
+
+# One pass over the alt text instead of a substring scan per keyword;
+# the group names the matched keyword for the rejection reason.
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile lowercase keywords into one word-bounded regex capturing the match."""
+    return re.compile(r"\b(" + "|".join(map(re.escape, sorted(keywords))) + r")s?\b")
+
+
+_BAD_RE = _keyword_pattern(BAD_KEYWORDS)
+
+# Alt-text words that clearly show the subject of a theme, keyed by the
+# canonical theme token (see semantic_theme_key). A match accepts the image
+# without an LLM call.
+THEME_GOOD_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "hand": ("hand", "palm", "finger", "grip", "fist", "gesture"),
+    "foot": ("foot", "feet", "toe", "barefoot", "ankle"),
+    "portrait": ("portrait", "face", "headshot", "closeup"),
+    "face": ("face", "portrait", "expression", "closeup"),
+    "expression": ("expression", "smiling", "laughing", "crying", "shouting", "face"),
+    "pose": ("pose", "posing", "dancer", "dancing", "jumping", "stretching", "athlete"),
+    "gesture": ("dancer", "dancing", "jumping", "running", "stretching", "athlete"),
+    "dynamic": ("dancer", "dancing", "jumping", "running", "kick", "leap", "athlete"),
+    "figure": ("model", "posing", "dancer", "full body", "standing", "sitting"),
+    "animal": ("dog", "cat", "horse", "bird", "animal", "wildlife"),
+    "cat": ("cat", "kitten"),
+    "dog": ("dog", "puppy"),
+    "horse": ("horse", "pony", "stallion"),
+    "bird": ("bird", "eagle", "owl", "parrot"),
+    "car": ("car", "automobile", "vehicle"),
+    "tree": ("tree", "forest", "oak", "pine"),
+}
 
+# theme_lower -> compiled allowlist (None when the theme has no keywords)
+_GOOD_RE_BY_THEME: dict[str, re.Pattern | None] = {}
+# theme_lower -> extra blocklist regex registered by set_theme_filters()
+_BAD_RE_BY_THEME: dict[str, re.Pattern] = {}
 
-def evaluate_image(alt_text: str, theme: str, use_cache: bool = True) -> dict:
+
+def _lenient_result(reason: str) -> dict:
+    """Result used when an image can't be judged - be lenient and allow it."""
+    return {
+        "is_good": True,
+        "reason": reason,
+        "confidence": 0.5,
+    }
+
+
+def _keyword_reject(alt_norm: str, theme_norm: str = "") -> dict | None:
+    """Quick keyword filter on lowercased alt text (saves API calls). Returns a rejection or None."""
+    match = _BAD_RE.search(alt_norm)
+    if not match and theme_norm in _BAD_RE_BY_THEME:
+        match = _BAD_RE_BY_THEME[theme_norm].search(alt_norm)
+    if match:
+        return {
+            "is_good": False,
+            "reason": f"Contains '{match.group(1)}' - not suitable for reference practice",
+            "confidence": 0.95,
+        }
+    return None
+
+
+def _normalize_result(result: dict) -> dict:
+    """Ensure required fields on an evaluation result."""
+    result.setdefault("is_good", True)
+    result.setdefault("reason", "Evaluated by AI")
+    result.setdefault("confidence", 0.7)
+    return result
+
+
+def _build_evaluation_prompt(pairs: list[tuple[str, str]]) -> str:
+    """Build the evaluation prompt for one or more (alt_text, theme) pairs."""
+    # Static text first, variable theme/alt text last, so providers with
+    # prefix caching can reuse everything up to the image details.
+    if len(pairs) == 1:
+        alt_text, theme = pairs[0]
+        alt_text = alt_text[:MAX_ALT_TEXT_CHARS]
+        return (
+            "Is this image good for art reference practice? Return JSON only.\n\n"
+            f'Theme: "{theme}"\n'
+            f'Alt text: "{alt_text}"'
+        )
+
+    lines = [
+        f'{idx}) Theme: "{theme}" | Alt text: "{alt_text[:MAX_ALT_TEXT_CHARS]}"'
+        for idx, (alt_text, theme) in enumerate(pairs, 1)
+    ]
+    return (
+        "Evaluate each image below for art reference practice.\n"
+        "Return ONLY a JSON array with one object per image, in order:\n"
+        '[{"idx": 1, "is_good": true/false, "reason": "...", "confidence": 0.0-1.0}, ...]\n\n'
+        + "\n".join(lines)
+    )
+
+
+def _builtin_good_keywords(theme_lower: str) -> set[str]:
+    """Allowlist keywords from THEME_GOOD_KEYWORDS for a theme's tokens."""
+    return {
+        keyword
+        for token in semantic_theme_key(theme_lower).split()
+        for keyword in THEME_GOOD_KEYWORDS.get(token, ())
+    }
+
+
+def _good_pattern(theme_lower: str) -> re.Pattern | None:
+    """Build (once per theme) the allowlist regex for a theme."""
+    if theme_lower not in _GOOD_RE_BY_THEME:
+        keywords = _builtin_good_keywords(theme_lower)
+        _GOOD_RE_BY_THEME[theme_lower] = _keyword_pattern(keywords) if keywords else None
+    return _GOOD_RE_BY_THEME[theme_lower]
+
+
+def set_theme_filters(theme: str, good_keywords: list[str], bad_keywords: list[str]):
     """
-    Evaluate if an image is good for art reference practice.
+    Register theme-specific keywords for the local pre-filter.
 
-    Args:
-        alt_text: Image description/alt text
-        theme: What the user is practicing (e.g., "hands", "dynamic poses")
-        use_cache: Whether to use cached results
+    Alt text matching a good keyword is accepted and one matching a bad
+    keyword is rejected, both without an LLM call. Good keywords extend the
+    built-in THEME_GOOD_KEYWORDS for the theme.
 
-    Returns:
-        Dict with is_good (bool), reason (str), confidence (float)
+    Args:
+        theme: Practice theme the keywords apply to
+        good_keywords: Words that show the theme's subject
+        bad_keywords: Words that mark unusable images for this theme
     """
-    import json
+    theme_lower = theme.strip().lower()
+    good = _builtin_good_keywords(theme_lower) | {k.strip().lower() for k in good_keywords if k.strip()}
+    bad = {k.strip().lower() for k in bad_keywords if k.strip()}
+
+    _GOOD_RE_BY_THEME[theme_lower] = _keyword_pattern(good) if good else None
+    if bad:
+        _BAD_RE_BY_THEME[theme_lower] = _keyword_pattern(bad)
+    else:
+        _BAD_RE_BY_THEME.pop(theme_lower, None)
+
 
-    # Handle empty alt text - be lenient
-    if not alt_text or not alt_text.strip():
+def _keyword_accept(alt_norm: str, theme_norm: str) -> dict | None:
+    """Quick allowlist for the theme on lowercased alt text (saves API calls). Returns an acceptance or None."""
+    pattern = _good_pattern(theme_norm)
+    match = pattern.search(alt_norm) if pattern else None
+    if match:
         return {
             "is_good": True,
-            "reason": "No description available, allowing by default",
-            "confidence": 0.5,
+            "reason": f"Shows '{match.group(1)}' - matches the practice theme",
+            "confidence": 0.85,
         }
+    return None
 
-    # Check cache
-    cache_key = f"{theme.lower()}:{alt_text[:100]}"
-    if use_cache and cache_key in _evaluation_cache:
-        return _evaluation_cache[cache_key]
 
-    # Quick keyword filter first (saves API calls)
-    alt_lower = alt_text.lower()
-    bad_keywords = ["logo", "icon", "screenshot", "graph", "chart", "diagram", "banner", "advertisement"]
+def _parse_evaluation_response(content: str, count: int) -> list[dict | None]:
+    """Map an agent response back to one result per evaluated pair."""
+    parsed = extract_json(content)
 
-    for bad in bad_keywords:
-        if bad in alt_lower:
-            result = {
-                "is_good": False,
-                "reason": f"Contains '{bad}' - not suitable for reference practice",
-                "confidence": 0.95,
-            }
-            _evaluation_cache[cache_key] = result
-            return result
+    if count == 1:
+        return [_normalize_result(parsed)]
 
-    # Use subagent for uncertain cases
-    prompt = f"""Theme: "{theme}"
-Alt text: "{alt_text}"
+    results: list[dict | None] = [None] * count
+    for position, item in enumerate(parsed):
+        if not isinstance(item, dict):
+            continue
+        idx = item.pop("idx", position + 1)
+        if isinstance(idx, int) and 1 <= idx <= count:
+            results[idx - 1] = _normalize_result(item)
+    return results
 
-Is this image good for art reference practice? Return JSON only."""
 
+def _needs_escalation(verdict: dict | None) -> bool:
+    """True if a cheap-model verdict is too unsure to keep."""
+    if verdict is None:
+        return False
     try:
-        agent = get_evaluator_agent()
-        response = agent.run(prompt)
+        return float(verdict.get("confidence", 1.0)) < ESCALATION_CONFIDENCE
+    except (TypeError, ValueError):
+        return True
 
-        content = response.content if response.content else ""
 
-        # Parse JSON from response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+def _escalation_indices(pairs: list[tuple[str, str]], verdicts: list[dict | None]) -> list[int]:
+    """Record routing stats and return the pairs to re-run on the strong model."""
+    escalate = [i for i, verdict in enumerate(verdicts) if _needs_escalation(verdict)]
+    _evaluated_by_theme.update(theme for _, theme in pairs)
+    _escalated_by_theme.update(pairs[i][1] for i in escalate)
+    return escalate
 
-        content = content.strip()
-        result = json.loads(content)
 
-        # Ensure required fields
-        result.setdefault("is_good", True)
-        result.setdefault("reason", "Evaluated by AI")
-        result.setdefault("confidence", 0.7)
+def _merge_escalated(
+    verdicts: list[dict | None],
+    escalate: list[int],
+    strong_verdicts: list[dict | None],
+) -> list[dict | None]:
+    """Replace escalated verdicts with the strong model's, where it answered."""
+    for i, verdict in zip(escalate, strong_verdicts):
+        if verdict is not None:
+            verdicts[i] = verdict
+    return verdicts
 
-        _evaluation_cache[cache_key] = result
-        return result
+
+def _evaluate_with(agent: Agent, pairs: list[tuple[str, str]]) -> list[dict | None]:
+    """Evaluate pairs with one LLM call on the given agent."""
+    try:
+        response = agent.run(_build_evaluation_prompt(pairs))
+        return _parse_evaluation_response(response.content or "", len(pairs))
 
     except Exception as e:
-        print(f"[EVALUATOR] Error: {e}")
-        # Be lenient on errors
-        return {
-            "is_good": True,
-            "reason": "Evaluation failed, allowing by default",
-            "confidence": 0.5,
-        }
+        logger.warning("[EVALUATOR] Error: %s", e)
+        return [None] * len(pairs)
+
+
+async def _evaluate_with_async(agent: Agent, pairs: list[tuple[str, str]]) -> list[dict | None]:
+    """Async counterpart of _evaluate_with (does not block the event loop)."""
+    try:
+        response = await agent.arun(_build_evaluation_prompt(pairs))
+        return _parse_evaluation_response(response.content or "", len(pairs))
+
+    except Exception as e:
+        logger.warning("[EVALUATOR] Error: %s", e)
+        return [None] * len(pairs)
+
+
+def _run_evaluation_batch(pairs: list[tuple[str, str]]) -> list[dict | None]:
+    """
+    Evaluate (alt_text, theme) pairs with a single cheap-model call,
+    escalating low-confidence verdicts to the strong model.
+
+    Returns one result per pair, or None where evaluation failed.
+    """
+    verdicts = _evaluate_with(get_evaluator_agent(), pairs)
+
+    escalate = _escalation_indices(pairs, verdicts)
+    strong_agent = get_strong_evaluator_agent() if escalate else None
+    if strong_agent is not None:
+        strong_verdicts = _evaluate_with(strong_agent, [pairs[i] for i in escalate])
+        verdicts = _merge_escalated(verdicts, escalate, strong_verdicts)
+
+    return verdicts
+
+
+async def _run_evaluation_batch_async(pairs: list[tuple[str, str]]) -> list[dict | None]:
+    """Async counterpart of _run_evaluation_batch."""
+    verdicts = await _evaluate_with_async(get_evaluator_agent(), pairs)
+
+    escalate = _escalation_indices(pairs, verdicts)
+    strong_agent = get_strong_evaluator_agent() if escalate else None
+    if strong_agent is not None:
+        strong_verdicts = await _evaluate_with_async(strong_agent, [pairs[i] for i in escalate])
+        verdicts = _merge_escalated(verdicts, escalate, strong_verdicts)
+
+    return verdicts
+
+
+def _prefilter(
+    items: list[tuple[str, str]],
+    use_cache: bool,
+) -> tuple[list[dict | None], dict[str, list[int]]]:
+    """
+    Resolve items that don't need the LLM (missing alt text, cache hits,
+    keyword rejects and theme allowlist matches).
+
+    Returns:
+        (results with None for unresolved items, cache_key -> indices still pending)
+    """
+    results: list[dict | None] = [None] * len(items)
+    pending: dict[str, list[int]] = {}
+    # theme -> (normalized theme, cache key prefix); batches share one theme
+    theme_keys: dict[str, tuple[str, str]] = {}
+    # (index, alt_norm, theme_norm, cache_key) for items that need a verdict
+    keyed: list[tuple[int, str, str, str]] = []
+
+    for i, (alt_text, theme) in enumerate(items):
+        # Case-fold once; reused for the cache key and both keyword scans
+        alt_norm = alt_text.strip().lower()[:MAX_ALT_TEXT_CHARS] if alt_text else ""
+
+        # Missing or too-short alt text - nothing to judge the image by
+        if len(alt_norm) < MIN_ALT_TEXT_CHARS:
+            results[i] = {
+                "is_good": False,
+                "reason": "No usable description - can't tell what the image shows",
+                "confidence": 0.9,
+            }
+            continue
+
+        if theme not in theme_keys:
+            theme_norm = theme.strip().lower()
+            # Near-duplicate themes ("hands", "hand drawing") share verdicts
+            theme_keys[theme] = (theme_norm, (semantic_theme_key(theme_norm) or theme_norm) + "\x1f")
+        theme_norm, key_prefix = theme_keys[theme]
+
+        # Unit separator can't appear in either part, so keys can't collide
+        keyed.append((i, alt_norm, theme_norm, key_prefix + alt_norm[:100]))
+
+    # One cache round trip for the whole batch
+    hits = _evaluation_cache.get_many({key for *_, key in keyed}) if use_cache and keyed else {}
+
+    for i, alt_norm, theme_norm, cache_key in keyed:
+        cached = hits.get(cache_key)
+        if cached is not None:
+            results[i] = cached
+            continue
+
+        rejected = _keyword_reject(alt_norm, theme_norm)
+        if rejected:
+            results[i] = rejected
+            continue
+
+        accepted = _keyword_accept(alt_norm, theme_norm)
+        if accepted:
+            results[i] = accepted
+            continue
+
+        pending.setdefault(cache_key, []).append(i)
+
+    return results, pending
+
+
+def _apply_verdicts(
+    results: list[dict | None],
+    pending: dict[str, list[int]],
+    keys: list[str],
+    verdicts: list[dict | None],
+) -> None:
+    """Store LLM verdicts in the cache and fan them out to every matching item."""
+    fresh: dict[str, dict] = {}
+    for key, verdict in zip(keys, verdicts):
+        if verdict is None:
+            verdict = _lenient_result("Evaluation failed, allowing by default")
+        else:
+            fresh[key] = verdict
+        for i in pending[key]:
+            results[i] = verdict
+    _evaluation_cache.set_many(fresh)
+
+
+def evaluate_images_batch(
+    items: list[tuple[str, str]],
+    use_cache: bool = True,
+) -> list[dict]:
+    """
+    Evaluate many images, packing uncached ones into as few LLM calls as possible.
+
+    Args:
+        items: List of (alt_text, theme) pairs
+        use_cache: Whether to use cached results
+
+    Returns:
+        One dict per item (in the same order) with is_good, reason, confidence
+    """
+    results, pending = _prefilter(items, use_cache)
+
+    # Use subagent for uncertain cases, EVAL_BATCH_SIZE images per call
+    keys = list(pending)
+    for start in range(0, len(keys), EVAL_BATCH_SIZE):
+        chunk = keys[start:start + EVAL_BATCH_SIZE]
+        verdicts = _run_evaluation_batch([items[pending[key][0]] for key in chunk])
+        _apply_verdicts(results, pending, chunk, verdicts)
+
+    return results
+
+
+# Bounds in-flight requests across all concurrent evaluations (background loop only)
+_eval_semaphore: asyncio.Semaphore | None = None
+
+
+async def _evaluate_concurrent(
+    items: list[tuple[str, str]],
+    use_cache: bool,
+    batch_size: int,
+) -> list[dict]:
+    """Body of evaluate_images_concurrent; runs on the background loop."""
+    global _eval_semaphore
+    if _eval_semaphore is None:
+        _eval_semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+    semaphore = _eval_semaphore
+
+    # Cache reads/writes hit SQLite; keep them off the event loop
+    results, pending = await asyncio.to_thread(_prefilter, items, use_cache)
+
+    async def _evaluate_chunk(chunk: list[str]):
+        async with semaphore:
+            verdicts = await _run_evaluation_batch_async([items[pending[key][0]] for key in chunk])
+        await asyncio.to_thread(_apply_verdicts, results, pending, chunk, verdicts)
+
+    keys = list(pending)
+    await asyncio.gather(*(
+        _evaluate_chunk(keys[start:start + batch_size])
+        for start in range(0, len(keys), batch_size)
+    ))
+    return results
+
+
+async def evaluate_images_concurrent(
+    items: list[tuple[str, str]],
+    use_cache: bool = True,
+    batch_size: int = 1,
+) -> list[dict]:
+    """
+    Evaluate many images with concurrent LLM requests.
+
+    Uncached images are sent `batch_size` per request and the requests run
+    together, at most EVAL_CONCURRENCY in flight, so wall time is roughly
+    one round trip per EVAL_CONCURRENCY requests instead of one per request.
+
+    The models cache their async SDK client on first use, bound to that
+    event loop, so the requests always run on the long-lived background
+    loop (services.mcp_client); awaiting this from any other loop hands the
+    work over to it.
+
+    Args:
+        items: List of (alt_text, theme) pairs
+        use_cache: Whether to use cached results
+        batch_size: Images per LLM request (1 = one request per image)
+
+    Returns:
+        One dict per item (in the same order) with is_good, reason, confidence
+    """
+    coro = _evaluate_concurrent(items, use_cache, max(1, batch_size))
+    loop = get_event_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def evaluate_image(alt_text: str, theme: str, use_cache: bool = True) -> dict:
+    """
+    Evaluate if an image is good for art reference practice.
+
+    Args:
+        alt_text: Image description/alt text
+        theme: What the user is practicing (e.g., "hands", "dynamic poses")
+        use_cache: Whether to use cached results
+
+    Returns:
+        Dict with is_good (bool), reason (str), confidence (float)
+    """
+    return evaluate_images_batch([(alt_text, theme)], use_cache=use_cache)[0]
 
 
 def is_good_reference(alt_text: str, theme: str = "") -> bool:
@@ -208,10 +638,26 @@ def is_good_reference(alt_text: str, theme: str = "") -> bool:
     return result.get("is_good", True)
 
 
+def is_good_reference_batch(alt_texts: list[str], theme: str = "") -> list[bool]:
+    """
+    Batched is_good_reference: one cache lookup and as few LLM calls as
+    possible for many images of the same theme.
+
+    Args:
+        alt_texts: Image descriptions
+        theme: Practice theme (optional, helps with context)
+
+    Returns:
+        One bool per alt text, in the same order
+    """
+    theme = theme or "general"
+    results = evaluate_images_batch([(alt_text, theme) for alt_text in alt_texts])
+    return [result.get("is_good", True) for result in results]
+
+
 def clear_evaluation_cache():
     """Clear the evaluation cache."""
-    global _evaluation_cache
-    _evaluation_cache = {}
+    _evaluation_cache.clear()
 
 
 # Type alias
@@ -5,17 +5,19 @@ Uses LLM intelligence to generate optimal Pexels search queries
 based on the user's practice theme/request.
 """
 
-import sys
-import json
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import logging
+import hashlib
+from functools import lru_cache
 
 from agno.agent import Agent
 from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
 from agno.models.openai.like import OpenAILike
 import config
+from agent.subagents._http import SHARED_HTTPX_SYNC
+from agent.subagents._logging import logger
+from utils.json_extract import extract_json
+from agent.subagents._cache import SubagentCache, semantic_theme_key
 
 
 QUERY_GENERATOR_INSTRUCTIONS = """You generate optimal search queries for finding reference photos on Pexels.
@@ -83,17 +85,22 @@ def get_query_model():
         return Groq(
             id="llama-3.1-8b-instant",
             api_key=config.GROQ_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "moonshot":
         return OpenAILike(
             id=config.MOONSHOT_MODEL,
             api_key=config.MOONSHOT_API_KEY,
             base_url="https://api.moonshot.ai/v1",
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "openai":
         return OpenAIChat(
             id="gpt-4o-mini",
             api_key=config.OPENAI_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
+            # Route every request to the same cached instructions prefix
+            extra_body={"prompt_cache_key": "query-generator"},
         )
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
@@ -105,24 +112,75 @@ def create_query_agent() -> Agent:
         name="QueryGenerator",
         model=get_query_model(),
         instructions=QUERY_GENERATOR_INSTRUCTIONS,
-        markdown=True,
+        markdown=False,
     )
 
 
-# Singleton instance
-_query_agent: Agent | None = None
-
-
+# Singleton instance (get_query_agent.cache_clear() rebuilds it)
+@lru_cache(maxsize=1)
 def get_query_agent() -> Agent:
     """Get or create the query agent singleton."""
-    global _query_agent
-    if _query_agent is None:
-        _query_agent = create_query_agent()
-    return _query_agent
+    return create_query_agent()
+
+
+# Fingerprint of the instructions; editing them invalidates persisted queries
+INSTRUCTIONS_HASH = hashlib.blake2b(QUERY_GENERATOR_INSTRUCTIONS.encode(), digest_size=16).hexdigest()
+
+# Queries for a theme rarely go stale, so keep them much longer than other responses
+QUERY_CACHE_TTL = 30 * 24 * 3600  # seconds
+
+# Cache for generated queries (persisted across restarts)
+_query_cache = SubagentCache("queries", INSTRUCTIONS_HASH, expire=QUERY_CACHE_TTL)
 
+# Prefix for entries keyed by semantic_theme_key, so "vintage cars" and
+# "vintage automobiles" reuse one generation
+_SEMANTIC_PREFIX = "~"
 
-# Cache for generated queries
-_query_cache: dict[str, list[str]] = {}
+
+def _get_cached_queries(theme: str, theme_lower: str) -> list[str] | None:
+    """Look up queries by exact theme first, then by near-duplicate theme."""
+    semantic_key = semantic_theme_key(theme_lower)
+    # Fetch both candidates in one cache round trip
+    hits = _query_cache.get_many((theme_lower, _SEMANTIC_PREFIX + semantic_key))
+
+    cached = hits.get(theme_lower)
+    if cached is not None:
+        logger.debug("[QUERY_GEN] Cache hit for '%s'", theme)
+        return cached
+
+    if semantic_key:
+        cached = hits.get(_SEMANTIC_PREFIX + semantic_key)
+        if cached is not None:
+            logger.debug("[QUERY_GEN] Similar-theme cache hit for '%s' (%s)", theme, semantic_key)
+            _query_cache.set(theme_lower, cached)
+            return cached
+
+    return None
+
+
+def cache_queries(theme: str, queries: list[str]):
+    """
+    Cache queries for a theme under both the exact and the semantic theme
+    key, so generate_smart_queries returns them without an LLM call.
+
+    Used by other subagents (e.g. the session planner) that produce
+    queries as a by-product.
+    """
+    theme_lower = theme.lower().strip()
+    _query_cache.set(theme_lower, queries)
+    semantic_key = semantic_theme_key(theme_lower)
+    if semantic_key:
+        _query_cache.set(_SEMANTIC_PREFIX + semantic_key, queries)
+
+
+def _parse_queries(content: str) -> list[str] | None:
+    """Extract the query list from an agent response, or None if unusable."""
+    queries = extract_json(content)
+
+    if isinstance(queries, list) and len(queries) >= 2:
+        # Ensure queries are strings and not too long
+        return [str(q)[:50] for q in queries if q][:6]
+    return None
 
 
 def generate_smart_queries(theme: str, use_cache: bool = True) -> list[str]:
@@ -139,57 +197,38 @@ def generate_smart_queries(theme: str, use_cache: bool = True) -> list[str]:
     theme_lower = theme.lower().strip()
 
     # Check cache
-    if use_cache and theme_lower in _query_cache:
-        print(f"[QUERY_GEN] Cache hit for '{theme}'")
-        return _query_cache[theme_lower]
+    cached = _get_cached_queries(theme, theme_lower) if use_cache else None
+    if cached is not None:
+        return cached
 
     prompt = f'Generate search queries for: "{theme}"'
 
-    print(f"[QUERY_GEN] Generating queries for '{theme}'")
+    logger.debug("[QUERY_GEN] Generating queries for '%s'", theme)
 
     try:
         agent = get_query_agent()
         response = agent.run(prompt)
 
-        content = response.content if response.content else ""
-
-        # Parse JSON from response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        content = content.strip()
-
-        # Find the JSON array in the content
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        if start >= 0 and end > start:
-            content = content[start:end]
-
-        queries = json.loads(content)
-
-        if isinstance(queries, list) and len(queries) >= 2:
-            # Ensure queries are strings and not too long
-            queries = [str(q)[:50] for q in queries if q][:6]
-            print(f"[QUERY_GEN] Generated: {queries}")
+        queries = _parse_queries(response.content or "")
+        if queries:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[QUERY_GEN] Generated: %s", queries)
 
             # Cache the result
-            _query_cache[theme_lower] = queries
+            cache_queries(theme_lower, queries)
             return queries
 
     except Exception as e:
-        print(f"[QUERY_GEN] Error: {e}")
+        logger.warning("[QUERY_GEN] Error: %s", e)
 
     # Fallback: return the theme itself
-    print(f"[QUERY_GEN] Fallback to theme as query")
+    logger.debug("[QUERY_GEN] Fallback to theme as query")
     return [theme]
 
 
 def clear_query_cache():
     """Clear the query cache."""
-    global _query_cache
-    _query_cache = {}
+    _query_cache.clear()
 
 
 # Type alias
@@ -0,0 +1,118 @@
+"""
+Session Planner Subagent.
+
+Plans a practice session in one LLM call: the Pexels search queries for
+a theme plus theme-specific keywords that let the image evaluator accept
+or reject most photos locally, instead of one evaluation call per image.
+"""
+
+import hashlib
+from functools import lru_cache
+
+from agno.agent import Agent
+
+from agent.subagents._cache import SubagentCache
+from agent.subagents._logging import logger
+from agent.subagents.image_evaluator import set_theme_filters
+from agent.subagents.query_generator import cache_queries, get_query_model
+from utils.json_extract import extract_json
+
+
+PLANNER_INSTRUCTIONS = """You plan ART REFERENCE practice sessions with photos from Pexels.
+
+Given a practice theme, return ONE JSON object with:
+- "queries": 4-6 SPECIFIC Pexels search queries, 2-4 words each, each finding
+  a DIFFERENT kind of photo (e.g. "hands" -> "pianist hands closeup", "rock climbing grip")
+- "good_keywords": 5-10 single lowercase words that, if present in a photo's
+  description, show the theme's subject clearly (e.g. "hands" -> "hand", "finger", "palm")
+- "bad_keywords": 3-8 single lowercase words that mark photos useless for
+  practicing this theme (e.g. "hands" -> "glove", "silhouette", "blurry")
+
+## EXAMPLE
+
+Theme: "dynamic poses"
+{"queries": ["ballet dancer leap", "basketball slam dunk", "martial arts kick", "parkour jump"],
+ "good_keywords": ["dancer", "jumping", "leap", "kick", "athlete", "stretching"],
+ "bad_keywords": ["sitting", "sleeping", "portrait", "headshot"]}
+
+Return ONLY the JSON object, no other text.
+"""
+
+# Fingerprint of the instructions; editing them invalidates cached plans
+INSTRUCTIONS_HASH = hashlib.blake2b(PLANNER_INSTRUCTIONS.encode(), digest_size=16).hexdigest()
+
+_plan_cache = SubagentCache("plans", INSTRUCTIONS_HASH)
+
+
+def create_planner_agent() -> Agent:
+    """Create the session planner subagent."""
+    return Agent(
+        name="SessionPlanner",
+        model=get_query_model(),
+        instructions=PLANNER_INSTRUCTIONS,
+        markdown=False,
+    )
+
+
+# Singleton instance (get_planner_agent.cache_clear() rebuilds it)
+@lru_cache(maxsize=1)
+def get_planner_agent() -> Agent:
+    """Get or create the planner agent singleton."""
+    return create_planner_agent()
+
+
+def _clean_words(values, limit: int) -> list[str]:
+    """Keep up to `limit` non-empty lowercase strings."""
+    if not isinstance(values, list):
+        return []
+    return [w for w in (str(v).strip().lower() for v in values if v) if w][:limit]
+
+
+def plan_session(theme: str, use_cache: bool = True) -> dict:
+    """
+    Get search queries and evaluation keywords for a theme in one LLM call.
+
+    The keywords are registered with the image evaluator (set_theme_filters)
+    and the queries seed the query generator's cache, so the follow-up
+    generate_smart_queries/evaluate_images_batch calls mostly resolve locally.
+
+    Args:
+        theme: The user's practice theme
+        use_cache: Whether to use a cached plan
+
+    Returns:
+        Dict with queries, good_keywords and bad_keywords
+    """
+    theme_lower = theme.lower().strip()
+
+    plan = _plan_cache.get(theme_lower) if use_cache else None
+    if plan is not None:
+        logger.debug("[PLANNER] Cache hit for '%s'", theme)
+    else:
+        logger.debug("[PLANNER] Planning session for '%s'", theme)
+        try:
+            response = get_planner_agent().run(f'Theme: "{theme}"')
+            parsed = extract_json(response.content or "")
+            if not isinstance(parsed, dict):
+                raise ValueError("planner did not return a JSON object")
+
+            queries = [q[:50] for q in (str(q).strip() for q in parsed.get("queries") or [] if q) if q][:6]
+            plan = {
+                "queries": queries or [theme],
+                "good_keywords": _clean_words(parsed.get("good_keywords"), 10),
+                "bad_keywords": _clean_words(parsed.get("bad_keywords"), 8),
+            }
+            _plan_cache.set(theme_lower, plan)
+            if len(queries) >= 2:
+                cache_queries(theme_lower, queries)
+        except Exception as e:
+            logger.warning("[PLANNER] Error: %s", e)
+            return {"queries": [theme], "good_keywords": [], "bad_keywords": []}
+
+    set_theme_filters(theme, plan["good_keywords"], plan["bad_keywords"])
+    return plan
+
+
+def clear_plan_cache():
+    """Clear the session plan cache."""
+    _plan_cache.clear()
@@ -5,16 +5,18 @@ Generates intelligent practice tips for art practice sessions.
 Tips are displayed in a separate panel, not in the main chat.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import hashlib
+from functools import lru_cache
 
 from agno.agent import Agent
 from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
 from agno.models.openai.like import OpenAILike
 import config
+from agent.subagents._http import SHARED_HTTPX_SYNC
+from agent.subagents._logging import logger
+from utils.json_extract import extract_json
+from agent.subagents._cache import SubagentCache
 
 
 TIPS_INSTRUCTIONS = """You are an art practice coach helping artists improve their skills.
@@ -62,10 +64,6 @@ Be specific and practical. No generic advice like "practice more" - give actiona
 """
 
 
-# Tips cache to avoid regenerating for same themes
-_tips_cache: dict[str, dict] = {}
-
-
 def get_tips_model():
     """Get a fast/cheap model for tips generation."""
     provider = config.LLM_PROVIDER.lower()
@@ -75,17 +73,22 @@ def get_tips_model():
         return Groq(
             id="llama-3.1-8b-instant",  # Fast model
             api_key=config.GROQ_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "moonshot":
         return OpenAILike(
             id=config.MOONSHOT_MODEL,
             api_key=config.MOONSHOT_API_KEY,
             base_url="https://api.moonshot.ai/v1",
+            http_client=SHARED_HTTPX_SYNC,
         )
     elif provider == "openai":
         return OpenAIChat(
             id="gpt-4o-mini",  # Cheaper/faster model
             api_key=config.OPENAI_API_KEY,
+            http_client=SHARED_HTTPX_SYNC,
+            # Route every request to the same cached instructions prefix
+            extra_body={"prompt_cache_key": "tips-generator"},
         )
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
@@ -97,20 +100,22 @@ def create_tips_agent() -> Agent:
         name="TipsGenerator",
         model=get_tips_model(),
         instructions=TIPS_INSTRUCTIONS,
-        markdown=True,
+        markdown=False,
     )
 
 
-# Singleton instance
-_tips_agent: Agent | None = None
+# Fingerprint of the instructions, computed once; editing them invalidates cached tips
+INSTRUCTIONS_HASH = hashlib.blake2b(TIPS_INSTRUCTIONS.encode(), digest_size=16).hexdigest()
 
+# Tips cache to avoid regenerating for same themes
+_tips_cache = SubagentCache("tips", INSTRUCTIONS_HASH)
 
+
+# Singleton instance (get_tips_agent.cache_clear() rebuilds it)
+@lru_cache(maxsize=1)
 def get_tips_agent() -> Agent:
     """Get or create the tips agent singleton."""
-    global _tips_agent
-    if _tips_agent is None:
-        _tips_agent = create_tips_agent()
-    return _tips_agent
+    return create_tips_agent()
 
 
 def generate_practice_tips(practice_focus: str, duration_seconds: int = 60) -> dict:
@@ -124,42 +129,30 @@ def generate_practice_tips(practice_focus: str, duration_seconds: int = 60) -> d
     Returns:
         Dict with tips structure
     """
-    import json
-
     # Check cache first
     cache_key = f"{practice_focus.lower()}_{duration_seconds}"
-    if cache_key in _tips_cache:
-        print(f"[TIPS] Cache hit for '{cache_key}'")
-        return _tips_cache[cache_key]
+    cached = _tips_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("[TIPS] Cache hit for '%s'", cache_key)
+        return cached
 
     duration_minutes = duration_seconds // 60 if duration_seconds >= 60 else duration_seconds / 60
 
-    # Build prompt
-    prompt = f"""Generate practice tips for:
-- Subject: {practice_focus}
-- Duration per image: {duration_seconds} seconds ({duration_minutes} minutes)
+    # Build prompt - static text first, session details last (prefix caching)
+    prompt = f"""Return ONLY the JSON object, no other text.
 
-Return ONLY the JSON object, no other text."""
+Generate practice tips for:
+- Subject: {practice_focus}
+- Duration per image: {duration_seconds} seconds ({duration_minutes} minutes)"""
 
-    print(f"[TIPS] Generating tips for '{practice_focus}' at {duration_seconds}s")
+    logger.debug("[TIPS] Generating tips for '%s' at %ss", practice_focus, duration_seconds)
 
     try:
         agent = get_tips_agent()
         response = agent.run(prompt)
 
-        # Parse the response
-        content = response.content if response.content else ""
-
-        # Try to extract JSON from the response
-        # Handle markdown code blocks
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        content = content.strip()
-
-        tips = json.loads(content)
+        # Parse the response (handles markdown code blocks)
+        tips = extract_json(response.content or "")
 
         # Ensure required fields
         if "practice_focus" not in tips:
@@ -168,57 +161,63 @@ Return ONLY the JSON object, no other text."""
             tips["duration_minutes"] = duration_minutes
 
         # Cache the result
-        _tips_cache[cache_key] = tips
+        _tips_cache.set(cache_key, tips)
 
-        print(f"[TIPS] Generated tips successfully")
+        logger.debug("[TIPS] Generated tips successfully")
         return tips
 
-    except json.JSONDecodeError as e:
-        print(f"[TIPS] Failed to parse tips JSON: {e}")
+    except ValueError as e:
+        logger.warning("[TIPS] Failed to parse tips JSON: %s", e)
         return _get_fallback_tips(practice_focus, duration_seconds)
     except Exception as e:
-        print(f"[TIPS] Error generating tips: {e}")
+        logger.warning("[TIPS] Error generating tips: %s", e)
         return _get_fallback_tips(practice_focus, duration_seconds)
 
 
+# (max seconds per image, advice) used by the fallback tips, shortest first
+_DURATION_ADVICE = (
+    (30, "Focus only on gesture and line of action. No details!"),
+    (60, "Capture gesture first, then block in major shapes."),
+    (120, "You have time for gesture, forms, and basic proportions."),
+    (300, "Include gesture, forms, proportions, and key details."),
+)
+_LONG_DURATION_ADVICE = "Full study: gesture, forms, proportions, details, and shading."
+
+_FALLBACK_FOCUS_AREAS = (
+    "Start with the biggest shapes first",
+    "Look for the overall gesture or flow",
+    "Compare proportions frequently",
+    "Step back and check your work",
+)
+_FALLBACK_COMMON_MISTAKES = (
+    "Adding details too early",
+    "Not checking proportions",
+    "Rushing through the observation phase",
+)
+
+
 def _get_fallback_tips(practice_focus: str, duration_seconds: int) -> dict:
     """Return fallback tips when generation fails."""
     duration_minutes = duration_seconds // 60 if duration_seconds >= 60 else duration_seconds / 60
-
-    if duration_seconds <= 30:
-        duration_advice = "Focus only on gesture and line of action. No details!"
-    elif duration_seconds <= 60:
-        duration_advice = "Capture gesture first, then block in major shapes."
-    elif duration_seconds <= 120:
-        duration_advice = "You have time for gesture, forms, and basic proportions."
-    elif duration_seconds <= 300:
-        duration_advice = "Include gesture, forms, proportions, and key details."
-    else:
-        duration_advice = "Full study: gesture, forms, proportions, details, and shading."
+    duration_advice = next(
+        (advice for limit, advice in _DURATION_ADVICE if duration_seconds <= limit),
+        _LONG_DURATION_ADVICE,
+    )
 
     return {
         "practice_focus": practice_focus.title(),
         "duration_minutes": duration_minutes,
         "duration_advice": duration_advice,
-        "focus_areas": [
-            "Start with the biggest shapes first",
-            "Look for the overall gesture or flow",
-            "Compare proportions frequently",
-            "Step back and check your work",
-        ],
-        "common_mistakes": [
-            "Adding details too early",
-            "Not checking proportions",
-            "Rushing through the observation phase",
-        ],
+        # Lists, matching generated tips
+        "focus_areas": list(_FALLBACK_FOCUS_AREAS),
+        "common_mistakes": list(_FALLBACK_COMMON_MISTAKES),
         "warm_up_suggestion": f"Do quick thumbnail sketches of {practice_focus} to warm up",
     }
 
 
 def clear_tips_cache():
     """Clear the tips cache."""
-    global _tips_cache
-    _tips_cache = {}
+    _tips_cache.clear()
 
 
 # Type alias
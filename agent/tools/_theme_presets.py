@@ -0,0 +1,113 @@
+"""
+Preset theme lookup and expansion cache shared by the curator tools.
+
+Both curators map common themes to hand-picked search queries. A theme
+that isn't a preset key can still match one partially ("dynamic hand
+poses" -> "hand"); ThemePresets answers that through a word index
+instead of substring-testing every key on each call. With pyahocorasick
+installed, keys contained anywhere in the theme are also found in one
+linear scan.
+
+ExpansionCache memoizes a tool's finished theme expansions (preset hits
+and successful LLM results) so repeated themes skip the lookup and LLM.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class ThemePresets:
+    """Exact and partial lookup over a theme -> queries preset dict."""
+
+    def __init__(self, expansions: dict):
+        """
+        Args:
+            expansions: Lowercase theme -> search queries
+        """
+        self.expansions = expansions
+        # Longest (most specific) keys are tried first
+        self._keys_by_length = sorted(expansions, key=len, reverse=True)
+        self._rank = {key: i for i, key in enumerate(self._keys_by_length)}
+        # Word -> preset keys containing that word
+        self._key_tokens: dict[str, list[str]] = {}
+        for key in expansions:
+            for token in set(key.split()):
+                self._key_tokens.setdefault(token, []).append(key)
+
+        # Optional automaton finding every key that occurs inside a theme
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for key in expansions:
+                self._automaton.add_word(key, key)
+            self._automaton.make_automaton()
+
+    def match(self, theme_lower: str) -> Optional[str]:
+        """
+        Find the preset key for a normalized theme.
+
+        Args:
+            theme_lower: Lowercased, stripped theme
+
+        Returns:
+            The exact key, else the most specific key contained in (or
+            containing) the theme, else None
+        """
+        if theme_lower in self.expansions:
+            return theme_lower
+
+        # Common case: the theme shares a whole word with a preset key
+        candidates = {
+            key
+            for token in theme_lower.split()
+            for key in self._key_tokens.get(token, ())
+        }
+        if self._automaton is not None:
+            candidates.update(key for _, key in self._automaton.iter(theme_lower))
+        for key in sorted(candidates, key=self._rank.__getitem__):
+            if key in theme_lower or theme_lower in key:
+                return key
+
+        # Rare case: substring-only overlap ("handstand" -> "hand")
+        for key in self._keys_by_length:
+            if key in theme_lower or theme_lower in key:
+                return key
+        return None
+
+
+class ExpansionCache:
+    """Bounded LRU of theme expansions keyed by (normalized theme, use_llm_fallback)."""
+
+    def __init__(self, max_items: int = 256):
+        self.max_items = max_items
+        self._items: OrderedDict[tuple[str, bool], tuple[str, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, theme_lower: str, use_llm_fallback: bool = True) -> Optional[tuple[str, ...]]:
+        """Return the cached queries for a normalized theme, or None."""
+        key = (theme_lower, use_llm_fallback)
+        with self._lock:
+            queries = self._items.get(key)
+            if queries is not None:
+                self._items.move_to_end(key)
+            return queries
+
+    def set(self, theme_lower: str, use_llm_fallback: bool, queries: tuple[str, ...]) -> tuple[str, ...]:
+        """Cache queries for a normalized theme (evicting the least recently used) and return them."""
+        key = (theme_lower, use_llm_fallback)
+        with self._lock:
+            self._items[key] = queries
+            self._items.move_to_end(key)
+            if len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return queries
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
@@ -6,94 +6,134 @@ Uses cache-aware selection with scoring to provide fresh, relevant images.
 """
 
 import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from agno.tools import tool
+from agent.pipeline import curate_pipeline
+from agent.subagents.session_planner import plan_session
+from agent.tools._theme_presets import ExpansionCache, ThemePresets
+from agent.tools.session_control_tool import set_images_for_session
 from services.pexels_client import pexels_client
 from services.memory_store import memory_store
 from services.session_store import session_store
 from services.image_scorer import image_scorer
+from services.mcp_client import run_sync
 import config
 
 # Days to look back for recently used images
 EXCLUDE_RECENT_DAYS = getattr(config, 'EXCLUDE_RECENT_IMAGES_DAYS', 3)
 
+# Max Pexels searches in flight at once
+MAX_SEARCH_WORKERS = 8
+
+# Stop merging search results once this many images beyond target_count
+# are available; the extras leave the scorer some choice
+EARLY_STOP_SLACK = 4
+
 # Theme to queries mapping for common art practice themes
+# (Tuple literals: aliases with identical queries, e.g. "hand"/"hands",
+# compile to one shared constant, so keep the values as tuples.)
 THEME_EXPANSIONS = {
     # Animals
-    "animals": ["cat", "dog", "horse", "bird"],
-    "animal": ["cat", "dog", "horse", "bird"],
-    "pets": ["cat", "dog", "rabbit", "hamster"],
-    "wildlife": ["lion", "elephant", "deer", "wolf"],
+    "animals": ("cat", "dog", "horse", "bird"),
+    "animal": ("cat", "dog", "horse", "bird"),
+    "pets": ("cat", "dog", "rabbit", "hamster"),
+    "wildlife": ("lion", "elephant", "deer", "wolf"),
 
     # Human body
-    "hands": ["hand", "fist", "fingers", "grip"],
-    "hand": ["hand", "fist", "fingers", "grip"],
-    "hand studies": ["hand", "fist", "pointing", "grip"],
-    "feet": ["foot", "barefoot", "toes", "walking"],
-    "faces": ["portrait", "face", "profile", "smile"],
-    "portrait": ["portrait", "face", "headshot", "profile"],
-    "portraits": ["portrait", "face", "headshot", "profile"],
+    "hands": ("hand", "fist", "fingers", "grip"),
+    "hand": ("hand", "fist", "fingers", "grip"),
+    "hand studies": ("hand", "fist", "pointing", "grip"),
+    "feet": ("foot", "barefoot", "toes", "walking"),
+    "faces": ("portrait", "face", "profile", "smile"),
+    "portrait": ("portrait", "face", "headshot", "profile"),
+    "portraits": ("portrait", "face", "headshot", "profile"),
 
     # Poses
-    "dynamic poses": ["dancer", "athlete", "runner", "gymnast"],
-    "dynamic": ["dancer", "athlete", "jump", "action"],
-    "poses": ["model", "pose", "standing", "sitting"],
-    "gesture": ["dancer", "yoga", "stretch", "movement"],
-    "gestures": ["dancer", "yoga", "stretch", "movement"],
-    "figure": ["model", "pose", "figure", "body"],
-    "figure drawing": ["model", "pose", "figure", "standing"],
+    "dynamic poses": ("dancer", "athlete", "runner", "gymnast"),
+    "dynamic": ("dancer", "athlete", "jump", "action"),
+    "poses": ("model", "pose", "standing", "sitting"),
+    "gesture": ("dancer", "yoga", "stretch", "movement"),
+    "gestures": ("dancer", "yoga", "stretch", "movement"),
+    "figure": ("model", "pose", "figure", "body"),
+    "figure drawing": ("model", "pose", "figure", "standing"),
 
     # Objects
-    "vehicles": ["car", "motorcycle", "bicycle", "truck"],
-    "cars": ["car", "sedan", "sports car", "vintage car"],
-    "architecture": ["building", "house", "bridge", "tower"],
-    "nature": ["tree", "flower", "mountain", "forest"],
-    "food": ["fruit", "vegetables", "meal", "cooking"],
+    "vehicles": ("car", "motorcycle", "bicycle", "truck"),
+    "cars": ("car", "sedan", "sports car", "vintage car"),
+    "architecture": ("building", "house", "bridge", "tower"),
+    "nature": ("tree", "flower", "mountain", "forest"),
+    "food": ("fruit", "vegetables", "meal", "cooking"),
 }
 
+_THEME_PRESETS = ThemePresets(THEME_EXPANSIONS)
+
+
+@dataclass(slots=True)
+class PhotoRec:
+    """A newly found photo while curating; to_dict() gives the tool's output shape."""
+    pexels_id: int
+    url: str
+    thumbnail: str
+    alt: str
+    photographer: str
+    times_used: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "pexels_id": self.pexels_id,
+            "url": self.url,
+            "thumbnail": self.thumbnail,
+            "alt": self.alt,
+            "photographer": self.photographer,
+            "times_used": self.times_used,
+        }
+
 
-def _expand_theme(theme: str, use_llm_fallback: bool = True) -> list[str]:
+# Preset and successful LLM expansions (_EXPANSION_CACHE.clear() resets them)
+_EXPANSION_CACHE = ExpansionCache()
+
+
+def _expand_theme(theme: str, use_llm_fallback: bool = True) -> tuple[str, ...]:
     """Expand a theme into search queries.
 
+    Preset and LLM results are memoized per process; the plain-theme
+    fallback is not, so a failed LLM call is retried on the next request.
+
     Args:
         theme: The practice theme
         use_llm_fallback: If True, use LLM to generate queries when no preset matches
 
     Returns:
-        List of search queries
+        Tuple of search queries
     """
     theme_lower = theme.lower().strip()
 
-    # Check exact match in presets
-    if theme_lower in THEME_EXPANSIONS:
-        return THEME_EXPANSIONS[theme_lower]
+    cached = _EXPANSION_CACHE.get(theme_lower, use_llm_fallback)
+    if cached is not None:
+        return cached
 
-    # Check partial match in presets
-    for key, queries in THEME_EXPANSIONS.items():
-        if key in theme_lower or theme_lower in key:
-            return queries
+    # Check exact, then partial match in presets
+    key = _THEME_PRESETS.match(theme_lower)
+    if key is not None:
+        return _EXPANSION_CACHE.set(theme_lower, use_llm_fallback, THEME_EXPANSIONS[key])
 
-    # No preset match - use LLM to generate smart queries
+    # No preset match - plan with the LLM: queries plus theme keywords that
+    # let the evaluator judge most photos locally
     if use_llm_fallback:
         try:
-            from agent.subagents.query_generator import generate_smart_queries
-            queries = generate_smart_queries(theme)
+            queries = plan_session(theme)["queries"]
             if queries and len(queries) >= 2:
-                return queries
+                return _EXPANSION_CACHE.set(theme_lower, use_llm_fallback, tuple(queries))
         except Exception as e:
             print(f"[CURATOR] Smart query generation failed: {e}")
 
     # Final fallback: use theme as-is
-    return [theme_lower]
-
-
-def _is_good_reference(alt_text: str, theme: str = "") -> bool:
-    """Check if image is good for reference practice using subagent."""
-    from agent.subagents.image_evaluator import is_good_reference
-    return is_good_reference(alt_text, theme)
+    return (theme_lower,)
 
 
 def _get_cached_images_with_scores(theme: str) -> list[dict] | None:
@@ -108,15 +148,15 @@ def _get_cached_images_with_scores(theme: str) -> list[dict] | None:
     return None
 
 
-def _get_recently_used_ids() -> set[int]:
+def _get_recently_used_ids() -> frozenset[int]:
     """Get IDs of images used recently. Returns empty set if DB offline."""
     try:
         return session_store.get_images_shown_recently(days=EXCLUDE_RECENT_DAYS)
     except Exception:
-        return set()
+        return frozenset()
 
 
-def _try_save_to_cache(theme: str, queries: list[str], images: list[dict]):
+def _try_save_to_cache(theme: str, queries: Sequence[str], images: list[dict]):
     """Try to save results to cache. Silently fails if DB offline."""
     try:
         memory_store.save_theme_results(theme, queries, images)
@@ -125,123 +165,64 @@ def _try_save_to_cache(theme: str, queries: list[str], images: list[dict]):
         pass  # Silently ignore - DB offline
 
 
-@tool
-def curate_reference_photos(theme: str, target_count: int = 12, force_fresh: bool = False) -> list[dict]:
+def _collect_new_images(
+    theme: str,
+    queries: Sequence[str],
+    seen_ids: set[int],
+    needed: int,
+    have: int,
+    target_count: int,
+) -> list[dict]:
     """
-    Curate diverse reference photos for art practice.
-
-    Expands the theme into multiple search terms to get varied results.
-    Uses smart caching and scoring to provide fresh, relevant images.
-    Recently used images are deprioritized for variety.
+    Search Pexels for every query and keep the new photos that pass evaluation.
 
     Args:
-        theme: What to practice (e.g., "hands", "dynamic poses", "animals")
-        target_count: Target number of images (default 12)
-        force_fresh: If True, bypass cache AND preset query expansions.
-                    Use this when user asks for "fresh", "new", "different" images.
-                    The theme will be used directly as creative search terms.
+        theme: Practice theme (for evaluation)
+        queries: Search queries
+        seen_ids: IDs to skip; updated with every photo examined
+        needed: How many new images the caller still needs
+        have: Images the caller already has (for the early stop)
+        target_count: Requested number of images
 
     Returns:
-        List of photo dicts with: pexels_id, url, thumbnail, alt, photographer
+        New photo dicts in the tool's output shape
     """
-    from agent.tools.session_control_tool import set_images_for_session
-
-    print(f"[CURATOR] Curating: '{theme}' (force_fresh={force_fresh})")
-
-    # Get recently used images to potentially exclude
-    recently_used = _get_recently_used_ids()
-    print(f"[CURATOR] Recently used: {len(recently_used)} images")
-
-    available = []
-    needed = target_count
-
-    # Skip cache if force_fresh is requested
-    if not force_fresh:
-        # Check cache first
-        cached_images = _get_cached_images_with_scores(theme)
-
-        if cached_images:
-            # Filter out recently used if we have enough remaining
-            available = [img for img in cached_images if img['pexels_id'] not in recently_used]
-
-            if len(available) >= target_count:
-                # Use scorer for weighted selection from cache
-                print(f"[CURATOR] Using cache ({len(available)} fresh images available)")
-                try:
-                    selected = image_scorer.select_images(
-                        available=available,
-                        theme=theme,
-                        count=target_count,
-                        exclude_ids=recently_used
-                    )
-                    if selected:
-                        set_images_for_session(selected)
-                        return selected
-                except Exception as e:
-                    print(f"[CURATOR] Scorer failed: {e}")
-                    # Fallback to simple slice
-                    result = available[:target_count]
-                    set_images_for_session(result)
-                    return result
-
-            # Not enough fresh images in cache - supplement with API
-            print(f"[CURATOR] Cache has {len(available)} fresh images, need {target_count}")
-            needed = target_count - len(available)
-    else:
-        print(f"[CURATOR] Force fresh mode - bypassing cache and presets")
-
-    # Determine search queries
-    if force_fresh:
-        # Force fresh: bypass presets, use LLM to generate intelligent queries
-        print(f"[CURATOR] Force fresh mode - generating smart queries with LLM")
-        try:
-            from agent.subagents.query_generator import generate_smart_queries
-            queries = generate_smart_queries(theme, use_cache=False)  # Don't cache for fresh requests
-            print(f"[CURATOR] Fresh smart queries: {queries}")
-        except Exception as e:
-            print(f"[CURATOR] Smart query generation failed: {e}, using theme directly")
-            queries = [theme]
-    else:
-        # Normal mode: expand theme to queries using presets (with LLM fallback)
-        queries = _expand_theme(theme)
-        print(f"[CURATOR] Queries: {queries}")
-
-    # Search and collect new images from API
-    new_images = []
     # Fetch more than needed for variety and scoring
     fetch_per_query = max(10, (needed * 2) // len(queries) + 3)
 
-    for query in queries:
-        print(f"[CURATOR] Searching: '{query}'")
-        try:
-            photos = pexels_client.search_photos(query=query, per_page=fetch_per_query)
-
-            for photo in photos:
-                if _is_good_reference(photo.alt, theme):
-                    # Skip duplicates and recently used
-                    pexels_id = photo.id
-                    if pexels_id in recently_used:
-                        continue
-                    if any(img.get("pexels_id") == pexels_id for img in available):
-                        continue
-                    if any(img.get("pexels_id") == pexels_id for img in new_images):
-                        continue
-
-                    new_images.append({
-                        "pexels_id": pexels_id,
-                        "url": photo.src_large,
-                        "thumbnail": photo.src_medium,
-                        "alt": photo.alt,
-                        "photographer": photo.photographer,
-                        "times_used": 0,  # New images
-                    })
+    # Searches stream into batched evaluation, so Pexels requests overlap
+    # with LLM calls; stops once there are enough to choose from
+    photos = run_sync(curate_pipeline(
+        theme,
+        queries,
+        seen_ids,
+        target=max(1, target_count + EARLY_STOP_SLACK - have),
+        per_query=fetch_per_query,
+        search_workers=MAX_SEARCH_WORKERS,
+    ))
+    new_records = [
+        PhotoRec(
+            pexels_id=photo.id,
+            url=photo.src_large,
+            thumbnail=photo.src_medium,
+            alt=photo.alt,
+            photographer=photo.photographer,
+        )
+        for photo in photos
+    ]
+    print(f"[CURATOR] Found {len(new_records)} new images")
 
-        except Exception as e:
-            print(f"[CURATOR] Search failed for '{query}': {e}")
-            continue
+    # Scorer, cache and session control take the dict form
+    return [rec.to_dict() for rec in new_records]
 
-    # Combine available cached images with new ones
-    all_images = available + new_images
+
+def _select_final(
+    theme: str,
+    all_images: list[dict],
+    target_count: int,
+    recently_used: frozenset[int],
+) -> list[dict]:
+    """Pick the final images with the scorer and register them for the session."""
     print(f"[CURATOR] Total available: {len(all_images)} images")
 
     # Use scorer for final selection
@@ -258,11 +239,111 @@ def curate_reference_photos(theme: str, target_count: int = 12, force_fresh: boo
 
     print(f"[CURATOR] Selected: {len(final_images)} images")
 
-    # Cache new images for future use (skip if force_fresh - user wanted fresh, don't pollute preferences)
-    if new_images and not force_fresh:
-        _try_save_to_cache(theme, queries, new_images)
-
     # Set images for session control
     set_images_for_session(final_images)
 
     return final_images
+
+
+def _curate_cached(theme: str, target_count: int, recently_used: frozenset[int]) -> list[dict]:
+    """Normal mode: serve from cache when possible, topping up from Pexels via preset queries."""
+    available = []
+    needed = target_count
+    # IDs to skip from here on: recently used plus everything already collected
+    seen_ids = set(recently_used)
+
+    # Check cache first
+    cached_images = _get_cached_images_with_scores(theme)
+
+    if cached_images:
+        # Filter out recently used (and repeated) images, recording the
+        # kept IDs so the API results below skip them too
+        for img in cached_images:
+            pexels_id = img['pexels_id']
+            if pexels_id not in seen_ids:
+                seen_ids.add(pexels_id)
+                available.append(img)
+
+        if len(available) >= target_count:
+            # Use scorer for weighted selection from cache
+            print(f"[CURATOR] Using cache ({len(available)} fresh images available)")
+            try:
+                selected = image_scorer.select_images(
+                    available=available,
+                    theme=theme,
+                    count=target_count,
+                    exclude_ids=recently_used
+                )
+                if selected:
+                    set_images_for_session(selected)
+                    return selected
+            except Exception as e:
+                print(f"[CURATOR] Scorer failed: {e}")
+                # Fallback to simple slice
+                result = available[:target_count]
+                set_images_for_session(result)
+                return result
+
+        # Not enough fresh images in cache - supplement with API
+        print(f"[CURATOR] Cache has {len(available)} fresh images, need {target_count}")
+        needed = target_count - len(available)
+
+    # Expand theme to queries using presets (with LLM fallback)
+    queries = _expand_theme(theme)
+    print(f"[CURATOR] Queries: {queries}")
+
+    new_images = _collect_new_images(theme, queries, seen_ids, needed, len(available), target_count)
+
+    # Cache new images for future use
+    if new_images:
+        _try_save_to_cache(theme, queries, new_images)
+
+    return _select_final(theme, available + new_images, target_count, recently_used)
+
+
+def _curate_fresh(theme: str, target_count: int, recently_used: frozenset[int]) -> list[dict]:
+    """Force-fresh mode: skip cache and presets, search with newly generated queries."""
+    print(f"[CURATOR] Force fresh mode - bypassing cache and presets")
+
+    # Bypass presets, plan fresh queries (and evaluation keywords) with the LLM
+    try:
+        queries = plan_session(theme, use_cache=False)["queries"]
+        print(f"[CURATOR] Fresh smart queries: {queries}")
+    except Exception as e:
+        print(f"[CURATOR] Smart query generation failed: {e}, using theme directly")
+        queries = [theme]
+
+    new_images = _collect_new_images(theme, queries, set(recently_used), target_count, 0, target_count)
+
+    # Not cached - user wanted fresh, don't pollute preferences
+    return _select_final(theme, new_images, target_count, recently_used)
+
+
+@tool
+def curate_reference_photos(theme: str, target_count: int = 12, force_fresh: bool = False) -> list[dict]:
+    """
+    Curate diverse reference photos for art practice.
+
+    Expands the theme into multiple search terms to get varied results.
+    Uses smart caching and scoring to provide fresh, relevant images.
+    Recently used images are deprioritized for variety.
+
+    Args:
+        theme: What to practice (e.g., "hands", "dynamic poses", "animals")
+        target_count: Target number of images (default 12)
+        force_fresh: If True, bypass cache AND preset query expansions.
+                    Use this when user asks for "fresh", "new", "different" images.
+                    The theme will be used directly as creative search terms.
+
+    Returns:
+        List of photo dicts with: pexels_id, url, thumbnail, alt, photographer
+    """
+    print(f"[CURATOR] Curating: '{theme}' (force_fresh={force_fresh})")
+
+    # Get recently used images to potentially exclude
+    recently_used = _get_recently_used_ids()
+    print(f"[CURATOR] Recently used: {len(recently_used)} images")
+
+    if force_fresh:
+        return _curate_fresh(theme, target_count, recently_used)
+    return _curate_cached(theme, target_count, recently_used)
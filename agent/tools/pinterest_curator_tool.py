@@ -17,110 +17,163 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from agno.tools import tool
 from agent.hooks import log_pre_hook
-from services.image_downloader import download_images_sync
-from services.mcp_client import PinterestMCPClient
+from agent.subagents.query_generator import generate_smart_queries
+from agent.tools._theme_presets import ExpansionCache, ThemePresets
+from services.image_downloader import get_downloader
+from services.mcp_client import get_pinterest_client, reset_pinterest_client, run_sync
 from agent.tools.session_control_tool import set_images_for_session
-import asyncio
 import logging
 
 # Setup Pinterest-specific logger
 pinterest_logger = logging.getLogger('Pinterest')
 pinterest_logger.setLevel(logging.INFO)
 
+# Separator line framing the curation start/summary blocks
+_BANNER = "=" * 70
+
+SERVER_PATH = str(Path(__file__).parent.parent.parent / "mcp_servers" / "pinterest_server.py")
+
 
 # Pinterest-optimized theme expansions for art reference searches
 # These are more specific and concrete than generic search terms
+# (Tuple literals: identical alias entries compile to one shared constant.)
 PINTEREST_THEME_EXPANSIONS = {
     # Human body - hands
-    "hands": ["pianist hands closeup", "rock climbing grip", "potter hands clay", "sign language gesture"],
-    "hand": ["pianist hands closeup", "rock climbing grip", "potter hands clay", "sign language gesture"],
-    "hand studies": ["hand anatomy drawing", "foreshortened hand pose", "hand grip reference", "expressive hands"],
+    "hands": ("pianist hands closeup", "rock climbing grip", "potter hands clay", "sign language gesture"),
+    "hand": ("pianist hands closeup", "rock climbing grip", "potter hands clay", "sign language gesture"),
+    "hand studies": ("hand anatomy drawing", "foreshortened hand pose", "hand grip reference", "expressive hands"),
 
     # Human body - feet
-    "feet": ["ballet feet pointe", "barefoot beach walking", "running feet motion", "toe closeup"],
-    "foot": ["ballet feet pointe", "barefoot beach walking", "running feet motion", "toe closeup"],
+    "feet": ("ballet feet pointe", "barefoot beach walking", "running feet motion", "toe closeup"),
+    "foot": ("ballet feet pointe", "barefoot beach walking", "running feet motion", "toe closeup"),
 
     # Faces and portraits
-    "faces": ["portrait photography lighting", "face profile silhouette", "emotional expression portrait", "character face closeup"],
-    "face": ["portrait photography lighting", "face profile silhouette", "emotional expression portrait", "character face closeup"],
-    "portrait": ["portrait photography lighting", "headshot professional", "dramatic portrait shadow", "natural light portrait"],
-    "portraits": ["portrait photography lighting", "headshot professional", "dramatic portrait shadow", "natural light portrait"],
+    "faces": ("portrait photography lighting", "face profile silhouette", "emotional expression portrait", "character face closeup"),
+    "face": ("portrait photography lighting", "face profile silhouette", "emotional expression portrait", "character face closeup"),
+    "portrait": ("portrait photography lighting", "headshot professional", "dramatic portrait shadow", "natural light portrait"),
+    "portraits": ("portrait photography lighting", "headshot professional", "dramatic portrait shadow", "natural light portrait"),
 
     # Poses and figures
-    "dynamic poses": ["ballet dancer leap", "parkour jump action", "martial arts kick", "gymnast pose"],
-    "dynamic": ["ballet dancer leap", "parkour jump action", "martial arts kick", "gymnast pose"],
-    "poses": ["figure model pose", "fashion model standing", "yoga pose silhouette", "dance pose elegant"],
-    "gesture": ["dancer movement gesture", "yoga stretch pose", "expressive body movement", "contemporary dance"],
-    "figure": ["figure drawing model", "nude art reference", "body pose study", "anatomy reference"],
-    "figure drawing": ["figure model pose", "gesture drawing reference", "life drawing pose", "anatomy study pose"],
+    "dynamic poses": ("ballet dancer leap", "parkour jump action", "martial arts kick", "gymnast pose"),
+    "dynamic": ("ballet dancer leap", "parkour jump action", "martial arts kick", "gymnast pose"),
+    "poses": ("figure model pose", "fashion model standing", "yoga pose silhouette", "dance pose elegant"),
+    "gesture": ("dancer movement gesture", "yoga stretch pose", "expressive body movement", "contemporary dance"),
+    "figure": ("figure drawing model", "nude art reference", "body pose study", "anatomy reference"),
+    "figure drawing": ("figure model pose", "gesture drawing reference", "life drawing pose", "anatomy study pose"),
 
     # Animals
-    "animals": ["cat portrait closeup", "dog action running", "horse galloping", "bird flight wings"],
-    "animal": ["cat portrait closeup", "dog action running", "horse galloping", "bird flight wings"],
-    "pets": ["cat sleeping cute", "dog portrait loyal", "rabbit fluffy", "pet photography"],
-    "wildlife": ["lion portrait majestic", "elephant nature", "deer forest", "wolf wild"],
+    "animals": ("cat portrait closeup", "dog action running", "horse galloping", "bird flight wings"),
+    "animal": ("cat portrait closeup", "dog action running", "horse galloping", "bird flight wings"),
+    "pets": ("cat sleeping cute", "dog portrait loyal", "rabbit fluffy", "pet photography"),
+    "wildlife": ("lion portrait majestic", "elephant nature", "deer forest", "wolf wild"),
 
     # Vehicles
-    "vehicles": ["classic car vintage", "motorcycle rider", "bicycle street", "truck industrial"],
-    "cars": ["classic Cadillac car", "1960s Mustang vintage", "sports car dramatic", "vintage automobile"],
-    "vintage cars": ["classic Cadillac car", "1960s Mustang vintage", "antique car show", "retro automobile"],
+    "vehicles": ("classic car vintage", "motorcycle rider", "bicycle street", "truck industrial"),
+    "cars": ("classic Cadillac car", "1960s Mustang vintage", "sports car dramatic", "vintage automobile"),
+    "vintage cars": ("classic Cadillac car", "1960s Mustang vintage", "antique car show", "retro automobile"),
 
     # Architecture and objects
-    "architecture": ["building dramatic angle", "modern architecture lines", "historic building facade", "bridge structure"],
-    "nature": ["tree dramatic lighting", "flower macro closeup", "mountain landscape", "forest atmosphere"],
-    "food": ["fruit still life", "cooking action hands", "meal plating artistic", "food photography"],
+    "architecture": ("building dramatic angle", "modern architecture lines", "historic building facade", "bridge structure"),
+    "nature": ("tree dramatic lighting", "flower macro closeup", "mountain landscape", "forest atmosphere"),
+    "food": ("fruit still life", "cooking action hands", "meal plating artistic", "food photography"),
 
     # Style-specific
-    "vintage": ["1950s fashion model", "retro pin-up style", "classic hollywood glamour", "vintage fashion photography"],
-    "vintage style": ["1950s fashion photography", "retro pin-up model", "classic hollywood portrait", "vintage dress photoshoot"],
-    "vintage style model": ["1950s fashion photography", "retro pin-up model", "classic hollywood portrait", "vintage dress photoshoot"],
+    "vintage": ("1950s fashion model", "retro pin-up style", "classic hollywood glamour", "vintage fashion photography"),
+    "vintage style": ("1950s fashion photography", "retro pin-up model", "classic hollywood portrait", "vintage dress photoshoot"),
+    "vintage style model": ("1950s fashion photography", "retro pin-up model", "classic hollywood portrait", "vintage dress photoshoot"),
 }
 
+_PINTEREST_PRESETS = ThemePresets(PINTEREST_THEME_EXPANSIONS)
+
+
+# Preset and successful LLM expansions (_PINTEREST_EXPANSION_CACHE.clear() resets them)
+_PINTEREST_EXPANSION_CACHE = ExpansionCache()
 
-def _expand_pinterest_theme(theme: str) -> list[str]:
+
+def _expand_pinterest_theme(theme: str) -> tuple[str, ...]:
     """
     Expand a theme into Pinterest-optimized search queries.
 
     Uses preset expansions for common themes, falls back to LLM-based
-    smart query generation for unknown themes.
+    smart query generation for unknown themes. Preset and LLM results are
+    memoized per process; the fallback queries are not, so a failed LLM
+    call is retried on the next request.
 
     Args:
         theme: The user's practice theme
 
     Returns:
-        List of 4-6 specific search queries optimized for Pinterest
+        Tuple of 4-6 specific search queries optimized for Pinterest
     """
     theme_lower = theme.lower().strip()
 
-    # Check exact match in presets
-    if theme_lower in PINTEREST_THEME_EXPANSIONS:
-        queries = PINTEREST_THEME_EXPANSIONS[theme_lower]
-        pinterest_logger.info(f"Using preset queries for '{theme}': {queries}")
-        return queries
-
-    # Check partial match in presets
-    for key, queries in PINTEREST_THEME_EXPANSIONS.items():
-        if key in theme_lower or theme_lower in key:
-            pinterest_logger.info(f"Using partial match '{key}' for '{theme}': {queries}")
-            return queries
+    cached = _PINTEREST_EXPANSION_CACHE.get(theme_lower)
+    if cached is not None:
+        return cached
+
+    # Check exact, then partial match in presets
+    key = _PINTEREST_PRESETS.match(theme_lower)
+    if key == theme_lower:
+        queries = PINTEREST_THEME_EXPANSIONS[key]
+        pinterest_logger.info("Using preset queries for '%s': %s", theme, queries)
+        return _PINTEREST_EXPANSION_CACHE.set(theme_lower, True, queries)
+    if key is not None:
+        queries = PINTEREST_THEME_EXPANSIONS[key]
+        pinterest_logger.info("Using partial match '%s' for '%s': %s", key, theme, queries)
+        return _PINTEREST_EXPANSION_CACHE.set(theme_lower, True, queries)
 
     # No preset match - use LLM to generate smart queries
-    pinterest_logger.info(f"No preset found for '{theme}', using smart query generation")
+    pinterest_logger.info("No preset found for '%s', using smart query generation", theme)
     try:
-        from agent.subagents.query_generator import generate_smart_queries
         queries = generate_smart_queries(theme)
         if queries and len(queries) >= 2:
-            pinterest_logger.info(f"Smart queries generated: {queries}")
-            return queries
+            pinterest_logger.info("Smart queries generated: %s", queries)
+            return _PINTEREST_EXPANSION_CACHE.set(theme_lower, True, tuple(queries))
     except Exception as e:
-        pinterest_logger.warning(f"Smart query generation failed: {e}")
+        pinterest_logger.warning("Smart query generation failed: %s", e)
 
     # Final fallback: use theme as-is with "reference" suffix for better art results
-    fallback = [f"{theme} reference", f"{theme} art", theme]
-    pinterest_logger.info(f"Using fallback queries: {fallback}")
+    fallback = (f"{theme} reference", f"{theme} art", theme)
+    pinterest_logger.info("Using fallback queries: %s", fallback)
     return fallback
 
 
+async def _search_and_download(queries: list[str], images_per_query: int) -> tuple[list[dict], list, float]:
+    """
+    Stream pins from the MCP search and download each one as it arrives.
+
+    Downloads of earlier queries' pins run while later queries are still
+    being searched, instead of waiting for the whole search to finish.
+
+    Returns:
+        (pins with unique ids and image URLs in query order, local path or None per pin,
+         seconds until the last search returned)
+    """
+    results = []
+    # Different pins (often repins) can point at the same image file
+    seen_urls = set()
+    start = time.time()
+
+    client = await get_pinterest_client(SERVER_PATH)
+    async with get_downloader().batch() as downloads:
+        try:
+            async for pin in client.stream_diverse(queries, images_per_query):
+                url = pin['image_url']
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                results.append(pin)
+                downloads.submit(url)
+        except Exception:
+            # Reconnect on the next call
+            await reset_pinterest_client(SERVER_PATH)
+            raise
+        search_time = time.time() - start
+        local_paths = await downloads.results()
+
+    return results, local_paths, search_time
+
+
 @tool(pre_hook=log_pre_hook)
 def curate_pinterest_images(theme: str, count: int = 15) -> list[dict]:
     """
@@ -140,45 +193,32 @@ def curate_pinterest_images(theme: str, count: int = 15) -> list[dict]:
         List of image dictionaries with local file paths and metadata
     """
     start_time = time.time()
-    timestamp = datetime.now().strftime("%H:%M:%S")
-
-    pinterest_logger.info("=" * 70)
-    pinterest_logger.info(f"🎨 PINTEREST CURATION STARTED - {timestamp}")
-    pinterest_logger.info(f"📝 Theme: '{theme}'")
-    pinterest_logger.info(f"🔢 Requested: {count} images")
-    pinterest_logger.info("=" * 70)
+    if pinterest_logger.isEnabledFor(logging.INFO):
+        pinterest_logger.info(_BANNER)
+        pinterest_logger.info("🎨 PINTEREST CURATION STARTED - %s", datetime.now().strftime("%H:%M:%S"))
+        pinterest_logger.info("📝 Theme: '%s'", theme)
+        pinterest_logger.info("🔢 Requested: %s images", count)
+        pinterest_logger.info(_BANNER)
 
     # Expand theme into diverse queries
     queries = _expand_pinterest_theme(theme)
     images_per_query = max(3, (count + len(queries) - 1) // len(queries))  # Ceiling division
 
-    pinterest_logger.info(f"🔍 Expanded to {len(queries)} queries: {queries}")
-    pinterest_logger.info(f"🔢 Images per query: {images_per_query}")
-
-    # Get server path
-    server_path = str(Path(__file__).parent.parent.parent / "mcp_servers" / "pinterest_server.py")
-
-    # Search Pinterest via MCP using diverse search for better variety
-    async def search():
-        async with PinterestMCPClient(server_path) as client:
-            return await client.search_diverse(queries, images_per_query)
-
-    # Run async search
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    pinterest_logger.info("🔍 Expanded to %s queries: %s", len(queries), queries)
+    pinterest_logger.info("🔢 Images per query: %s", images_per_query)
 
+    # Run async search + download on the shared MCP connection
     pinterest_logger.info("🔌 Connecting to Pinterest MCP server...")
     mcp_start = time.time()
 
     try:
-        results = loop.run_until_complete(search())
-        mcp_time = time.time() - mcp_start
-        pinterest_logger.info(f"✓ MCP diverse search completed in {mcp_time:.2f}s")
+        results, local_paths, mcp_time = run_sync(
+            _search_and_download(list(queries), images_per_query)
+        )
+        download_time = time.time() - mcp_start - mcp_time
+        pinterest_logger.info("✓ MCP diverse search completed in %.2fs", mcp_time)
     except Exception as e:
-        pinterest_logger.error(f"✗ MCP search failed: {e}")
+        pinterest_logger.error("✗ MCP search failed: %s", e)
         import traceback
         traceback.print_exc()
         return []
@@ -187,7 +227,7 @@ def curate_pinterest_images(theme: str, count: int = 15) -> list[dict]:
         pinterest_logger.warning("⚠ No results found from Pinterest")
         return []
 
-    pinterest_logger.info(f"📸 Found {len(results)} diverse Pinterest pins")
+    pinterest_logger.info("📸 Found %s diverse Pinterest pins", len(results))
 
     # Check if using real Pinterest or mock data
     is_mock = any('mock' in r.get('id', '') for r in results[:1])
@@ -197,15 +237,8 @@ def curate_pinterest_images(theme: str, count: int = 15) -> list[dict]:
     else:
         pinterest_logger.info("✓ Using REAL Pinterest data")
 
-    # Download images
-    pinterest_logger.info("⬇ Downloading images to cache...")
-    download_start = time.time()
-
-    image_urls = [img['image_url'] for img in results]
-    local_paths = download_images_sync(image_urls)
-
-    download_time = time.time() - download_start
-    pinterest_logger.info(f"✓ Download completed in {download_time:.2f}s")
+    # Images were downloaded to cache as each query's results arrived
+    pinterest_logger.info("✓ Download completed %.2fs after the last search", download_time)
 
     # Build response with local paths
     curated_images = []
@@ -213,7 +246,7 @@ def curate_pinterest_images(theme: str, count: int = 15) -> list[dict]:
 
     for i, (result, local_path) in enumerate(zip(results, local_paths)):
         if local_path is None:
-            pinterest_logger.warning(f"✗ Failed to download image {i+1}/{len(results)}")
+            pinterest_logger.warning("✗ Failed to download image %s/%s", i+1, len(results))
             failed_count += 1
             continue
 
@@ -239,14 +272,15 @@ def curate_pinterest_images(theme: str, count: int = 15) -> list[dict]:
     total_time = time.time() - start_time
 
     # Final summary
-    pinterest_logger.info("=" * 70)
-    pinterest_logger.info("📊 CURATION SUMMARY")
-    pinterest_logger.info(f"✓ Successfully curated: {len(curated_images)}/{count} images")
+    if pinterest_logger.isEnabledFor(logging.INFO):
+        pinterest_logger.info(_BANNER)
+        pinterest_logger.info("📊 CURATION SUMMARY")
+        pinterest_logger.info("✓ Successfully curated: %s/%s images", len(curated_images), count)
+        pinterest_logger.info("⏱ Total time: %.2fs", total_time)
+        pinterest_logger.info("💾 Images cached for instant reuse")
+        pinterest_logger.info(_BANNER)
     if failed_count > 0:
-        pinterest_logger.warning(f"✗ Failed downloads: {failed_count}")
-    pinterest_logger.info(f"⏱ Total time: {total_time:.2f}s")
-    pinterest_logger.info(f"💾 Images cached for instant reuse")
-    pinterest_logger.info("=" * 70)
+        pinterest_logger.warning("✗ Failed downloads: %s", failed_count)
 
     # Set images for session control - enables prepare_session_preview and start_practice_session
     set_images_for_session(curated_images)
@@ -271,35 +305,22 @@ def curate_pinterest_diverse(queries: list[str], per_query: int = 4) -> list[dic
         List of curated images with local paths
     """
     start_time = time.time()
-    timestamp = datetime.now().strftime("%H:%M:%S")
-
-    pinterest_logger.info("=" * 70)
-    pinterest_logger.info(f"🎨 DIVERSE PINTEREST CURATION - {timestamp}")
-    pinterest_logger.info(f"📝 Queries: {queries}")
-    pinterest_logger.info(f"🔢 Per query: {per_query} images (Total: ~{len(queries) * per_query})")
-    pinterest_logger.info("=" * 70)
-
-    server_path = str(Path(__file__).parent.parent.parent / "mcp_servers" / "pinterest_server.py")
-
-    async def search():
-        async with PinterestMCPClient(server_path) as client:
-            return await client.search_diverse(queries, per_query)
-
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    if pinterest_logger.isEnabledFor(logging.INFO):
+        pinterest_logger.info(_BANNER)
+        pinterest_logger.info("🎨 DIVERSE PINTEREST CURATION - %s", datetime.now().strftime("%H:%M:%S"))
+        pinterest_logger.info("📝 Queries: %s", queries)
+        pinterest_logger.info("🔢 Per query: %s images (Total: ~%s)", per_query, len(queries) * per_query)
+        pinterest_logger.info(_BANNER)
 
     pinterest_logger.info("🔌 Connecting to Pinterest MCP server...")
     mcp_start = time.time()
 
     try:
-        results = loop.run_until_complete(search())
-        mcp_time = time.time() - mcp_start
-        pinterest_logger.info(f"✓ Diverse MCP search completed in {mcp_time:.2f}s")
+        results, local_paths, mcp_time = run_sync(_search_and_download(list(queries), per_query))
+        download_time = time.time() - mcp_start - mcp_time
+        pinterest_logger.info("✓ Diverse MCP search completed in %.2fs", mcp_time)
     except Exception as e:
-        pinterest_logger.error(f"✗ Diverse search failed: {e}")
+        pinterest_logger.error("✗ Diverse search failed: %s", e)
         import traceback
         traceback.print_exc()
         return []
@@ -308,7 +329,7 @@ def curate_pinterest_diverse(queries: list[str], per_query: int = 4) -> list[dic
         pinterest_logger.warning("⚠ No diverse results found")
         return []
 
-    pinterest_logger.info(f"📸 Found {len(results)} diverse Pinterest pins")
+    pinterest_logger.info("📸 Found %s diverse Pinterest pins", len(results))
 
     # Check for mock data
     is_mock = any('mock' in r.get('id', '') for r in results[:1])
@@ -317,15 +338,8 @@ def curate_pinterest_diverse(queries: list[str], per_query: int = 4) -> list[dic
     else:
         pinterest_logger.info("✓ Using REAL Pinterest data")
 
-    # Download
-    pinterest_logger.info("⬇ Downloading diverse images...")
-    download_start = time.time()
-
-    image_urls = [img['image_url'] for img in results]
-    local_paths = download_images_sync(image_urls)
-
-    download_time = time.time() - download_start
-    pinterest_logger.info(f"✓ Download completed in {download_time:.2f}s")
+    # Images were downloaded to cache as each query's results arrived
+    pinterest_logger.info("✓ Download completed %.2fs after the last search", download_time)
 
     # Build response
     curated_images = []
@@ -355,13 +369,14 @@ def curate_pinterest_diverse(queries: list[str], per_query: int = 4) -> list[dic
 
     total_time = time.time() - start_time
 
-    pinterest_logger.info("=" * 70)
-    pinterest_logger.info("📊 DIVERSE CURATION SUMMARY")
-    pinterest_logger.info(f"✓ Successfully curated: {len(curated_images)} images")
+    if pinterest_logger.isEnabledFor(logging.INFO):
+        pinterest_logger.info(_BANNER)
+        pinterest_logger.info("📊 DIVERSE CURATION SUMMARY")
+        pinterest_logger.info("✓ Successfully curated: %s images", len(curated_images))
+        pinterest_logger.info("⏱ Total time: %.2fs", total_time)
+        pinterest_logger.info(_BANNER)
     if failed_count > 0:
-        pinterest_logger.warning(f"✗ Failed downloads: {failed_count}")
-    pinterest_logger.info(f"⏱ Total time: {total_time:.2f}s")
-    pinterest_logger.info("=" * 70)
+        pinterest_logger.warning("✗ Failed downloads: %s", failed_count)
 
     # Set images for session control - enables prepare_session_preview and start_practice_session
     set_images_for_session(curated_images)
@@ -9,15 +9,63 @@ Compare this to pexels_tool.py to see the difference between:
 - MCP-mediated integration (Pinterest)
 """
 
+import logging
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from agno.tools import tool
-from services.mcp_client import search_pinterest_sync
+from services.mcp_client import (
+    get_pinterest_client,
+    reset_pinterest_client,
+    run_sync,
+    search_pinterest_sync,
+)
 from agent.hooks import log_pre_hook
 
+# Child of the 'Pinterest' logger, whose handler feeds the shared log queue
+logger = logging.getLogger("Pinterest.mcp_tool")
+
+SERVER_PATH = str(Path(__file__).parent.parent.parent / "mcp_servers" / "pinterest_server.py")
+
+# (agent key, MCP response key) for the image dicts returned to the agent
+_REMAP = (
+    ("id", "id"),
+    ("url", "image_url"),
+    ("thumbnail", "thumbnail_url"),
+    ("title", "title"),
+    ("description", "description"),
+    ("source", "source_url"),
+    ("creator", "creator"),
+)
+
+
+def _to_agent_format(images: list[dict]) -> list[dict]:
+    """Convert MCP image dicts to the agent-facing format."""
+    return [{key: img.get(mcp_key, "") for key, mcp_key in _REMAP} for img in images]
+
+
+def _unique_queries(queries: list[str]) -> list[str]:
+    """Drop blank and repeated queries ("Ballet dancer" / "ballet dancer "), keeping order."""
+    return list(dict.fromkeys(q.strip().lower() for q in queries if q.strip()))
+
+
+async def _search_each(queries: list[str], per_query: int) -> list[list[dict]]:
+    """
+    Search every query concurrently; one result list per query, in order.
+
+    Runs on the shared background loop (via run_sync) and reuses its
+    connected client instead of a new MCP handshake per call.
+    """
+    client = await get_pinterest_client(SERVER_PATH)
+    try:
+        return await client.search_many(queries, per_query)
+    except Exception:
+        # Reconnect on the next call
+        await reset_pinterest_client(SERVER_PATH)
+        raise
+
 
 @tool(pre_hook=log_pre_hook)
 def search_pinterest_mcp(query: str, count: int = 10) -> list[dict]:
@@ -50,29 +98,18 @@ def search_pinterest_mcp(query: str, count: int = 10) -> list[dict]:
     # This calls the MCP server, which handles the actual Pinterest search
     # The agent doesn't need to know HOW Pinterest is accessed - just that
     # there's an MCP tool that can do it
-    print(f"[Pinterest MCP Tool] Searching via MCP: '{query}' (count: {count})")
+    logger.debug("[Pinterest MCP Tool] Searching via MCP: '%s' (count: %s)", query, count)
 
     try:
         images = search_pinterest_sync(query=query, limit=count)
 
-        print(f"[Pinterest MCP Tool] Found {len(images)} images via MCP")
+        logger.debug("[Pinterest MCP Tool] Found %d images via MCP", len(images))
 
         # Convert MCP response format to agent-friendly format
-        return [
-            {
-                "id": img.get("id", ""),
-                "url": img.get("image_url", ""),
-                "thumbnail": img.get("thumbnail_url", ""),
-                "title": img.get("title", ""),
-                "description": img.get("description", ""),
-                "source": img.get("source_url", ""),
-                "creator": img.get("creator", ""),
-            }
-            for img in images
-        ]
-
-    except Exception as e:
-        print(f"[Pinterest MCP Tool] Error: {e}")
+        return _to_agent_format(images)
+
+    except Exception:
+        logger.exception("[Pinterest MCP Tool] Search failed")
         return []
 
 
@@ -94,47 +131,31 @@ def search_pinterest_diverse_mcp(queries: list[str], per_query: int = 5) -> list
     Returns:
         Combined list of diverse images (typically 15-30 images)
     """
-    print(f"[Pinterest MCP Tool] Diverse search via MCP: {queries}")
+    queries = _unique_queries(queries)
+    logger.debug("[Pinterest MCP Tool] Diverse search via MCP: %s", queries)
+    if not queries:
+        return []
 
     try:
-        # Import here to avoid circular imports
-        import asyncio
-        from services.mcp_client import PinterestMCPClient
-
-        server_path = str(Path(__file__).parent.parent.parent / "mcp_servers" / "pinterest_server.py")
-
-        async def _search():
-            async with PinterestMCPClient(server_path) as client:
-                return await client.search_diverse(queries, per_query)
-
-        # Get or create event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        images = loop.run_until_complete(_search())
-
-        print(f"[Pinterest MCP Tool] Found {len(images)} diverse images")
-
-        return [
-            {
-                "id": img.get("id", ""),
-                "url": img.get("image_url", ""),
-                "thumbnail": img.get("thumbnail_url", ""),
-                "title": img.get("title", ""),
-                "description": img.get("description", ""),
-                "source": img.get("source_url", ""),
-                "creator": img.get("creator", ""),
-            }
-            for img in images
-        ]
-
-    except Exception as e:
-        print(f"[Pinterest MCP Tool] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        results = run_sync(_search_each(queries, per_query))
+
+        # Merge in query order, dropping pins found by an earlier query
+        # and repins of an image already included
+        images, seen = [], set()
+        for query_images in results:
+            for img in query_images:
+                pin_id, image_url = img.get("id"), img.get("image_url")
+                if not (pin_id or image_url) or pin_id in seen or image_url in seen:
+                    continue
+                seen.update(key for key in (pin_id, image_url) if key)
+                images.append(img)
+
+        logger.debug("[Pinterest MCP Tool] Found %d diverse images", len(images))
+
+        return _to_agent_format(images)
+
+    except Exception:
+        logger.exception("[Pinterest MCP Tool] Diverse search failed")
         return []
 
 
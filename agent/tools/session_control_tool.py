@@ -5,48 +5,117 @@ These tools allow the agent to configure and control practice sessions,
 including duration, image count, previews, and session start.
 """
 
+import bisect
 import sys
+import threading
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from agno.tools import tool
 
-# Session configuration singleton - shared between agent and GUI
-_session_config = {
-    "duration_seconds": 60,
-    "image_count": 10,
-    "images": [],
-    "preview_ready": False,
-    "session_started": False,
-    "theme": "",
-}
 
-# Valid duration options (seconds)
+@dataclass(slots=True)
+class SessionConfig:
+    """Session settings shared between the agent's tools and the GUI."""
+
+    duration_seconds: int = 60
+    image_count: int = 10
+    images: list[dict] = field(default_factory=list)
+    preview_ready: bool = False
+    session_started: bool = False
+    theme: str = ""
+
+
+_CONFIG_FIELDS = tuple(f.name for f in fields(SessionConfig))
+
+# Session configuration singleton - shared between agent and GUI
+_session_config = SessionConfig()
+# Guards _session_config: tools can run concurrently with each other and
+# with GUI polling. Reentrant so helpers can be called with it held.
+_lock = threading.RLock()
+
+# Bumped by every tool that may change _session_config; get_current_config()
+# rebuilds its snapshot only when this moves
+_version = 0
+_snapshot_version = -1
+_snapshot: MappingProxyType = MappingProxyType({})
+
+# Valid duration options (seconds), ascending
 VALID_DURATIONS = [30, 60, 120, 300, 600]
 
+# Friendly names for the valid durations
+_DURATION_NAMES = {
+    30: "30 seconds (quick gesture)",
+    60: "1 minute (gesture + shapes)",
+    120: "2 minutes (study)",
+    300: "5 minutes (detailed study)",
+    600: "10 minutes (full study)",
+}
+
 # Max images per session
 MAX_IMAGES = 15
 
 
-def get_current_config() -> dict:
-    """Get the current session configuration (for GUI to access)."""
-    return _session_config.copy()
+def _mark_changed():
+    """Invalidate the get_current_config() snapshot (call with _lock held)."""
+    global _version
+    _version += 1
+
+
+def get_current_config() -> MappingProxyType:
+    """
+    Get the current session configuration (for GUI to access).
+
+    The GUI polls this, so the same read-only snapshot is returned until
+    a tool changes the configuration.
+    """
+    global _snapshot, _snapshot_version
+    with _lock:
+        if _snapshot_version != _version:
+            # Shallow, like dict.copy(): the images list itself is shared
+            _snapshot = MappingProxyType(
+                {name: getattr(_session_config, name) for name in _CONFIG_FIELDS}
+            )
+            _snapshot_version = _version
+        return _snapshot
+
+
+def _normalize_images(images: list[dict]) -> list[dict]:
+    """
+    Take up to MAX_IMAGES images, giving Pexels images an "id" key.
+
+    Images that need the key are copied rather than changed, since the
+    caller (e.g. a curator tool's return value) still holds them.
+    """
+    normalized = []
+    for img in images[:MAX_IMAGES]:
+        if not img.get("id") and "pexels_id" in img:
+            img = {**img, "id": img["pexels_id"]}
+        normalized.append(img)
+    return normalized
 
 
 def set_images_for_session(images: list[dict]):
     """Set images for the session (called after curation)."""
-    _session_config["images"] = images[:MAX_IMAGES]
-    _session_config["preview_ready"] = False
-    _session_config["session_started"] = False
+    normalized = _normalize_images(images)
+    with _lock:
+        _mark_changed()
+        _session_config.images = normalized
+        _session_config.preview_ready = False
+        _session_config.session_started = False
 
 
 def reset_session_state():
     """Reset session state (called when starting new session)."""
-    _session_config["images"] = []
-    _session_config["preview_ready"] = False
-    _session_config["session_started"] = False
+    with _lock:
+        _mark_changed()
+        _session_config.images = []
+        _session_config.preview_ready = False
+        _session_config.session_started = False
 
 
 @tool
@@ -61,24 +130,21 @@ def set_session_duration(seconds: int) -> str:
     Returns:
         Confirmation message
     """
-    if seconds not in VALID_DURATIONS:
-        # Find closest valid duration
-        closest = min(VALID_DURATIONS, key=lambda x: abs(x - seconds))
-        _session_config["duration_seconds"] = closest
-        return f"Duration set to {closest} seconds (closest valid option to {seconds}s). Valid options: {VALID_DURATIONS}"
-
-    _session_config["duration_seconds"] = seconds
+    with _lock:
+        _mark_changed()
+        if seconds not in _DURATION_NAMES:
+            # Closest valid duration: one of the two neighbours of the insertion
+            # point (the shorter one on a tie)
+            i = bisect.bisect_left(VALID_DURATIONS, seconds)
+            lower = VALID_DURATIONS[max(i - 1, 0)]
+            upper = VALID_DURATIONS[min(i, len(VALID_DURATIONS) - 1)]
+            closest = lower if seconds - lower <= upper - seconds else upper
+            _session_config.duration_seconds = closest
+            return f"Duration set to {closest} seconds (closest valid option to {seconds}s). Valid options: {VALID_DURATIONS}"
 
-    # Friendly names
-    duration_names = {
-        30: "30 seconds (quick gesture)",
-        60: "1 minute (gesture + shapes)",
-        120: "2 minutes (study)",
-        300: "5 minutes (detailed study)",
-        600: "10 minutes (full study)",
-    }
+        _session_config.duration_seconds = seconds
 
-    return f"Duration set to {duration_names.get(seconds, f'{seconds} seconds')}"
+        return f"Duration set to {_DURATION_NAMES[seconds]}"
 
 
 @tool
@@ -92,21 +158,23 @@ def set_image_count(count: int) -> str:
     Returns:
         Confirmation message
     """
-    if count < 1:
-        count = 1
-    elif count > MAX_IMAGES:
-        count = MAX_IMAGES
+    with _lock:
+        _mark_changed()
+        if count < 1:
+            count = 1
+        elif count > MAX_IMAGES:
+            count = MAX_IMAGES
 
-    _session_config["image_count"] = count
+        _session_config.image_count = count
 
-    # Trim images if we have more than needed
-    if len(_session_config["images"]) > count:
-        _session_config["images"] = _session_config["images"][:count]
+        # Trim images if we have more than needed
+        if len(_session_config.images) > count:
+            _session_config.images = _session_config.images[:count]
 
-    total_time = count * _session_config["duration_seconds"]
-    minutes = total_time // 60
+        total_time = count * _session_config.duration_seconds
+        minutes = total_time // 60
 
-    return f"Image count set to {count}. Total session time: ~{minutes} minutes"
+        return f"Image count set to {count}. Total session time: ~{minutes} minutes"
 
 
 @tool
@@ -117,14 +185,15 @@ def get_session_config() -> dict:
     Returns:
         Dict with duration_seconds, image_count, images_loaded, preview_ready
     """
-    return {
-        "duration_seconds": _session_config["duration_seconds"],
-        "image_count": _session_config["image_count"],
-        "images_loaded": len(_session_config["images"]),
-        "preview_ready": _session_config["preview_ready"],
-        "theme": _session_config["theme"],
-        "total_time_minutes": (_session_config["duration_seconds"] * _session_config["image_count"]) // 60,
-    }
+    with _lock:
+        return {
+            "duration_seconds": _session_config.duration_seconds,
+            "image_count": _session_config.image_count,
+            "images_loaded": len(_session_config.images),
+            "preview_ready": _session_config.preview_ready,
+            "theme": _session_config.theme,
+            "total_time_minutes": (_session_config.duration_seconds * _session_config.image_count) // 60,
+        }
 
 
 @tool
@@ -141,44 +210,40 @@ def prepare_session_preview(images: Optional[list[dict]] = None) -> dict:
     Returns:
         Dict with preview status and image count
     """
-    if images:
-        # Normalize image keys
-        normalized = []
-        for img in images[:MAX_IMAGES]:
-            normalized_img = dict(img)
-            if "pexels_id" in normalized_img and "id" not in normalized_img:
-                normalized_img["id"] = normalized_img["pexels_id"]
-            normalized.append(normalized_img)
-        _session_config["images"] = normalized
-
-    if not _session_config["images"]:
+    with _lock:
+        _mark_changed()
+        if images:
+            _session_config.images = _normalize_images(images)
+
+        if not _session_config.images:
+            return {
+                "success": False,
+                "message": "No images available for preview. Please search for images first.",
+                "image_count": 0,
+            }
+
+        _session_config.preview_ready = True
+
+        # Return preview info - GUI will handle displaying thumbnails
+        # (ids were normalized when the images were stored)
+        preview_images = []
+        for img in _session_config.images[:_session_config.image_count]:
+            preview_images.append({
+                "id": img.get("id"),
+                "thumbnail": img.get("thumbnail"),
+                "alt": img.get("alt", "Reference photo"),
+                "photographer": img.get("photographer", "Unknown"),
+            })
+
         return {
-            "success": False,
-            "message": "No images available for preview. Please search for images first.",
-            "image_count": 0,
+            "success": True,
+            "message": f"Preview ready with {len(preview_images)} images. Ask the user if they'd like to start or see different images.",
+            "image_count": len(preview_images),
+            "images": preview_images,
+            "duration_per_image": _session_config.duration_seconds,
+            "total_time_minutes": (_session_config.duration_seconds * len(preview_images)) // 60,
         }
 
-    _session_config["preview_ready"] = True
-
-    # Return preview info - GUI will handle displaying thumbnails
-    preview_images = []
-    for img in _session_config["images"][:_session_config["image_count"]]:
-        preview_images.append({
-            "id": img.get("id") or img.get("pexels_id"),
-            "thumbnail": img.get("thumbnail"),
-            "alt": img.get("alt", "Reference photo"),
-            "photographer": img.get("photographer", "Unknown"),
-        })
-
-    return {
-        "success": True,
-        "message": f"Preview ready with {len(preview_images)} images. Ask the user if they'd like to start or see different images.",
-        "image_count": len(preview_images),
-        "images": preview_images,
-        "duration_per_image": _session_config["duration_seconds"],
-        "total_time_minutes": (_session_config["duration_seconds"] * len(preview_images)) // 60,
-    }
-
 
 @tool
 def start_practice_session(theme: str = "") -> dict:
@@ -196,34 +261,36 @@ def start_practice_session(theme: str = "") -> dict:
     Returns:
         Dict with session start status
     """
-    if not _session_config["images"]:
-        return {
-            "success": False,
-            "message": "No images loaded. Please search for images first.",
-            "action": "search_images",
-        }
+    with _lock:
+        _mark_changed()
+        if not _session_config.images:
+            return {
+                "success": False,
+                "message": "No images loaded. Please search for images first.",
+                "action": "search_images",
+            }
+
+        if not _session_config.preview_ready:
+            return {
+                "success": False,
+                "message": "Please show the user a preview first before starting.",
+                "action": "prepare_preview",
+            }
+
+        # Mark session as ready to start - GUI will pick this up
+        _session_config.session_started = True
+        _session_config.theme = theme
+
+        count = min(_session_config.image_count, len(_session_config.images))
+        duration = _session_config.duration_seconds
+        total_minutes = (count * duration) // 60
 
-    if not _session_config["preview_ready"]:
         return {
-            "success": False,
-            "message": "Please show the user a preview first before starting.",
-            "action": "prepare_preview",
+            "success": True,
+            "message": f"Starting {theme or 'practice'} session! {count} images, {duration} seconds each ({total_minutes} minutes total). Good luck!",
+            "image_count": count,
+            "duration_seconds": duration,
+            "total_time_minutes": total_minutes,
+            "theme": theme,
+            "action": "session_starting",
         }
-
-    # Mark session as ready to start - GUI will pick this up
-    _session_config["session_started"] = True
-    _session_config["theme"] = theme
-
-    count = min(_session_config["image_count"], len(_session_config["images"]))
-    duration = _session_config["duration_seconds"]
-    total_minutes = (count * duration) // 60
-
-    return {
-        "success": True,
-        "message": f"Starting {theme or 'practice'} session! {count} images, {duration} seconds each ({total_minutes} minutes total). Good luck!",
-        "image_count": count,
-        "duration_seconds": duration,
-        "total_time_minutes": total_minutes,
-        "theme": theme,
-        "action": "session_starting",
-    }
@@ -10,10 +10,18 @@ from agno.tools import tool
 # History of tips given in this session
 _tips_history: list[dict] = []
 
+# Lowercased practice focus -> most recent tips for it, ordered by when
+# each focus was last recorded
+_tips_by_focus: dict[str, dict] = {}
+
 
 def record_tips(tips: dict):
     """Record tips that were shown to the user."""
     _tips_history.append(tips)
+    focus_lower = tips.get("practice_focus", "").lower()
+    # Re-insert so the dict order tracks recency
+    _tips_by_focus.pop(focus_lower, None)
+    _tips_by_focus[focus_lower] = tips
 
 
 def get_tips_history() -> list[dict]:
@@ -25,6 +33,7 @@ def clear_tips_history():
     """Clear the tips history."""
     global _tips_history
     _tips_history = []
+    _tips_by_focus.clear()
 
 
 @tool
@@ -52,14 +61,15 @@ def get_practice_tips(practice_focus: str = "") -> dict:
     # Filter by focus if provided
     if practice_focus:
         focus_lower = practice_focus.lower()
-        matching = [
-            t for t in _tips_history
-            if focus_lower in t.get("practice_focus", "").lower()
-        ]
-        if matching:
+        # Most recent topic containing the filter (one entry per topic)
+        tips = next(
+            (t for focus, t in reversed(_tips_by_focus.items()) if focus_lower in focus),
+            None,
+        )
+        if tips is not None:
             return {
                 "found": True,
-                "tips": matching[-1],  # Most recent matching tips
+                "tips": tips,  # Most recent matching tips
                 "total_history": len(_tips_history),
             }
         else:
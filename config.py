@@ -1,7 +1,14 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Parse .env once per process tree: child processes inherit both the
+# loaded variables and this marker
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
+
+# Project directory (paths below are relative to it)
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
 PEXELS_API_KEY = os.getenv("PEXELS_API_KEY", "")
 
@@ -28,14 +35,11 @@ PEXELS_BASE_URL = "https://api.pexels.com/v1"
 DEFAULT_TIMER_MINUTES = 1
 DEFAULT_PHOTOS_COUNT = 10
 
-CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+CACHE_DIR = os.path.join(_HERE, ".cache")
 
 # SQLite Configuration for Image Curation Memory
 # Database file stored in project directory for portability (no server needed)
-SQLITE_DB_PATH = os.getenv(
-    "SQLITE_DB_PATH",
-    os.path.join(os.path.dirname(__file__), "timed_reference.db")
-)
+SQLITE_DB_PATH = os.getenv("SQLITE_DB_PATH") or os.path.join(_HERE, "timed_reference.db")
 
 # Session and History Settings
 SESSION_HISTORY_DAYS = int(os.getenv("SESSION_HISTORY_DAYS", "30"))
@@ -46,6 +50,9 @@ NEGATIVE_FEEDBACK_DECAY = float(os.getenv("NEGATIVE_FEEDBACK_DECAY", "0.8"))
 POSITIVE_FEEDBACK_BOOST = float(os.getenv("POSITIVE_FEEDBACK_BOOST", "1.2"))
 FRESHNESS_BONUS = float(os.getenv("FRESHNESS_BONUS", "0.1"))
 
+# Logging (DEBUG shows per-call subagent tracing)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 # Token Optimization Settings
 USE_MINIMAL_PROMPTS = os.getenv("USE_MINIMAL_PROMPTS", "false").lower() == "true"
 CACHE_AGENT_RESPONSES = os.getenv("CACHE_AGENT_RESPONSES", "true").lower() == "true"
@@ -4,9 +4,14 @@ Practice session window with image viewer and timer.
 Includes session tracking, image feedback, and progress reporting.
 """
 
+import logging
+import math
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -21,45 +26,308 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
+from PySide6.QtCore import Qt, QTimer, QEvent, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QPixmap, QImage, QFont, QKeySequence, QShortcut
 
+from agent.logging_setup import queue_handler
 from services.image_cache import image_cache
 from services.session_store import session_store
 from services.image_scorer import image_scorer
 from services.memory_store import memory_store
 
+logger = logging.getLogger("tr.gui")
+logger.addHandler(queue_handler())
+logger.propagate = False
+# Keep a level already chosen by the entry point (main.py)
+if logger.level == logging.NOTSET:
+    logger.setLevel(logging.INFO)
 
-class ImageLoader(QThread):
-    """Background thread for loading images."""
+try:
+    # libjpeg-turbo JPEG decoder, faster than Qt's stock image plugin
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
 
-    # Use QImage instead of QPixmap for thread safety (QPixmap must be created in main thread)
-    image_loaded = Signal(QImage)
-    error = Signal(str)
+JPEG_SUFFIXES = (".jpg", ".jpeg")
 
-    def __init__(self, url: str):
+# simplejpeg colorspace whose byte order matches QImage.Format_RGB32
+# (0xffRRGGBB words), so decoded JPEGs need no conversion pass
+_RGB32_COLORSPACE = "BGRX" if sys.byteorder == "little" else "XRGB"
+
+
+def _jpeg_min_size(data: bytes, max_size: tuple[int, int]) -> tuple[int, int]:
+    """
+    Smallest (width, height) a JPEG must decode to so that fitting it
+    into max_size never upscales.
+    """
+    height, width = simplejpeg.decode_jpeg_header(data)[:2]
+    fit = min(max_size[0] / width, max_size[1] / height, 1.0)
+    return math.ceil(width * fit), math.ceil(height * fit)
+
+
+def decode_image(path: Path, max_size: Optional[tuple[int, int]] = None) -> QImage:
+    """
+    Decode an image file into a QImage (safe to call off the main thread).
+
+    JPEGs go through simplejpeg when it is installed; other formats, and
+    files that turn out not to be JPEGs, use Qt's image plugins. The
+    result is always RGB32 (ARGB32_Premultiplied if it has alpha), the
+    formats QPixmap takes as-is, so that conversion happens here rather
+    than on the GUI thread.
+
+    Args:
+        path: Image file
+        max_size: Optional (width, height) the image will be shown at
+            most. Large JPEGs are then decoded at a reduced DCT scale
+            (1/2, 1/4 or 1/8) that still covers it, skipping most of the
+            IDCT work; the result can still be larger than max_size.
+    """
+    if simplejpeg is not None and path.suffix.lower() in JPEG_SUFFIXES:
+        data = path.read_bytes()
+        try:
+            min_width, min_height = _jpeg_min_size(data, max_size) if max_size else (0, 0)
+            pixels = simplejpeg.decode_jpeg(
+                data, colorspace=_RGB32_COLORSPACE, min_width=min_width, min_height=min_height
+            )
+        except ValueError:
+            pass
+        else:
+            height, width = pixels.shape[:2]
+            # copy(): the QImage must own its pixels once the array is freed
+            return QImage(pixels.data, width, height, 4 * width, QImage.Format_RGB32).copy()
+
+    image = QImage(str(path))
+    if image.hasAlphaChannel():
+        return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return image.convertToFormat(QImage.Format_RGB32)
+
+
+def fit_to_screen(pixmap: QPixmap, widget: QWidget) -> QPixmap:
+    """
+    Downscale a pixmap larger than the widget's screen to fit it.
+
+    The label never shows more pixels than the screen has, so keeping a
+    bounded copy makes every later resize rescale a smaller buffer.
+    """
+    screen = widget.screen()
+    if screen is None:
+        return pixmap
+    bounds = screen.geometry().size()
+    if pixmap.width() <= bounds.width() and pixmap.height() <= bounds.height():
+        return pixmap
+    return pixmap.scaled(bounds, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+# Countdown tick (ms): the time shown is computed from a monotonic
+# deadline, so ticks only set how promptly it updates
+TICK_INTERVAL_MS = 250
+# Tick while the session is minimized or hidden, to save wakeups
+IDLE_TICK_INTERVAL_MS = 2000
+
+# Images decoded ahead of the one on screen
+PREFETCH_AHEAD = 3
+
+_loader_pool: QThreadPool = None
+
+
+def _get_loader_pool() -> QThreadPool:
+    """Thread pool shared by every session's image loads (created on first use)."""
+    global _loader_pool
+    if _loader_pool is None:
+        _loader_pool = QThreadPool()
+        _loader_pool.setMaxThreadCount(4)
+    return _loader_pool
+
+
+# Image interactions buffered before they are written to the database
+INTERACTION_FLUSH_EVERY = 5
+
+_writer_pool: QThreadPool = None
+
+
+def _get_writer_pool() -> QThreadPool:
+    """Single-thread pool for session database writes (keeps them in order)."""
+    global _writer_pool
+    if _writer_pool is None:
+        _writer_pool = QThreadPool()
+        _writer_pool.setMaxThreadCount(1)
+    return _writer_pool
+
+
+def write_interactions(session_id: int, interactions: list[tuple]):
+    """Store (pexels_id, time_spent, skipped) interactions in one transaction each."""
+    try:
+        session_store.record_image_interactions(session_id, interactions)
+        memory_store.update_images_usage([pexels_id for pexels_id, _, _ in interactions])
+    except Exception as e:
+        print(f"[SESSION] Failed to record interactions: {e}")
+
+
+class InteractionWriteTask(QRunnable):
+    """Writes a batch of image interactions on the writer pool."""
+
+    def __init__(self, session_id: int, interactions: list[tuple]):
+        super().__init__()
+        self.session_id = session_id
+        self.interactions = interactions
+
+    def run(self):
+        write_interactions(self.session_id, self.interactions)
+
+
+class ImageLoadTask(QRunnable):
+    """Downloads and decodes one session image on the loader pool."""
+
+    def __init__(self, prefetcher: "ImagePrefetcher", index: int, url: str):
         super().__init__()
+        self.prefetcher = prefetcher
+        self.index = index
         self.url = url
 
     def run(self):
+        prefetcher = self.prefetcher
+        # The user may have moved on (or ended the session) while this was queued
+        if not prefetcher.is_wanted(self.index):
+            prefetcher.task_finished.emit(self.index, QImage(), "")
+            return
         try:
-            if self.isInterruptionRequested():
-                return
-            print(f"[IMAGE_LOADER] Downloading: {self.url}")
+            logger.debug("[IMAGE_LOADER] Downloading: %s", self.url)
             path = image_cache.download(self.url)
-            print(f"[IMAGE_LOADER] Path: {path}, exists: {path.exists() if hasattr(path, 'exists') else 'N/A'}")
             # Load as QImage (thread-safe) instead of QPixmap
-            image = QImage(str(path))
-            print(f"[IMAGE_LOADER] QImage isNull: {image.isNull()}, size: {image.size()}")
+            image = decode_image(Path(path), prefetcher.max_size)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[IMAGE_LOADER] Decoded %s: %dx%d", path, image.width(), image.height()
+                )
             if not image.isNull():
-                self.image_loaded.emit(image)
+                prefetcher.task_finished.emit(self.index, image, "")
             else:
-                self.error.emit("Failed to load image")
+                prefetcher.task_finished.emit(self.index, QImage(), "Failed to load image")
         except Exception as e:
-            print(f"[IMAGE_LOADER] Error: {e}")
-            import traceback
-            traceback.print_exc()
-            self.error.emit(str(e))
+            logger.exception("[IMAGE_LOADER] Failed to load %s", self.url)
+            prefetcher.task_finished.emit(self.index, QImage(), str(e))
+
+
+class ImagePrefetcher(QObject):
+    """
+    Loads a session's images on the shared pool, keeping the next few
+    decoded ahead of the one on screen so moving to them is instant.
+
+    Create without a parent: queued ImageLoadTasks keep it alive until
+    they finish, even after the session's widget is gone.
+    """
+
+    # (photo index, image) for the current photo
+    image_loaded = Signal(int, QImage)
+    # (photo index, message) for the current photo
+    error = Signal(int, str)
+    # Emitted by ImageLoadTask from pool threads: (index, image or null, error or "")
+    task_finished = Signal(int, QImage, str)
+
+    def __init__(self, urls: list, max_size: Optional[tuple[int, int]] = None):
+        """
+        Args:
+            urls: Photo URLs in session order (None/"" for photos without one)
+            max_size: (width, height) the photos are shown at most; lets
+                large JPEGs decode at a reduced scale
+        """
+        super().__init__()
+        self.urls = urls
+        self.max_size = max_size
+        self.current = 0
+        self.cancelled = False
+        self._images: dict[int, QImage] = {}
+        self._queued: set[int] = set()
+        # Lives in the main thread, so results arrive there as queued calls
+        self.task_finished.connect(self._on_task_finished)
+
+    def is_wanted(self, index: int) -> bool:
+        """Whether index is still worth loading (read from pool threads)."""
+        return not self.cancelled and self.current - 1 <= index <= self.current + PREFETCH_AHEAD
+
+    def request(self, index: int, load_current: bool = True):
+        """
+        Show photo `index`: emits image_loaded for it (right away if it is
+        already decoded) and starts loading the photos after it.
+
+        Pass load_current=False when the caller already has the photo
+        (e.g. a cached pixmap) and only wants the ones after it prefetched.
+        """
+        self.current = index
+        # Keep only the previous, current and upcoming images decoded
+        for stale in [i for i in self._images if not self.is_wanted(i)]:
+            del self._images[stale]
+
+        first = index if load_current else index + 1
+        if load_current and index in self._images:
+            self.image_loaded.emit(index, self._images[index])
+
+        for i in range(first, min(index + PREFETCH_AHEAD, len(self.urls) - 1) + 1):
+            if i in self._images or i in self._queued or not self.urls[i]:
+                continue
+            self._queued.add(i)
+            _get_loader_pool().start(ImageLoadTask(self, i, self.urls[i]))
+
+    def cancel(self):
+        """Stop loading: queued tasks exit without downloading."""
+        self.cancelled = True
+        self._images.clear()
+
+    def _on_task_finished(self, index: int, image: QImage, error: str):
+        self._queued.discard(index)
+        if self.cancelled:
+            return
+        if not image.isNull():
+            if self.is_wanted(index):
+                self._images[index] = image
+            if index == self.current:
+                self.image_loaded.emit(index, image)
+        elif error:
+            if index == self.current:
+                self.error.emit(index, error)
+        elif self.is_wanted(index):
+            # Skipped as unwanted, but the user came back to it meanwhile
+            self._queued.add(index)
+            _get_loader_pool().start(ImageLoadTask(self, index, self.urls[index]))
+
+
+class PixmapCache:
+    """
+    Small LRU of display-ready pixmaps keyed by photo URL, so going back
+    to a recent photo skips the download, decode and QImage conversion.
+
+    Bounded by entry count and by total pixel bytes, since photo sizes
+    vary widely.
+    """
+
+    def __init__(self, max_items: int = 8, max_bytes: int = 256 * 1024 * 1024):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._pixmaps: OrderedDict[str, QPixmap] = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def _size(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def get(self, url: str) -> Optional[QPixmap]:
+        pixmap = self._pixmaps.get(url)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(url)
+        return pixmap
+
+    def put(self, url: str, pixmap: QPixmap):
+        old = self._pixmaps.pop(url, None)
+        if old is not None:
+            self._bytes -= self._size(old)
+        self._pixmaps[url] = pixmap
+        self._bytes += self._size(pixmap)
+        # Evict least recently shown, but always keep the newest
+        while len(self._pixmaps) > 1 and (
+            len(self._pixmaps) > self.max_items or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= self._size(evicted)
 
 
 class TimerWidget(QFrame):
@@ -114,51 +382,53 @@ class TimerWidget(QFrame):
             self.time_label.setStyleSheet("color: white;")
 
 
-class PracticeSessionWindow(QMainWindow):
-    """Full practice session window with image display and timer."""
-
-    # Signal emitted when session completes: (total_minutes, images_completed)
-    session_completed = Signal(int, int)
+class _PracticeSessionMixin:
+    """
+    Session logic shared by PracticeSessionWindow and EmbeddedPracticeWidget:
+    the session UI, countdown, image loading, feedback and session records.
 
-    def __init__(
-        self,
-        photos: list,
-        duration_seconds: int,
-        play_sound: bool = True,
-        tips: dict = None,
-        theme: str = "",
-        session_id: int = None,
-        parent=None,
-    ):
-        super().__init__(parent)
-        self.photos = photos
-        self.duration_seconds = duration_seconds
-        self.play_sound = play_sound
-        self.tips = tips or {}
-        self.theme = theme
+    List it before the Qt base class so its event handlers take effect.
+    Hosts define the session_completed signal, and override _leave_session()
+    if closing the widget is not how they leave a finished session.
+    """
 
+    def _init_session_state(self):
+        """Set up per-widget state (call from the host's __init__)."""
         self.current_index = 0
-        self.time_remaining = duration_seconds
         self.is_paused = False
+        self.prefetcher = None
+        self._pixmap_cache = PixmapCache()
+        # (pexels_id, time_spent, skipped) not yet written
+        self._pending_interactions: list[tuple] = []
+        # Last scaled copy shown in image_label, reused while its size holds
+        self._scaled_key = None
+        self._scaled_pixmap = QPixmap()
+        # Coalesces a drag-resize into one rescale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._scale_current_image)
+
+    def _leave_session(self):
+        """Leave the session view once the session has ended (closes the widget)."""
+        self.close()
 
-        # Session tracking
-        self.session_id = session_id
-        self.session_start_time = datetime.now()
-        self.image_start_time = datetime.now()
-        self.images_completed = 0
-
-        # Create session record if not provided
-        if self.session_id is None:
-            self._create_session_record()
-
-        self.setWindowTitle("Practice Session")
-        self.setMinimumSize(1024, 768)
-
-        self._setup_ui()
-        self._setup_shortcuts()
-        self._setup_timer()
-
-        self._load_current_image()
+    def _start_prefetcher(self):
+        """Load this session's photos on the shared loader pool."""
+        # Drop any earlier session's loads
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        # Decode for the whole screen rather than the label, so cached
+        # pixmaps stay sharp when the window is resized or maximized
+        screen = self.screen()
+        max_size = (screen.geometry().width(), screen.geometry().height()) if screen else None
+        urls = [photo.get("url") for photo in self.photos]
+        # Fetch every photo over the shared connection pool up front; the
+        # loader tasks then mostly just decode files already on disk
+        image_cache.prefetch(urls)
+        self.prefetcher = ImagePrefetcher(urls, max_size)
+        self.prefetcher.image_loaded.connect(self._on_image_loaded)
+        self.prefetcher.error.connect(self._on_image_error)
 
     def _create_session_record(self):
         """Create a session record in the database."""
@@ -169,20 +439,22 @@ class PracticeSessionWindow(QMainWindow):
                 total_images=len(self.photos)
             )
             # Add images to session
+            images = []
             for i, photo in enumerate(self.photos):
                 pexels_id = photo.get('id') or photo.get('pexels_id')
                 if pexels_id:
-                    session_store.add_session_image(self.session_id, pexels_id, i)
+                    images.append((pexels_id, i))
+            session_store.add_session_images(self.session_id, images)
         except Exception as e:
             print(f"[SESSION] Failed to create session record: {e}")
             self.session_id = None
 
-    def _setup_ui(self):
-        central = QWidget()
-        self.setCentralWidget(central)
-        layout = QVBoxLayout(central)
+    def _build_session_ui(self, root: QWidget):
+        """Build the image view, overlay and controls inside root."""
+        layout = QVBoxLayout(root)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        # Image container
         self.image_container = QWidget()
         self.image_container.setStyleSheet("background-color: #1a1a1a;")
         image_layout = QVBoxLayout(self.image_container)
@@ -194,11 +466,13 @@ class PracticeSessionWindow(QMainWindow):
 
         layout.addWidget(self.image_container, 1)
 
-        overlay_container = QWidget(self.image_container)
-        overlay_container.setAttribute(Qt.WA_TranslucentBackground)
-        overlay_layout = QVBoxLayout(overlay_container)
+        # Overlay for timer and controls
+        self.overlay = QWidget(self.image_container)
+        self.overlay.setAttribute(Qt.WA_TranslucentBackground)
+        overlay_layout = QVBoxLayout(self.overlay)
         overlay_layout.setContentsMargins(20, 20, 20, 20)
 
+        # Top bar with counter and timer
         top_bar = QHBoxLayout()
 
         self.counter_label = QLabel()
@@ -217,6 +491,7 @@ class PracticeSessionWindow(QMainWindow):
         overlay_layout.addLayout(top_bar)
         overlay_layout.addStretch()
 
+        # Controls
         controls = QFrame()
         controls.setStyleSheet(
             "background-color: rgba(0, 0, 0, 0.7); border-radius: 10px;"
@@ -260,6 +535,7 @@ class PracticeSessionWindow(QMainWindow):
 
         overlay_layout.addWidget(controls)
 
+        # Credit label
         credit_frame = QFrame()
         credit_frame.setStyleSheet(
             "background-color: rgba(0, 0, 0, 0.5); border-radius: 5px;"
@@ -273,14 +549,13 @@ class PracticeSessionWindow(QMainWindow):
 
         overlay_layout.addWidget(credit_frame)
 
-        overlay_container.setGeometry(0, 0, self.width(), self.height())
-        self.overlay = overlay_container
+        self.overlay.setGeometry(0, 0, self.width(), self.height())
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if hasattr(self, "overlay"):
             self.overlay.setGeometry(0, 0, self.width(), self.height())
-        self._scale_current_image()
+        self._resize_timer.start()
 
     def _button_style(self, color: str = "#4CAF50") -> str:
         return f"""
@@ -304,30 +579,37 @@ class PracticeSessionWindow(QMainWindow):
         QShortcut(QKeySequence(Qt.Key_Space), self, self._toggle_pause)
         QShortcut(QKeySequence(Qt.Key_Right), self, self._next_image)
         QShortcut(QKeySequence(Qt.Key_Left), self, self._prev_image)
-        QShortcut(QKeySequence(Qt.Key_Escape), self, self._end_session)
 
-    def _setup_timer(self):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.timer.start(1000)
+    def _start_timer(self):
+        """Start the countdown for the first photo."""
+        self.time_remaining = self.duration_seconds
+        self.deadline = time.monotonic() + self.duration_seconds
+        self.pause_monotonic = time.monotonic()
+        if not hasattr(self, "timer"):
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self._tick)
+        self.timer.start(TICK_INTERVAL_MS)
 
     def _tick(self):
         if self.is_paused:
             return
 
-        self.time_remaining -= 1
-        self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
+        remaining = max(0, math.ceil(self.deadline - time.monotonic()))
+        if remaining != self.time_remaining:
+            self.time_remaining = remaining
+            self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
 
         if self.time_remaining <= 0:
             self._on_timer_end()
 
-    def _on_timer_end(self):
-        if self.play_sound:
-            try:
-                from PySide6.QtMultimedia import QSoundEffect
-            except ImportError:
-                pass
+    def _restart_countdown(self):
+        """Give the current photo the full duration again."""
+        self.time_remaining = self.duration_seconds
+        self.deadline = time.monotonic() + self.duration_seconds
+        self.pause_monotonic = time.monotonic()
+        self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
 
+    def _on_timer_end(self):
         if self.current_index < len(self.photos) - 1:
             self._next_image()
         else:
@@ -349,39 +631,53 @@ class PracticeSessionWindow(QMainWindow):
         else:
             self.credit_label.setText(f"Photo by {photographer} on Pexels")
 
-        url = photo.get("url")
-        if url:
+        # Recently shown photo: display it now, only prefetch the next ones
+        pixmap = self._pixmap_cache.get(photo.get("url"))
+        if pixmap is not None:
+            self.current_pixmap = pixmap
+            self._scale_current_image()
+            self.prefetcher.request(self.current_index, load_current=False)
+            return
+
+        if photo.get("url"):
             self.image_label.setText("Loading...")
-            # Stop any previous loader before starting a new one
-            if hasattr(self, "loader") and self.loader and self.loader.isRunning():
-                self.loader.requestInterruption()
-                self.loader.wait()
-            self.loader = ImageLoader(url)
-            self.loader.image_loaded.connect(self._on_image_loaded)
-            self.loader.error.connect(self._on_image_error)
-            self.loader.start()
-
-    def _on_image_loaded(self, image: QImage):
-        print(f"[IMAGE] _on_image_loaded called, image size: {image.size()}")
+        # Shows the photo as soon as it is decoded (immediately if it was
+        # prefetched) and starts on the ones after it
+        self.prefetcher.request(self.current_index)
+
+    def _on_image_loaded(self, index: int, image: QImage):
+        if index != self.current_index:
+            return
         # Convert QImage to QPixmap in the main thread (thread-safe)
-        self.current_pixmap = QPixmap.fromImage(image)
-        print(f"[IMAGE] Pixmap created, isNull: {self.current_pixmap.isNull()}")
+        url = self.photos[index].get("url")
+        self.current_pixmap = self._pixmap_cache.get(url)
+        if self.current_pixmap is None:
+            # decode_image() already produced a native pixmap format
+            pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion | Qt.NoOpaqueDetection)
+            self.current_pixmap = fit_to_screen(pixmap, self)
+            self._pixmap_cache.put(url, self.current_pixmap)
         self._scale_current_image()
 
     def _scale_current_image(self):
         if not hasattr(self, "current_pixmap") or self.current_pixmap.isNull():
-            print("[IMAGE] _scale_current_image: no valid pixmap")
             return
 
         available_size = self.image_label.size()
-        print(f"[IMAGE] Scaling to: {available_size}")
-        scaled = self.current_pixmap.scaled(
-            available_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        print(f"[IMAGE] Setting pixmap, scaled size: {scaled.size()}")
-        self.image_label.setPixmap(scaled)
+        key = (self.current_pixmap.cacheKey(), available_size.width(), available_size.height())
+        if key != self._scaled_key:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[IMAGE] Scaling to %dx%d", available_size.width(), available_size.height()
+                )
+            self._scaled_pixmap = self.current_pixmap.scaled(
+                available_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            self._scaled_key = key
+        self.image_label.setPixmap(self._scaled_pixmap)
 
-    def _on_image_error(self, error: str):
+    def _on_image_error(self, index: int, error: str):
+        if index != self.current_index:
+            return
         self.image_label.setText(f"Failed to load image: {error}")
 
     def _next_image(self, skipped: bool = False):
@@ -390,8 +686,7 @@ class PracticeSessionWindow(QMainWindow):
 
         if self.current_index < len(self.photos) - 1:
             self.current_index += 1
-            self.time_remaining = self.duration_seconds
-            self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
+            self._restart_countdown()
             self.image_start_time = datetime.now()
             self._load_current_image()
         else:
@@ -400,13 +695,17 @@ class PracticeSessionWindow(QMainWindow):
     def _prev_image(self):
         if self.current_index > 0:
             self.current_index -= 1
-            self.time_remaining = self.duration_seconds
-            self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
+            self._restart_countdown()
             self.image_start_time = datetime.now()
             self._load_current_image()
 
     def _toggle_pause(self):
         self.is_paused = not self.is_paused
+        if self.is_paused:
+            self.pause_monotonic = time.monotonic()
+        else:
+            # The paused span doesn't count against the photo
+            self.deadline += time.monotonic() - self.pause_monotonic
         self.pause_btn.setText("Resume" if self.is_paused else "Pause")
 
     def _record_image_interaction(self, skipped: bool = False):
@@ -421,18 +720,24 @@ class PracticeSessionWindow(QMainWindow):
 
         time_spent = int((datetime.now() - self.image_start_time).total_seconds())
 
-        try:
-            session_store.record_image_interaction(
-                session_id=self.session_id,
-                pexels_id=pexels_id,
-                time_spent=time_spent,
-                skipped=skipped
-            )
-            # Update image usage count
-            memory_store.update_image_usage(pexels_id)
-            self.images_completed += 1
-        except Exception as e:
-            print(f"[SESSION] Failed to record interaction: {e}")
+        # Buffered, then written (with the usage counts) in batches
+        self._pending_interactions.append((pexels_id, time_spent, skipped))
+        self.images_completed += 1
+        if len(self._pending_interactions) >= INTERACTION_FLUSH_EVERY:
+            self._flush_interactions()
+
+    def _flush_interactions(self, wait: bool = False):
+        """
+        Write buffered interactions on the writer thread, or, with wait,
+        right here once earlier batches are done (for session end).
+        """
+        interactions, self._pending_interactions = self._pending_interactions, []
+        if wait:
+            _get_writer_pool().waitForDone()
+            if interactions and self.session_id is not None:
+                write_interactions(self.session_id, interactions)
+        elif interactions and self.session_id is not None:
+            _get_writer_pool().start(InteractionWriteTask(self.session_id, interactions))
 
     def _on_positive_feedback(self):
         """Handle positive feedback for current image."""
@@ -473,7 +778,15 @@ class PracticeSessionWindow(QMainWindow):
     def _restore_credit_label(self, text: str):
         """Restore the credit label to original text."""
         self.credit_label.setText(text)
-        self.credit_label.setStyleSheet("color: white; font-size: 12px;")
+        self.credit_label.setStyleSheet("color: white; font-size: 14px;")
+
+    def _stop_session_activity(self):
+        """Stop the countdown and any image loads still queued."""
+        if hasattr(self, "timer"):
+            self.timer.stop()
+        # Running loads finish on their own
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
 
     def _end_session(self):
         reply = QMessageBox.question(
@@ -484,24 +797,14 @@ class PracticeSessionWindow(QMainWindow):
             QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
-            self.timer.stop()
-            if hasattr(self, "loader") and self.loader and self.loader.isRunning():
-                self.loader.requestInterruption()
-                self.loader.wait()
-
             # Complete session as abandoned
             self._finalize_session(status='abandoned')
-            self.close()
+            self._leave_session()
 
     def _session_complete(self):
         # Record the last image
         self._record_image_interaction(skipped=False)
 
-        self.timer.stop()
-        if hasattr(self, "loader") and self.loader and self.loader.isRunning():
-            self.loader.requestInterruption()
-            self.loader.wait()
-
         # Complete session as finished
         self._finalize_session(status='completed')
 
@@ -511,13 +814,20 @@ class PracticeSessionWindow(QMainWindow):
             f"Great work! You completed {self.images_completed} reference drawings.\n\n"
             "Keep practicing to improve your skills!",
         )
-        self.close()
+        self._leave_session()
 
     def _finalize_session(self, status: str = 'completed'):
         """Finalize the session and emit completion signal."""
+        self._stop_session_activity()
+
         # Calculate total practice time
-        total_seconds = int((datetime.now() - self.session_start_time).total_seconds())
-        total_minutes = total_seconds // 60
+        if self.session_start_time:
+            total_seconds = int((datetime.now() - self.session_start_time).total_seconds())
+            total_minutes = total_seconds // 60
+        else:
+            total_minutes = 0
+
+        self._flush_interactions(wait=True)
 
         # Update session in database
         if self.session_id:
@@ -533,20 +843,77 @@ class PracticeSessionWindow(QMainWindow):
         # Emit signal for main window to update goal progress
         self.session_completed.emit(total_minutes, self.images_completed)
 
+
+class PracticeSessionWindow(_PracticeSessionMixin, QMainWindow):
+    """Full practice session window with image display and timer."""
+
+    # Signal emitted when session completes: (total_minutes, images_completed)
+    session_completed = Signal(int, int)
+
+    def __init__(
+        self,
+        photos: list,
+        duration_seconds: int,
+        play_sound: bool = True,
+        tips: dict = None,
+        theme: str = "",
+        session_id: int = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._init_session_state()
+        self.photos = photos
+        self.duration_seconds = duration_seconds
+        self.play_sound = play_sound
+        self.tips = tips or {}
+        self.theme = theme
+
+        # Session tracking
+        self.session_id = session_id
+        self.session_start_time = datetime.now()
+        self.image_start_time = datetime.now()
+        self.images_completed = 0
+
+        # Create session record if not provided
+        if self.session_id is None:
+            self._create_session_record()
+
+        self.setWindowTitle("Practice Session")
+        self.setMinimumSize(1024, 768)
+
+        self._setup_ui()
+        self._setup_shortcuts()
+        self._start_timer()
+        self._start_prefetcher()
+
+        self._load_current_image()
+
+    def _setup_ui(self):
+        central = QWidget()
+        self.setCentralWidget(central)
+        self._build_session_ui(central)
+
+    def _setup_shortcuts(self):
+        super()._setup_shortcuts()
+        QShortcut(QKeySequence(Qt.Key_Escape), self, self._end_session)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and hasattr(self, "timer"):
+            self.timer.setInterval(
+                IDLE_TICK_INTERVAL_MS if self.isMinimized() else TICK_INTERVAL_MS
+            )
+
     def closeEvent(self, event):
-        # Stop timer first
-        if hasattr(self, "timer"):
-            self.timer.stop()
+        self._stop_session_activity()
 
-        # Stop any running image loader with timeout
-        if hasattr(self, "loader") and self.loader and self.loader.isRunning():
-            self.loader.requestInterruption()
-            self.loader.wait(5000)  # 5 second timeout to prevent infinite wait
+        # Closed without ending the session: keep what was recorded
+        self._flush_interactions(wait=True)
 
         super().closeEvent(event)
 
 
-class EmbeddedPracticeWidget(QWidget):
+class EmbeddedPracticeWidget(_PracticeSessionMixin, QWidget):
     """
     Practice session widget that can be embedded in MainWindow.
     Similar to PracticeSessionWindow but as a widget, not a separate window.
@@ -557,15 +924,13 @@ class EmbeddedPracticeWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._init_session_state()
         self.photos = []
         self.duration_seconds = 60
         self.play_sound = True
         self.tips = {}
         self.theme = ""
-
-        self.current_index = 0
         self.time_remaining = 60
-        self.is_paused = False
 
         # Session tracking
         self.session_id = None
@@ -577,133 +942,23 @@ class EmbeddedPracticeWidget(QWidget):
         self._setup_shortcuts()
 
     def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        # Image container
-        self.image_container = QWidget()
-        self.image_container.setStyleSheet("background-color: #1a1a1a;")
-        image_layout = QVBoxLayout(self.image_container)
-
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("background-color: #1a1a1a;")
+        self._build_session_ui(self)
         self.image_label.setText("Ready to start practice session")
-        image_layout.addWidget(self.image_label, 1)
-
-        layout.addWidget(self.image_container, 1)
 
-        # Overlay for timer and controls
-        self.overlay = QWidget(self.image_container)
-        self.overlay.setAttribute(Qt.WA_TranslucentBackground)
-        overlay_layout = QVBoxLayout(self.overlay)
-        overlay_layout.setContentsMargins(20, 20, 20, 20)
-
-        # Top bar with counter and timer
-        top_bar = QHBoxLayout()
-
-        self.counter_label = QLabel()
-        self.counter_label.setStyleSheet(
-            "color: white; background-color: rgba(0,0,0,0.5); "
-            "padding: 5px 15px; border-radius: 5px; font-size: 18px;"
-        )
-        top_bar.addWidget(self.counter_label)
-
-        top_bar.addStretch()
-
-        self.timer_widget = TimerWidget()
-        self.timer_widget.setFixedSize(200, 100)
-        top_bar.addWidget(self.timer_widget)
-
-        overlay_layout.addLayout(top_bar)
-        overlay_layout.addStretch()
-
-        # Controls
-        controls = QFrame()
-        controls.setStyleSheet(
-            "background-color: rgba(0, 0, 0, 0.7); border-radius: 10px;"
-        )
-        controls_layout = QHBoxLayout(controls)
-
-        self.prev_btn = QPushButton("Previous")
-        self.prev_btn.clicked.connect(self._prev_image)
-        self.prev_btn.setStyleSheet(self._button_style())
-        controls_layout.addWidget(self.prev_btn)
-
-        self.pause_btn = QPushButton("Pause")
-        self.pause_btn.clicked.connect(self._toggle_pause)
-        self.pause_btn.setStyleSheet(self._button_style())
-        controls_layout.addWidget(self.pause_btn)
-
-        self.next_btn = QPushButton("Skip")
-        self.next_btn.clicked.connect(self._next_image)
-        self.next_btn.setStyleSheet(self._button_style())
-        controls_layout.addWidget(self.next_btn)
-
-        controls_layout.addStretch()
-
-        # Feedback buttons
-        self.like_btn = QPushButton("Good Reference")
-        self.like_btn.clicked.connect(self._on_positive_feedback)
-        self.like_btn.setStyleSheet(self._button_style("#2196F3"))
-        controls_layout.addWidget(self.like_btn)
-
-        self.dislike_btn = QPushButton("Not Helpful")
-        self.dislike_btn.clicked.connect(self._on_negative_feedback)
-        self.dislike_btn.setStyleSheet(self._button_style("#ff9800"))
-        controls_layout.addWidget(self.dislike_btn)
-
-        controls_layout.addStretch()
-
-        self.end_btn = QPushButton("End Session")
-        self.end_btn.clicked.connect(self._end_session)
-        self.end_btn.setStyleSheet(self._button_style("#f44336"))
-        controls_layout.addWidget(self.end_btn)
-
-        overlay_layout.addWidget(controls)
-
-        # Credit label
-        credit_frame = QFrame()
-        credit_frame.setStyleSheet(
-            "background-color: rgba(0, 0, 0, 0.5); border-radius: 5px;"
-        )
-        credit_layout = QHBoxLayout(credit_frame)
-        credit_layout.setContentsMargins(10, 5, 10, 5)
-
-        self.credit_label = QLabel()
-        self.credit_label.setStyleSheet("color: white; font-size: 14px;")
-        credit_layout.addWidget(self.credit_label)
-
-        overlay_layout.addWidget(credit_frame)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        if hasattr(self, "overlay"):
-            self.overlay.setGeometry(0, 0, self.width(), self.height())
-        self._scale_current_image()
+    def _leave_session(self):
+        # Stay open; the main window swaps back to the chat view
+        self.session_ended.emit()
 
-    def _button_style(self, color: str = "#4CAF50") -> str:
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 5px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {color}dd;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}aa;
-            }}
-        """
+    def showEvent(self, event):
+        super().showEvent(event)
+        if hasattr(self, "timer"):
+            self.timer.setInterval(TICK_INTERVAL_MS)
 
-    def _setup_shortcuts(self):
-        QShortcut(QKeySequence(Qt.Key_Space), self, self._toggle_pause)
-        QShortcut(QKeySequence(Qt.Key_Right), self, self._next_image)
-        QShortcut(QKeySequence(Qt.Key_Left), self, self._prev_image)
+    def hideEvent(self, event):
+        # Also sent when the containing window is minimized
+        super().hideEvent(event)
+        if hasattr(self, "timer"):
+            self.timer.setInterval(IDLE_TICK_INTERVAL_MS)
 
     def start_session(self, photos: list, duration_seconds: int, play_sound: bool, tips: dict, theme: str):
         """Start a new practice session."""
@@ -714,9 +969,9 @@ class EmbeddedPracticeWidget(QWidget):
         self.theme = theme
 
         self.current_index = 0
-        self.time_remaining = duration_seconds
         self.is_paused = False
         self.images_completed = 0
+        self._pending_interactions = []
 
         self.session_start_time = datetime.now()
         self.image_start_time = datetime.now()
@@ -724,221 +979,8 @@ class EmbeddedPracticeWidget(QWidget):
         # Create session record
         self._create_session_record()
 
-        # Start timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.timer.start(1000)
+        self._start_prefetcher()
+        self._start_timer()
 
         # Load first image
         self._load_current_image()
-
-    def _create_session_record(self):
-        """Create a session record in the database."""
-        try:
-            self.session_id = session_store.create_session(
-                theme=self.theme or "general",
-                duration_per_image=self.duration_seconds,
-                total_images=len(self.photos)
-            )
-            for i, photo in enumerate(self.photos):
-                pexels_id = photo.get('id') or photo.get('pexels_id')
-                if pexels_id:
-                    session_store.add_session_image(self.session_id, pexels_id, i)
-        except Exception as e:
-            print(f"[SESSION] Failed to create session record: {e}")
-            self.session_id = None
-
-    def _tick(self):
-        if self.is_paused:
-            return
-
-        self.time_remaining -= 1
-        self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
-
-        if self.time_remaining <= 0:
-            self._on_timer_end()
-
-    def _on_timer_end(self):
-        if self.current_index < len(self.photos) - 1:
-            self._next_image()
-        else:
-            self._session_complete()
-
-    def _load_current_image(self):
-        if self.current_index >= len(self.photos):
-            return
-
-        photo = self.photos[self.current_index]
-        self.counter_label.setText(
-            f"Image {self.current_index + 1} of {len(self.photos)}"
-        )
-
-        photographer = photo.get("photographer", "Unknown")
-        source = photo.get("source", "Pexels")
-        if "Pinterest" in source:
-            self.credit_label.setText(f"Photo by {photographer} on Pinterest")
-        else:
-            self.credit_label.setText(f"Photo by {photographer} on Pexels")
-
-        url = photo.get("url")
-        if url:
-            self.image_label.setText("Loading...")
-            if hasattr(self, "loader") and self.loader and self.loader.isRunning():
-                self.loader.requestInterruption()
-                self.loader.wait()
-            self.loader = ImageLoader(url)
-            self.loader.image_loaded.connect(self._on_image_loaded)
-            self.loader.error.connect(self._on_image_error)
-            self.loader.start()
-
-    def _on_image_loaded(self, image: QImage):
-        self.current_pixmap = QPixmap.fromImage(image)
-        self._scale_current_image()
-
-    def _scale_current_image(self):
-        if not hasattr(self, "current_pixmap") or self.current_pixmap.isNull():
-            return
-
-        available_size = self.image_label.size()
-        scaled = self.current_pixmap.scaled(
-            available_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        self.image_label.setPixmap(scaled)
-
-    def _on_image_error(self, error: str):
-        self.image_label.setText(f"Failed to load image: {error}")
-
-    def _next_image(self, skipped: bool = False):
-        self._record_image_interaction(skipped=skipped)
-
-        if self.current_index < len(self.photos) - 1:
-            self.current_index += 1
-            self.time_remaining = self.duration_seconds
-            self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
-            self.image_start_time = datetime.now()
-            self._load_current_image()
-        else:
-            self._session_complete()
-
-    def _prev_image(self):
-        if self.current_index > 0:
-            self.current_index -= 1
-            self.time_remaining = self.duration_seconds
-            self.timer_widget.set_time(self.time_remaining, self.duration_seconds)
-            self.image_start_time = datetime.now()
-            self._load_current_image()
-
-    def _toggle_pause(self):
-        self.is_paused = not self.is_paused
-        self.pause_btn.setText("Resume" if self.is_paused else "Pause")
-
-    def _record_image_interaction(self, skipped: bool = False):
-        if self.session_id is None:
-            return
-
-        photo = self.photos[self.current_index]
-        pexels_id = photo.get('id') or photo.get('pexels_id')
-        if not pexels_id:
-            return
-
-        time_spent = int((datetime.now() - self.image_start_time).total_seconds())
-
-        try:
-            session_store.record_image_interaction(
-                session_id=self.session_id,
-                pexels_id=pexels_id,
-                time_spent=time_spent,
-                skipped=skipped
-            )
-            memory_store.update_image_usage(pexels_id)
-            self.images_completed += 1
-        except Exception as e:
-            print(f"[SESSION] Failed to record interaction: {e}")
-
-    def _on_positive_feedback(self):
-        photo = self.photos[self.current_index]
-        pexels_id = photo.get('id') or photo.get('pexels_id')
-
-        if pexels_id and self.theme:
-            try:
-                image_scorer.record_positive_feedback(pexels_id, self.theme)
-                self._show_feedback_toast("Noted as good reference!")
-            except Exception as e:
-                print(f"[FEEDBACK] Error recording positive: {e}")
-
-    def _on_negative_feedback(self):
-        photo = self.photos[self.current_index]
-        pexels_id = photo.get('id') or photo.get('pexels_id')
-
-        if pexels_id and self.theme:
-            try:
-                image_scorer.record_negative_feedback(pexels_id, self.theme)
-                self._show_feedback_toast("Will show less often")
-                self._next_image(skipped=True)
-            except Exception as e:
-                print(f"[FEEDBACK] Error recording negative: {e}")
-
-    def _show_feedback_toast(self, message: str):
-        original_text = self.credit_label.text()
-        self.credit_label.setText(f"✓ {message}")
-        self.credit_label.setStyleSheet("color: #81C784; font-size: 14px;")
-        QTimer.singleShot(2000, lambda: self._restore_credit_label(original_text))
-
-    def _restore_credit_label(self, text: str):
-        self.credit_label.setText(text)
-        self.credit_label.setStyleSheet("color: white; font-size: 14px;")
-
-    def _end_session(self):
-        reply = QMessageBox.question(
-            self,
-            "End Session",
-            "Are you sure you want to end the practice session?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
-        )
-        if reply == QMessageBox.Yes:
-            self._finalize_session(status='abandoned')
-            self.session_ended.emit()
-
-    def _session_complete(self):
-        self._record_image_interaction(skipped=False)
-        self._finalize_session(status='completed')
-
-        QMessageBox.information(
-            self,
-            "Session Complete",
-            f"Great work! You completed {self.images_completed} reference drawings.\n\n"
-            "Keep practicing to improve your skills!",
-        )
-        self.session_ended.emit()
-
-    def _finalize_session(self, status: str = 'completed'):
-        """Finalize the session and emit completion signal."""
-        # Stop timer
-        if hasattr(self, "timer"):
-            self.timer.stop()
-
-        # Stop image loader
-        if hasattr(self, "loader") and self.loader and self.loader.isRunning():
-            self.loader.requestInterruption()
-            self.loader.wait()
-
-        # Calculate total practice time
-        if self.session_start_time:
-            total_seconds = int((datetime.now() - self.session_start_time).total_seconds())
-            total_minutes = total_seconds // 60
-        else:
-            total_minutes = 0
-
-        # Update session in database
-        if self.session_id:
-            try:
-                session_store.complete_session(
-                    session_id=self.session_id,
-                    images_completed=self.images_completed,
-                    status=status
-                )
-            except Exception as e:
-                print(f"[SESSION] Failed to finalize session: {e}")
-
-        self.session_completed.emit(total_minutes, self.images_completed)
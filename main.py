@@ -6,6 +6,7 @@ A desktop application that helps artists practice with timed reference photos.
 Uses Agno framework for AI-powered assistance and Pexels API for reference images.
 """
 
+import logging
 import sys
 from pathlib import Path
 
@@ -18,6 +19,12 @@ from gui.main_window import MainWindow
 import config
 
 
+def configure_logging():
+    """Apply LOG_LEVEL to the app's loggers (LOG_LEVEL=DEBUG for per-call tracing)."""
+    for name in ("tr.subagents", "tr.gui", "agent_hooks", "Pinterest"):
+        logging.getLogger(name).setLevel(config.LOG_LEVEL)
+
+
 def check_api_keys():
     """Check if required API keys are configured."""
     missing = []
@@ -42,6 +49,7 @@ def check_api_keys():
 
 def main():
     """Main entry point."""
+    configure_logging()
     check_api_keys()
 
     # Note: HiDPI scaling is enabled by default in Qt6
@@ -37,12 +37,12 @@ if env_path.exists():
     print(f"[Pinterest MCP] Loaded .env from: {env_path}", file=sys.stderr)
 else:
     print(f"[Pinterest MCP] Warning: .env not found at {env_path}", file=sys.stderr)
+# Tell config the .env is already handled, so it doesn't parse it again
+os.environ["_DOTENV_LOADED"] = "1"
 
-# Now import config (it will use the loaded env vars)
+# Now import config (it will use the loaded env vars). This is its first
+# import in the server process, so no reload is needed.
 import config
-# Force reload config values from env in case they were cached
-import importlib
-importlib.reload(config)
 
 # Debug: Print credential status (not the actual values!)
 print(f"[Pinterest MCP] PINTEREST_EMAIL configured: {bool(config.PINTEREST_EMAIL)}", file=sys.stderr)
@@ -0,0 +1,48 @@
+"""
+Shared async HTTP connection pool for image downloads.
+
+An httpx.AsyncClient is bound to the event loop it was first used on, so
+one client is kept per loop. Downloads run on the long-lived background
+loop from services.mcp_client, whose client (and its keep-alive
+connections) is therefore reused across tool calls instead of paying TCP
+and TLS handshakes again for every batch. HTTP/2 is used when the `h2`
+package is installed.
+"""
+
+import asyncio
+import weakref
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=32, max_keepalive_connections=20, keepalive_expiry=30.0
+            ),
+        )
+    return client
+
+
+async def close_async_client():
+    """Close the running loop's shared client (if any)."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
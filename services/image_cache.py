@@ -1,9 +1,16 @@
 import os
+import asyncio
 import hashlib
+import threading
+from concurrent.futures import Future
 import httpx
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Iterable
 import config
+from services._http import get_async_client
+
+# Concurrent background downloads started by prefetch()
+PREFETCH_CONCURRENCY = 8
 
 
 class ImageCache:
@@ -11,11 +18,19 @@ class ImageCache:
         self.cache_dir = Path(cache_dir or config.CACHE_DIR)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._client: Optional[httpx.Client] = None
+        # The session viewer downloads from several pool threads at once
+        self._client_lock = threading.Lock()
+        # url -> in-flight prefetch() download
+        self._pending: dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._prefetch_slots = asyncio.Semaphore(PREFETCH_CONCURRENCY)
 
     @property
     def client(self) -> httpx.Client:
         if self._client is None:
-            self._client = httpx.Client(timeout=60.0)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=60.0)
         return self._client
 
     def _get_cache_path(self, url: str) -> Path:
@@ -50,6 +65,15 @@ class ImageCache:
         if cache_path.exists():
             return cache_path
 
+        # Already being fetched by prefetch(): wait for it instead of
+        # issuing a second GET
+        pending = self._pending.get(url)
+        if pending is not None:
+            try:
+                return pending.result(timeout=60.0)
+            except Exception:
+                pass  # Retry below with a direct request
+
         response = self.client.get(url)
         response.raise_for_status()
 
@@ -58,6 +82,45 @@ class ImageCache:
 
         return cache_path
 
+    def prefetch(self, urls: Iterable[str]):
+        """Start downloading images in the background, without waiting.
+
+        Downloads run on the shared background event loop through its
+        keep-alive connection pool, several at a time, so a session's
+        images are usually on disk before the viewer asks for them.
+        download() waits for an in-flight prefetch of the same URL.
+        """
+        # Imported here so thumbnail-only users don't load the MCP client
+        from services.mcp_client import get_event_loop
+
+        loop = get_event_loop()
+        with self._pending_lock:
+            for url in urls:
+                if not url or not url.startswith(('http://', 'https://')):
+                    continue
+                if url in self._pending or self._get_cache_path(url).exists():
+                    continue
+                future = asyncio.run_coroutine_threadsafe(self._download_async(url), loop)
+                self._pending[url] = future
+                future.add_done_callback(lambda _, url=url: self._pending.pop(url, None))
+
+    async def _download_async(self, url: str) -> Path:
+        async with self._prefetch_slots:
+            cache_path = self._get_cache_path(url)
+            if cache_path.exists():
+                return cache_path
+            response = await get_async_client().get(url)
+            response.raise_for_status()
+            await asyncio.to_thread(self._write_atomic, cache_path, response.content)
+            return cache_path
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write via a temp file so readers never see a partial image."""
+        tmp_path = path.with_name(path.name + ".part")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
     def download_all(self, urls: list[str]) -> list[Path]:
         """Download multiple images and return their local paths."""
         paths = []
@@ -11,6 +11,64 @@ from pathlib import Path
 from typing import Optional
 import httpx
 
+from services._http import get_async_client
+
+
+# Max image downloads in flight per batch
+MAX_CONCURRENT_DOWNLOADS = 16
+
+
+class DownloadBatch:
+    """
+    Concurrent downloads over the shared connection pool (services._http).
+
+    URLs can be submitted as they become available (e.g. per search
+    query), so downloading overlaps with whatever produces the URLs.
+
+    Usage:
+        async with downloader.batch() as batch:
+            for url in urls:
+                batch.submit(url)
+            paths = await batch.results()
+    """
+
+    def __init__(
+        self,
+        downloader: "ImageDownloader",
+        force_refresh: bool = False,
+        max_concurrency: int = MAX_CONCURRENT_DOWNLOADS,
+    ):
+        self.downloader = downloader
+        self.force_refresh = force_refresh
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def __aenter__(self):
+        self._client = get_async_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Don't leave downloads running past the batch
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _download(self, url: str) -> Optional[Path]:
+        async with self._semaphore:
+            return await self.downloader.download_image(url, self.force_refresh, self._client)
+
+    def submit(self, url: str) -> asyncio.Task:
+        """Start downloading url; results() returns paths in submission order."""
+        task = asyncio.create_task(self._download(url))
+        self._tasks.append(task)
+        return task
+
+    async def results(self) -> list[Optional[Path]]:
+        """Wait for every submitted download (None for failures)."""
+        return list(await asyncio.gather(*self._tasks))
+
 
 class ImageDownloader:
     """Downloads and caches images from URLs."""
@@ -52,7 +110,8 @@ class ImageDownloader:
     async def download_image(
         self,
         url: str,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        client: Optional[httpx.AsyncClient] = None
     ) -> Optional[Path]:
         """
         Download an image from a URL and cache it locally.
@@ -60,6 +119,7 @@ class ImageDownloader:
         Args:
             url: Image URL to download
             force_refresh: If True, re-download even if cached
+            client: HTTP client to use; defaults to the loop's shared client
 
         Returns:
             Path to the downloaded image file, or None if download failed
@@ -74,15 +134,15 @@ class ImageDownloader:
         print(f"[Image Downloader] Downloading: {url}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, follow_redirects=True)
-                response.raise_for_status()
+            client = client or get_async_client()
+            response = await client.get(url, follow_redirects=True)
+            response.raise_for_status()
 
-                # Write image data to cache
-                cache_path.write_bytes(response.content)
+            # Write image data to cache
+            cache_path.write_bytes(response.content)
 
-                print(f"[Image Downloader] Saved to: {cache_path.name}")
-                return cache_path
+            print(f"[Image Downloader] Saved to: {cache_path.name}")
+            return cache_path
 
         except Exception as e:
             print(f"[Image Downloader] Download failed: {e}")
@@ -94,7 +154,7 @@ class ImageDownloader:
         force_refresh: bool = False
     ) -> list[Optional[Path]]:
         """
-        Download multiple images concurrently.
+        Download multiple images concurrently over one connection pool.
 
         Args:
             urls: List of image URLs
@@ -103,11 +163,14 @@ class ImageDownloader:
         Returns:
             List of Paths (or None for failed downloads)
         """
-        tasks = [
-            self.download_image(url, force_refresh)
-            for url in urls
-        ]
-        return await asyncio.gather(*tasks)
+        async with self.batch(force_refresh) as batch:
+            for url in urls:
+                batch.submit(url)
+            return await batch.results()
+
+    def batch(self, force_refresh: bool = False) -> DownloadBatch:
+        """Start a DownloadBatch for submitting URLs incrementally."""
+        return DownloadBatch(self, force_refresh)
 
     def get_cached_path(self, url: str) -> Optional[Path]:
         """
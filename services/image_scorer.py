@@ -5,6 +5,7 @@ Handles image scoring based on user feedback, tracks usage,
 and provides weighted random selection considering scores and freshness.
 """
 
+import heapq
 import random
 import sqlite3
 from datetime import datetime
@@ -190,17 +191,15 @@ class ImageScorer:
         exclude_ids = exclude_ids or set()
         theme_lower = theme.lower().strip()
 
-        # Filter out excluded images
-        candidates = [
-            img for img in available
-            if img.get('pexels_id', img.get('id')) not in exclude_ids
-        ]
+        # Column view of the candidates: each field is read from the dicts
+        # once, and the weighting/selection below works on indices
+        ids = [img.get('pexels_id', img.get('id')) for img in available]
+        rows = [i for i, pexels_id in enumerate(ids) if pexels_id not in exclude_ids]
 
-        if not candidates:
+        if not rows:
             return []
 
-        # Get scores for all candidates
-        pexels_ids = [img.get('pexels_id', img.get('id')) for img in candidates]
+        pexels_ids = [ids[i] for i in rows]
 
         cursor = self.conn.cursor()
         # SQLite doesn't have ANY(), so we use IN with placeholders
@@ -210,58 +209,35 @@ class ImageScorer:
             FROM image_theme_scores
             WHERE pexels_id IN ({placeholders}) AND theme = ?
         """, (*pexels_ids, theme_lower))
-        score_map = {row['pexels_id']: dict(row) for row in cursor.fetchall()}
+        score_map = {row['pexels_id']: (row['score'], row['times_shown']) for row in cursor.fetchall()}
 
         # Calculate weights
         weights = []
-        for img in candidates:
-            pexels_id = img.get('pexels_id', img.get('id'))
-            stats = score_map.get(pexels_id, {"score": 1.0, "times_shown": 0})
+        for i, pexels_id in zip(rows, pexels_ids):
+            score, times_shown = score_map.get(pexels_id, (1.0, 0))
 
-            weight = stats["score"]
+            weight = score
 
             # Add freshness bonus for unused images
-            if stats["times_shown"] == 0:
+            if times_shown == 0:
                 weight += FRESHNESS_BONUS
 
             # Check if image has usage data from curated_images
-            times_used = img.get('times_used', 0)
-            if times_used == 0:
+            if available[i].get('times_used', 0) == 0:
                 weight += FRESHNESS_BONUS
 
             weights.append(max(MIN_SCORE, weight))
 
-        # Weighted random selection without replacement
-        selected = []
-        remaining_candidates = list(candidates)
-        remaining_weights = list(weights)
-
-        select_count = min(count, len(remaining_candidates))
-        for _ in range(select_count):
-            if not remaining_candidates:
-                break
-
-            # Normalize weights
-            total_weight = sum(remaining_weights)
-            if total_weight <= 0:
-                # Fallback to uniform random
-                idx = random.randint(0, len(remaining_candidates) - 1)
-            else:
-                # Weighted random choice
-                r = random.uniform(0, total_weight)
-                cumulative = 0
-                idx = 0
-                for i, w in enumerate(remaining_weights):
-                    cumulative += w
-                    if r <= cumulative:
-                        idx = i
-                        break
-
-            selected.append(remaining_candidates[idx])
-            remaining_candidates.pop(idx)
-            remaining_weights.pop(idx)
-
-        return selected
+        # Weighted random selection without replacement (Efraimidis-Spirakis):
+        # drawing key u^(1/w) per image and keeping the largest keys selects
+        # with the same probabilities as repeated weighted draws, in one pass
+        # instead of re-summing the remaining weights for every pick
+        select_count = min(count, len(rows))
+        keyed = [
+            (random.random() ** (1.0 / weight), row)
+            for row, weight in zip(rows, weights)
+        ]
+        return [available[row] for _, row in heapq.nlargest(select_count, keyed)]
 
     def get_low_scored_images(self, theme: str, threshold: float = 0.5) -> list[int]:
         """Get pexels_ids with scores below threshold for a theme."""
@@ -8,12 +8,27 @@ Educational example showing how AI agents can integrate with MCP.
 """
 
 import asyncio
-import json
-from typing import Any, Optional
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
 from contextlib import AsyncExitStack
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+import config
+from services._http import close_async_client
+from utils.json_extract import json_loads
+
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:  # Not installed, or Windows
+    _new_event_loop = asyncio.new_event_loop
+
 
 class MCPClient:
     """
@@ -121,10 +136,10 @@ class MCPClient:
                 if hasattr(content, 'text'):
                     text_content += content.text
 
-            # Try to parse as JSON
+            # Try to parse as JSON (orjson when installed)
             try:
-                return json.loads(text_content)
-            except json.JSONDecodeError:
+                return json_loads(text_content)
+            except ValueError:
                 return text_content
 
         return None
@@ -246,6 +261,61 @@ class PinterestMCPClient:
 
         return result.get("images", []) if isinstance(result, dict) else []
 
+    async def search_many(
+        self,
+        queries: list[str],
+        limit: int = 5,
+        max_concurrent: int = 8
+    ) -> list[list[dict]]:
+        """
+        Search several queries concurrently over the one MCP session.
+
+        Args:
+            queries: List of search terms
+            limit: Number of results per query
+            max_concurrent: Max searches in flight at once
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _search(query: str) -> list[dict]:
+            async with semaphore:
+                return await self.search(query, limit)
+
+        return list(await asyncio.gather(*(_search(q) for q in queries)))
+
+    async def stream_diverse(
+        self,
+        queries: list[str],
+        images_per_query: int = 5
+    ) -> AsyncIterator[dict]:
+        """
+        Search each query in turn, yielding new images as each query returns.
+
+        Same results as search_diverse(), but callers can start using the
+        first query's images (e.g. downloading them) while later queries
+        are still being searched.
+
+        Args:
+            queries: List of search terms
+            images_per_query: Images per query
+
+        Yields:
+            Image dictionaries, skipping ids already yielded
+        """
+        seen_ids = set()
+        for query in queries:
+            for image in await self.search(query, images_per_query):
+                if image["id"] in seen_ids:
+                    continue
+                seen_ids.add(image["id"])
+                yield image
+
     async def save_pins_to_board(
         self,
         board_name: str,
@@ -293,37 +363,189 @@ class PinterestMCPClient:
 
 
 # Convenience functions for synchronous usage
+#
+# Sync callers run their coroutines on one background event loop that lives
+# for the whole process. Connections made on it (and the MCP server
+# subprocess behind a shared client) survive between calls instead of being
+# torn down with a per-call loop. The loop is a uvloop loop when available.
 _event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_loop_lock = threading.Lock()
 
 
 def get_event_loop() -> asyncio.AbstractEventLoop:
-    """Get or create event loop for sync contexts."""
+    """Get the background event loop, starting its thread on first use."""
     global _event_loop
-    if _event_loop is None or _event_loop.is_closed():
-        try:
-            _event_loop = asyncio.get_event_loop()
-        except RuntimeError:
-            _event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(_event_loop)
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = _new_event_loop()
+            threading.Thread(
+                target=_event_loop.run_forever, name="mcp-event-loop", daemon=True
+            ).start()
     return _event_loop
 
 
+def run_sync(coro, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the background loop and wait for its result.
+
+    Must not be called from the background loop itself.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result(timeout)
+
+
+class _SharedClient:
+    """A PinterestMCPClient kept connected by a task on the background loop."""
+
+    def __init__(self, server_path: str):
+        loop = asyncio.get_running_loop()
+        self.ready: asyncio.Future = loop.create_future()
+        self.stop = asyncio.Event()
+        # The stdio transport must be opened and closed by the same task
+        self.task = loop.create_task(self._hold(server_path))
+
+    async def _hold(self, server_path: str):
+        client = PinterestMCPClient(server_path)
+        try:
+            await client.initialize()
+            self.ready.set_result(client)
+            await self.stop.wait()
+        except Exception as e:
+            if not self.ready.done():
+                self.ready.set_exception(e)
+        finally:
+            await client.close()
+
+
+_shared_clients: dict[str, _SharedClient] = {}
+
+
+async def get_pinterest_client(server_path: str) -> PinterestMCPClient:
+    """
+    Get a connected Pinterest client that is reused across calls.
+
+    Only call this from coroutines running on the background loop (via
+    run_sync). Use reset_pinterest_client() after a failed call so the next
+    one reconnects.
+
+    Args:
+        server_path: Path to the Pinterest MCP server script
+
+    Returns:
+        Connected PinterestMCPClient
+    """
+    shared = _shared_clients.get(server_path)
+    if shared is None or shared.task.done():
+        shared = _shared_clients[server_path] = _SharedClient(server_path)
+    try:
+        return await asyncio.shield(shared.ready)
+    except Exception:
+        _shared_clients.pop(server_path, None)
+        raise
+
+
+async def reset_pinterest_client(server_path: str):
+    """Disconnect the shared client for server_path (if any)."""
+    shared = _shared_clients.pop(server_path, None)
+    if shared is not None:
+        shared.stop.set()
+        await asyncio.gather(shared.task, return_exceptions=True)
+
+
+async def _close_shared_clients():
+    for server_path in list(_shared_clients):
+        await reset_pinterest_client(server_path)
+    # Downloads made on this loop share its HTTP pool
+    await close_async_client()
+
+
+@atexit.register
+def _shutdown_event_loop():
+    """Close shared MCP sessions (stopping their server processes) at exit."""
+    if _event_loop is None or not _event_loop.is_running():
+        return
+    try:
+        run_sync(_close_shared_clients(), timeout=5)
+    except Exception:
+        pass
+    _event_loop.call_soon_threadsafe(_event_loop.stop)
+
+
+# Server used by the sync wrappers when no server_path is given
+DEFAULT_SERVER_PATH = str(Path(__file__).parent.parent / "mcp_servers" / "pinterest_server.py")
+
+# Recent search results, so repeated (query, limit) calls from the agent
+# skip the MCP round trip. Enabled by config.CACHE_AGENT_RESPONSES.
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_MAX_ITEMS = 512
+
+# casefolded query -> (expires, limit searched, images)
+_search_cache: OrderedDict[str, tuple[float, int, tuple[dict, ...]]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _get_cached_search(query_key: str, limit: int) -> Optional[list[dict]]:
+    """Return up to `limit` cached images for the query, or None on a miss."""
+    with _search_cache_lock:
+        entry = _search_cache.get(query_key)
+        if entry is None:
+            return None
+        expires, cached_limit, images = entry
+        if expires <= time.time():
+            del _search_cache[query_key]
+            return None
+        # A search for fewer images can't answer a larger request
+        if limit > cached_limit:
+            return None
+        _search_cache.move_to_end(query_key)
+    # Copies, so callers can't alter the cached pins
+    return [dict(image) for image in images[:limit]]
+
+
+def _cache_search(query_key: str, limit: int, images: list[dict]):
+    """Remember a search result, evicting the least recently used entry if full."""
+    with _search_cache_lock:
+        _search_cache[query_key] = (
+            time.time() + SEARCH_CACHE_TTL, limit, tuple(dict(image) for image in images)
+        )
+        _search_cache.move_to_end(query_key)
+        if len(_search_cache) > SEARCH_CACHE_MAX_ITEMS:
+            _search_cache.popitem(last=False)
+
+
+def clear_search_cache():
+    """Drop all cached Pinterest search results."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
 def search_pinterest_sync(query: str, limit: int = 10, server_path: str = None) -> list[dict]:
     """
     Synchronous wrapper for Pinterest search.
 
-    Use this in synchronous contexts like Agno tools.
+    Use this in synchronous contexts like Agno tools. Results are cached
+    for SEARCH_CACHE_TTL seconds when config.CACHE_AGENT_RESPONSES is on.
     """
+    query_key = query.strip().casefold()
+    if config.CACHE_AGENT_RESPONSES:
+        cached = _get_cached_search(query_key, limit)
+        if cached is not None:
+            return cached
+
     if server_path is None:
-        from pathlib import Path
-        server_path = str(Path(__file__).parent.parent / "mcp_servers" / "pinterest_server.py")
+        server_path = DEFAULT_SERVER_PATH
 
     async def _search():
-        async with PinterestMCPClient(server_path) as client:
+        client = await get_pinterest_client(server_path)
+        try:
             return await client.search(query, limit)
+        except Exception:
+            await reset_pinterest_client(server_path)
+            raise
 
-    loop = get_event_loop()
-    return loop.run_until_complete(_search())
+    images = run_sync(_search())
+    if config.CACHE_AGENT_RESPONSES and images:
+        _cache_search(query_key, limit, images)
+    return images
 
 
 def save_pins_to_board_sync(
@@ -345,12 +567,14 @@ def save_pins_to_board_sync(
         Dictionary with result status and details
     """
     if server_path is None:
-        from pathlib import Path
-        server_path = str(Path(__file__).parent.parent / "mcp_servers" / "pinterest_server.py")
+        server_path = DEFAULT_SERVER_PATH
 
     async def _save():
-        async with PinterestMCPClient(server_path) as client:
+        client = await get_pinterest_client(server_path)
+        try:
             return await client.save_pins_to_board(board_name, pin_ids, description)
+        except Exception:
+            await reset_pinterest_client(server_path)
+            raise
 
-    loop = get_event_loop()
-    return loop.run_until_complete(_save())
+    return run_sync(_save())
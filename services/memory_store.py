@@ -158,6 +158,7 @@ class MemoryStore:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_theme_images_theme ON theme_images(theme)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_session_images_pexels ON session_images(pexels_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_session_images_session ON session_images(session_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_practice_sessions_started ON practice_sessions(started_at)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_progress_date ON daily_progress(date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_image_scores_theme ON image_theme_scores(theme)")
 
@@ -305,6 +306,15 @@ class MemoryStore:
         """, (pexels_id,))
         self.conn.commit()
 
+    def update_images_usage(self, pexels_ids: list[int]):
+        """Like update_image_usage, for several images in one transaction."""
+        with self.conn:
+            self.conn.executemany("""
+                UPDATE curated_images
+                SET times_used = times_used + 1, last_used = CURRENT_TIMESTAMP
+                WHERE pexels_id = ?
+            """, [(pexels_id,) for pexels_id in pexels_ids])
+
     def close(self):
         if self._conn:
             self._conn.close()
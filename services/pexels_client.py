@@ -1,3 +1,5 @@
+import threading
+
 import httpx
 from dataclasses import dataclass
 from typing import Optional
@@ -21,14 +23,18 @@ class PexelsClient:
         self.api_key = api_key or config.PEXELS_API_KEY
         self.base_url = config.PEXELS_BASE_URL
         self._client: Optional[httpx.Client] = None
+        # Searches run from worker threads; build the client only once
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> httpx.Client:
         if self._client is None:
-            self._client = httpx.Client(
-                headers={"Authorization": self.api_key},
-                timeout=30.0,
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        headers={"Authorization": self.api_key},
+                        timeout=30.0,
+                    )
         return self._client
 
     def search_photos(
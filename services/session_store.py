@@ -68,6 +68,24 @@ class SessionStore:
         """, (session_id, pexels_id, position))
         self.conn.commit()
 
+    def add_session_images(
+        self,
+        session_id: int,
+        images: list[tuple[int, int]]
+    ):
+        """
+        Record all images shown in a session in one transaction.
+
+        Args:
+            session_id: The session ID
+            images: (pexels_id, position) pairs
+        """
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO session_images (session_id, pexels_id, position)
+                VALUES (?, ?, ?)
+            """, [(session_id, pexels_id, position) for pexels_id, position in images])
+
     def record_image_interaction(
         self,
         session_id: int,
@@ -92,6 +110,28 @@ class SessionStore:
         """, (time_spent, 1 if skipped else 0, session_id, pexels_id))
         self.conn.commit()
 
+    def record_image_interactions(
+        self,
+        session_id: int,
+        interactions: list[tuple[int, Optional[int], bool]]
+    ):
+        """
+        Update interaction data for several images in one transaction.
+
+        Args:
+            session_id: The session ID
+            interactions: (pexels_id, time_spent, skipped) tuples
+        """
+        with self.conn:
+            self.conn.executemany("""
+                UPDATE session_images
+                SET time_spent = ?, skipped = ?
+                WHERE session_id = ? AND pexels_id = ?
+            """, [
+                (time_spent, 1 if skipped else 0, session_id, pexels_id)
+                for pexels_id, time_spent, skipped in interactions
+            ])
+
     def complete_session(
         self,
         session_id: int,
@@ -139,7 +179,7 @@ class SessionStore:
         """, (session_id,))
         return [dict(row) for row in cursor.fetchall()]
 
-    def get_images_shown_recently(self, days: int = 7) -> set[int]:
+    def get_images_shown_recently(self, days: int = 7) -> frozenset[int]:
         """
         Get pexels_ids of images shown in the last N days.
 
@@ -147,7 +187,7 @@ class SessionStore:
             days: Number of days to look back
 
         Returns:
-            Set of pexels_ids
+            Frozen set of pexels_ids
         """
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
         cursor = self.conn.cursor()
@@ -157,7 +197,7 @@ class SessionStore:
             JOIN practice_sessions ps ON si.session_id = ps.id
             WHERE ps.started_at >= ?
         """, (cutoff,))
-        return {row[0] for row in cursor.fetchall()}
+        return frozenset(row[0] for row in cursor.fetchall())
 
     def get_session_history(self, limit: int = 20) -> list[dict]:
         """
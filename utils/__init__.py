@@ -1,3 +1,4 @@
 from .markdown_renderer import MarkdownRenderer
+from .json_extract import extract_json
 
-__all__ = ["MarkdownRenderer"]
+__all__ = ["MarkdownRenderer", "extract_json"]
@@ -0,0 +1,73 @@
+"""
+JSON Extraction for LLM Responses.
+
+Pulls the JSON payload out of a model reply, with or without a
+```json code fence around it. Uses orjson when installed; json_loads
+exposes the same fast decoder to other modules.
+"""
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+# Body of the first ``` / ```json fence
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+
+
+def extract_json(content: str) -> Any:
+    """
+    Parse the JSON object or array in an LLM response.
+
+    Bare JSON is decoded directly. Otherwise the fenced block (or the whole
+    text when unfenced) is tried, then the outermost [...] / {...} span for
+    replies that wrap the JSON in prose.
+
+    Args:
+        content: Raw model response text
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        ValueError: If no JSON can be decoded (json/orjson decode errors
+            are ValueError subclasses)
+    """
+    # Fast path: models asked for raw JSON usually return exactly that
+    raw = content.strip()
+    if raw[:1] in ("[", "{"):
+        try:
+            return json_loads(raw)
+        except JSONDecodeError:
+            pass
+
+    # Cold path: fenced or prose-wrapped replies
+    match = _CODE_FENCE.search(raw)
+    if match:
+        raw = match.group(1).strip()
+
+    try:
+        return json_loads(raw)
+    except JSONDecodeError:
+        # Try whichever bracket opens first, so an object holding arrays
+        # isn't mistaken for its inner array
+        spans = []
+        for open_char, close_char in ("[]", "{}"):
+            start = raw.find(open_char)
+            end = raw.rfind(close_char) + 1
+            if start >= 0 and end > start:
+                spans.append((start, end))
+        for start, end in sorted(spans):
+            try:
+                return json_loads(raw[start:end])
+            except JSONDecodeError:
+                continue
+        raise